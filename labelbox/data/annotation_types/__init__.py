@@ -11,6 +11,7 @@ from .annotation import ObjectAnnotation
 from .annotation import VideoObjectAnnotation
 
 from .ner import TextEntity
+from .ner import TextEntityIndex
 
 from .classification import Checklist
 from .classification import ClassificationAnswer
@@ -20,14 +21,21 @@ from .classification import Text
 
 from .data import ImageData
 from .data import MaskData
+from .data import RunLengthEncoding
 from .data import TextData
 from .data import VideoData
 
 from .label import Label
 
+from .video_track import VideoObjectTrack
+
 from .collection import LabelList
 from .collection import LabelGenerator
 
+from .label_store import LabelStore
+
+from .signing import SigningCache
+
 from .metrics import ScalarMetric
 from .metrics import ScalarMetricAggregation
 from .metrics import ConfusionMatrixMetric
@@ -7,13 +7,23 @@ from tqdm import tqdm
 
 from labelbox.schema import ontology
 from labelbox.orm.model import Entity
-from ..ontology import get_classifications, get_tools
+from ..ontology import OntologyIndex, get_classifications, get_tools
 from ..generator import PrefetchGenerator
 from .label import Label
+from .signing import SigningCache
 
 logger = logging.getLogger(__name__)
 
 
+def _compile_ontology(
+    ontology_builder: Union["ontology.OntologyBuilder", OntologyIndex]
+) -> OntologyIndex:
+    # Compile once so that the ontology isn't flattened again for every label
+    if isinstance(ontology_builder, OntologyIndex):
+        return ontology_builder
+    return OntologyIndex.from_ontology_builder(ontology_builder)
+
+
 class LabelList:
     """
     A container for interacting with a collection of labels.
@@ -31,7 +41,8 @@ class LabelList:
         self._index = 0
 
     def assign_feature_schema_ids(
-            self, ontology_builder: "ontology.OntologyBuilder") -> "LabelList":
+        self, ontology_builder: Union["ontology.OntologyBuilder", OntologyIndex]
+    ) -> "LabelList":
         """
         Adds schema ids to all FeatureSchema objects in the Labels.
         This is necessary for MAL.
@@ -41,8 +52,9 @@ class LabelList:
         Returns:
             LabelList. useful for chaining these modifying functions
         """
+        ontology_index = _compile_ontology(ontology_builder)
         for label in self._data:
-            label.assign_feature_schema_ids(ontology_builder)
+            label.assign_feature_schema_ids(ontology_index)
         return self
 
     def add_to_dataset(self,
@@ -79,22 +91,31 @@ class LabelList:
             label.data.uid = data_row_lookup[label.data.external_id]
         return self
 
-    def add_url_to_masks(self, signer, max_concurrency=20) -> "LabelList":
+    def add_url_to_masks(
+            self,
+            signer,
+            max_concurrency=20,
+            signing_cache: Optional[SigningCache] = None) -> "LabelList":
         """
         Creates signed urls for all masks in the LabelList.
         Multiple masks objects can reference the same MaskData so this makes sure we only upload that url once.
+        Masks with identical content are also only uploaded once, even across labels.
         Only uploads url if one doesn't already exist.
 
         Args:
             signer: A function that accepts bytes and returns a signed url.
             max_concurrency: how many threads to use for uploading.
                 Should be balanced to match the signing services capabilities.
+            signing_cache: Cache of urls keyed by mask content.
+                Defaults to a new in memory cache shared by all labels in this LabelList.
         Returns:
             LabelList with updated references to the new mask urls
         """
+        if signing_cache is None:
+            signing_cache = SigningCache()
         for row in self._apply_threaded(
             [label.add_url_to_masks for label in self._data], max_concurrency,
-                signer):
+                signer, signing_cache):
             ...
         return self
 
@@ -185,11 +206,12 @@ class LabelGenerator(PrefetchGenerator):
         return LabelList(data=list(self))
 
     def assign_feature_schema_ids(
-            self,
-            ontology_builder: "ontology.OntologyBuilder") -> "LabelGenerator":
+        self, ontology_builder: Union["ontology.OntologyBuilder", OntologyIndex]
+    ) -> "LabelGenerator":
+        ontology_index = _compile_ontology(ontology_builder)
 
         def _assign_ids(label: Label):
-            label.assign_feature_schema_ids(ontology_builder)
+            label.assign_feature_schema_ids(ontology_index)
             return label
 
         self._fns['assign_feature_schema_ids'] = _assign_ids
@@ -236,23 +258,28 @@ class LabelGenerator(PrefetchGenerator):
         self._fns['assign_datarow_ids'] = _add_to_dataset
         return self
 
-    def add_url_to_masks(self, signer: Callable[[bytes],
-                                                str]) -> "LabelGenerator":
+    def add_url_to_masks(
+            self,
+            signer: Callable[[bytes], str],
+            signing_cache: Optional[SigningCache] = None) -> "LabelGenerator":
         """
         Creates signed urls for all masks in the LabelGenerator.
         Multiple masks can reference the same MaskData so this makes sure we only upload that url once.
+        Masks with identical content are also only uploaded once, even across labels.
         Only uploads url if one doesn't already exist.
 
         Args:
             signer: A function that accepts bytes and returns a signed url.
-            max_concurrency: how many threads to use for uploading.
-                Should be balanced to match the signing services capabilities.
+            signing_cache: Cache of urls keyed by mask content.
+                Defaults to a new in memory cache shared by all labels in this LabelGenerator.
         Returns:
             LabelGenerator that updates references to the new mask urls as data is accessed
         """
+        if signing_cache is None:
+            signing_cache = SigningCache()
 
         def _add_url_to_masks(label: Label):
-            label.add_url_to_masks(signer)
+            label.add_url_to_masks(signer, signing_cache=signing_cache)
             return label
 
         self._fns['add_url_to_masks'] = _add_url_to_masks
@@ -1,4 +1,5 @@
 from .raster import ImageData
 from .raster import MaskData
+from .rle import RunLengthEncoding
 from .text import TextData
 from .video import VideoData
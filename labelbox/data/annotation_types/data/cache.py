@@ -0,0 +1,97 @@
+import sys
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+def nbytes(value: Any) -> int:
+    """
+    Approximate memory usage of a cached value
+    """
+    if hasattr(value, 'nbytes'):
+        return value.nbytes
+    elif isinstance(value, (bytes, bytearray)):
+        return len(value)
+    return sys.getsizeof(value)
+
+
+class ByteLRUCache:
+    """
+    Thread safe least recently used cache that is bounded by the total size of its values in bytes.
+
+    >>> cache = ByteLRUCache(max_bytes=512 * 1024 * 1024)
+    >>> cache.put(key, arr)
+    >>> cache.get(key)
+
+    Args:
+        max_bytes: The least recently used values are evicted once the total size exceeds this.
+            Values larger than `max_bytes` are never cached.
+        sizeof: Function that returns the size of a value in bytes. Defaults to `nbytes`.
+    """
+
+    def __init__(self, max_bytes: int, sizeof: Callable[[Any], int] = nbytes):
+        if max_bytes < 0:
+            raise ValueError(
+                f"max_bytes must be non-negative. Found {max_bytes}")
+        self.max_bytes = max_bytes
+        self._sizeof = sizeof
+        self._data = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = self._sizeof(value)
+        with self._lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                return
+            self._data[key] = (value, size)
+            self._nbytes += size
+            while self._nbytes > self.max_bytes:
+                _, (_, evicted_size) = self._data.popitem(last=False)
+                self._nbytes -= evicted_size
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            item = self._remove(key)
+            return default if item is None else item[0]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._nbytes = 0
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the cached values"""
+        return self._nbytes
+
+    def _remove(self, key: Hashable):
+        item = self._data.pop(key, None)
+        if item is not None:
+            self._nbytes -= item[1]
+        return item
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(max_bytes={self.max_bytes}, " \
+               f"nbytes={self._nbytes}, items={len(self._data)})"
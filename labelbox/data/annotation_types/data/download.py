@@ -0,0 +1,354 @@
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple, Union
+
+import requests
+from google.api_core import retry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_CONCURRENCY = 4
+# Number of bytes read from a response at a time
+STREAM_BLOCK_SIZE = 1024 * 1024
+# Seconds to wait for a connection or for data from the server
+DEFAULT_TIMEOUT = 60.
+
+# Downloads to the same path in this process run one at a time. See `_path_lock`
+_path_locks: Dict[str, Tuple[threading.Lock, int]] = {}
+_path_locks_lock = threading.Lock()
+
+
+class RangedDownload:
+    """
+    Downloads a large file with HTTP range requests over several connections.
+
+    The file is split into chunks that are downloaded concurrently into `path` + ".part".
+    Completed chunks are recorded in `path` + ".part.json" so that an interrupted download resumes
+    where it stopped. The size of every chunk and of the final file are checked against the
+    Content-Length of the file before it is moved to `path`.
+    Servers that do not support range requests are downloaded with a single streamed request.
+    The download is skipped if `path` already exists with the expected size. Downloads to the same
+    `path` within a process run one at a time, so they never write to the same .part file at once.
+
+    Chunks are downloaded in order, so the start of the file is available first.
+    `wait` blocks until a prefix of the file has been downloaded, which lets readers start
+    on a download running in the background.
+
+    >>> download = RangedDownload(url, "/tmp/video.mp4").start()
+    >>> download.wait(nbytes=1024 * 1024)  # The first MB of /tmp/video.mp4.part can be read
+    >>> path = download.wait()
+
+    Args:
+        url: The file to download
+        path: Where to save the file
+        chunk_size: Number of bytes requested in each range request
+        concurrency: Number of concurrent range requests
+        session: Optional session to make requests with
+        timeout: Seconds to wait for a connection or for data from the server in each request
+    """
+
+    def __init__(self,
+                 url: str,
+                 path: Union[str, Path],
+                 chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 concurrency: int = DEFAULT_CONCURRENCY,
+                 session: Optional[requests.Session] = None,
+                 timeout: float = DEFAULT_TIMEOUT):
+        if chunk_size < 1 or concurrency < 1:
+            raise ValueError(
+                f"chunk_size and concurrency must be positive. Found {chunk_size} and {concurrency}"
+            )
+        self.url = url
+        self.path = Path(path)
+        self.part_path = self.path.with_name(self.path.name + '.part')
+        self.progress_path = self.path.with_name(self.path.name + '.part.json')
+        self.chunk_size = chunk_size
+        self.concurrency = concurrency
+        self.session = session
+        self.timeout = timeout
+        self.size: Optional[int] = None
+        self._done: Set[int] = set()
+        self._prefix = 0
+        self._finished = False
+        self._error: Optional[BaseException] = None
+        self._condition = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def prefix(self) -> int:
+        """Number of bytes from the start of the file that have been downloaded"""
+        return self._prefix
+
+    def start(self) -> "RangedDownload":
+        """Starts the download in a background thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run_in_background,
+                                            daemon=True)
+            self._thread.start()
+        return self
+
+    def wait(self,
+             nbytes: Optional[int] = None,
+             timeout: Optional[float] = None) -> Path:
+        """
+        Blocks until the first `nbytes` of the file (or the whole file) have been downloaded.
+
+        Args:
+            nbytes: Number of bytes from the start of the file to wait for. Defaults to the whole file.
+        Returns:
+            `part_path` while the download is in progress, otherwise `path`
+        Raises:
+            The error that stopped the download or TimeoutError
+        """
+        self.start()
+        with self._condition:
+
+            def ready():
+                if self._error is not None or self._finished:
+                    return True
+                return nbytes is not None and self.size is not None and \
+                    self._prefix >= min(nbytes, self.size)
+
+            if not self._condition.wait_for(ready, timeout=timeout):
+                raise TimeoutError(
+                    f"Download of {self.url} did not finish in {timeout}s")
+            if self._error is not None:
+                raise self._error
+            return self.path if self._finished else self.part_path
+
+    def run(self) -> Path:
+        """
+        Downloads the file in the current thread.
+
+        Returns:
+            `path`
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        session = self.session or _session(self.concurrency)
+        try:
+            with _path_lock(self.path):
+                size, etag = self._probe(session)
+                if size is not None and self._is_downloaded(size):
+                    logger.info("%s was already downloaded to %s", self.url,
+                                self.path)
+                else:
+                    if size is None:
+                        self._stream(session)
+                    else:
+                        self._download_chunks(session, size, etag)
+                    os.replace(self.part_path, self.path)
+                    self._remove(self.progress_path)
+        finally:
+            if self.session is None:
+                session.close()
+
+        self._set_finished(self.path.stat().st_size)
+        return self.path
+
+    def _run_in_background(self) -> None:
+        try:
+            self.run()
+        except BaseException as e:
+            with self._condition:
+                self._error = e
+                self._condition.notify_all()
+
+    def _set_finished(self, size: int) -> None:
+        with self._condition:
+            self.size = self._prefix = size
+            self._finished = True
+            self._condition.notify_all()
+
+    def _is_downloaded(self, size: int) -> bool:
+        try:
+            return self.path.stat().st_size == size
+        except OSError:
+            return False
+
+    @retry.Retry(deadline=60.)
+    def _probe(
+            self,
+            session: requests.Session) -> Tuple[Optional[int], Optional[str]]:
+        # Returns the size of the file and its etag. The size is None if range requests aren't supported.
+        response = session.head(self.url,
+                                allow_redirects=True,
+                                timeout=self.timeout)
+        if not response.ok or response.headers.get('Accept-Ranges') != 'bytes':
+            return None, None
+        size = response.headers.get('Content-Length')
+        if size is None:
+            return None, None
+        return int(size), response.headers.get('ETag')
+
+    def _stream(self, session: requests.Session) -> None:
+        logger.info("Range requests are not supported for %s", self.url)
+        with session.get(self.url, stream=True,
+                         timeout=self.timeout) as response:
+            response.raise_for_status()
+            # The length of compressed responses doesn't match the decoded content
+            expected = None if 'Content-Encoding' in response.headers else \
+                response.headers.get('Content-Length')
+            if expected is not None:
+                self.size = int(expected)
+            written = 0
+            with open(self.part_path, 'wb') as file:
+                for block in response.iter_content(STREAM_BLOCK_SIZE):
+                    file.write(block)
+                    written += len(block)
+                    with self._condition:
+                        self._prefix = written
+                        self._condition.notify_all()
+        if expected is not None and written != int(expected):
+            raise IOError(
+                f"Downloaded {written} bytes of {self.url}. Expected {expected}"
+            )
+
+    def _download_chunks(self, session: requests.Session, size: int,
+                         etag: Optional[str]) -> None:
+        progress = {
+            'url': self.url,
+            'size': size,
+            'etag': etag,
+            'chunk_size': self.chunk_size
+        }
+        done = self._load_progress(progress)
+        if not done or not self.part_path.exists():
+            done = set()
+            with open(self.part_path, 'wb') as file:
+                file.truncate(size)
+
+        n_chunks = -(-size // self.chunk_size)
+        with self._condition:
+            self.size = size
+            self._done = done
+            self._update_prefix(n_chunks)
+
+        todo = [idx for idx in range(n_chunks) if idx not in done]
+        with ThreadPoolExecutor(max_workers=self.concurrency) as exc:
+            futures = [
+                exc.submit(self._download_chunk, session, idx, size)
+                for idx in todo
+            ]
+            try:
+                for future in as_completed(futures):
+                    idx = future.result()
+                    with self._condition:
+                        self._done.add(idx)
+                        self._update_prefix(n_chunks)
+                        progress['done'] = sorted(self._done)
+                        self._save_progress(progress)
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+
+        actual = self.part_path.stat().st_size
+        if actual != size:
+            raise IOError(
+                f"Downloaded {actual} bytes of {self.url}. Expected {size}")
+
+    @retry.Retry(deadline=60.)
+    def _download_chunk(self, session: requests.Session, idx: int,
+                        size: int) -> int:
+        start = idx * self.chunk_size
+        end = min(start + self.chunk_size, size) - 1
+        response = session.get(self.url,
+                               headers={'Range': f'bytes={start}-{end}'},
+                               timeout=self.timeout)
+        response.raise_for_status()
+        if response.status_code != 206 or len(
+                response.content) != end - start + 1:
+            raise IOError(
+                f"Expected bytes {start}-{end} of {self.url}. Found {len(response.content)} bytes "
+                f"with status {response.status_code}")
+        with open(self.part_path, 'r+b') as file:
+            file.seek(start)
+            file.write(response.content)
+        return idx
+
+    def _update_prefix(self, n_chunks: int) -> None:
+        idx = self._prefix // self.chunk_size
+        while idx < n_chunks and idx in self._done:
+            idx += 1
+        self._prefix = min(idx * self.chunk_size, self.size)
+        self._condition.notify_all()
+
+    def _load_progress(self, expected: dict) -> Set[int]:
+        # Chunks are only reused if the file and chunk size are unchanged
+        try:
+            with open(self.progress_path) as file:
+                progress = json.load(file)
+        except (OSError, ValueError):
+            return set()
+        if {key: progress.get(key) for key in expected} != expected:
+            return set()
+        return set(progress.get('done', []))
+
+    def _save_progress(self, progress: dict) -> None:
+        tmp_path = self.progress_path.with_name(self.progress_path.name +
+                                                '.tmp')
+        with open(tmp_path, 'w') as file:
+            json.dump(progress, file)
+        os.replace(tmp_path, self.progress_path)
+
+    @staticmethod
+    def _remove(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def download_file(url: str,
+                  path: Union[str, Path],
+                  chunk_size: int = DEFAULT_CHUNK_SIZE,
+                  concurrency: int = DEFAULT_CONCURRENCY,
+                  session: Optional[requests.Session] = None,
+                  timeout: float = DEFAULT_TIMEOUT) -> Path:
+    """
+    Downloads a file with concurrent range requests. See `RangedDownload`.
+
+    Returns:
+        `path`
+    """
+    return RangedDownload(url,
+                          path,
+                          chunk_size=chunk_size,
+                          concurrency=concurrency,
+                          session=session,
+                          timeout=timeout).run()
+
+
+@contextmanager
+def _path_lock(path: Path) -> Iterator[None]:
+    # Holds a lock for each path that is being downloaded. Locks are removed once they are unused.
+    key = os.path.abspath(path)
+    with _path_locks_lock:
+        lock, users = _path_locks.get(key, (threading.Lock(), 0))
+        _path_locks[key] = (lock, users + 1)
+    try:
+        with lock:
+            yield
+    finally:
+        with _path_locks_lock:
+            lock, users = _path_locks[key]
+            if users == 1:
+                del _path_locks[key]
+            else:
+                _path_locks[key] = (lock, users - 1)
+
+
+def _session(concurrency: int) -> requests.Session:
+    # Keeps a connection open for each concurrent request
+    adapter = requests.adapters.HTTPAdapter(pool_connections=concurrency,
+                                            pool_maxsize=concurrency)
+    session = requests.Session()
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
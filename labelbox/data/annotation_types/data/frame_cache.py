@@ -0,0 +1,136 @@
+import hashlib
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Hashable, Optional, Union
+
+import numpy as np
+
+from .cache import ByteLRUCache
+
+
+class FrameCache:
+    """
+    Cache for decoded video frames that is shared by every `VideoData` in the process.
+    See `VideoData.set_frame_cache`.
+
+    Recently used frames are kept in memory up to `max_bytes`. Optionally, every cached frame is also
+    written to `directory` as an .npy file. Frames that were evicted from memory are then read back as
+    read only memory-mapped arrays instead of being decoded again. The least recently used files are
+    removed once they exceed `max_disk_bytes`.
+
+    >>> VideoData.set_frame_cache(FrameCache(max_bytes=2 * 1024 ** 3, directory="/tmp/frames"))
+
+    Args:
+        max_bytes: Memory budget for decoded frames
+        directory: Optional directory for spilling frames to disk. Files already in it count towards `max_disk_bytes`.
+        max_disk_bytes: Disk budget for the frames in `directory`
+    """
+
+    def __init__(self,
+                 max_bytes: int = 1024 * 1024 * 1024,
+                 directory: Optional[Union[str, Path]] = None,
+                 max_disk_bytes: int = 10 * 1024 * 1024 * 1024):
+        if max_disk_bytes < 0:
+            raise ValueError(
+                f"max_disk_bytes must be non-negative. Found {max_disk_bytes}")
+        self.memory = ByteLRUCache(max_bytes)
+        self.max_disk_bytes = max_disk_bytes
+        self.directory = None if directory is None else Path(
+            directory).expanduser()
+        # Sizes of the files in `directory` from least to most recently used
+        self._files = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            files = [
+                (path.stat(), path) for path in self.directory.glob('*/*.npy')
+            ]
+            for stat, path in sorted(files, key=lambda item: item[0].st_mtime):
+                self._files[path] = stat.st_size
+                self._disk_bytes += stat.st_size
+            with self._lock:
+                self._evict()
+
+    def get(self, video: Hashable, idx: int) -> Optional[np.ndarray]:
+        """
+        Args:
+            video: Key of the video
+            idx: Index of the frame
+        Returns:
+            The cached frame or None. Cached frames are read only.
+        """
+        frame = self.memory.get((video, idx))
+        if frame is None and self.directory is not None:
+            path = self._path(video, idx)
+            try:
+                frame = np.load(path, mmap_mode='r')
+            except OSError:
+                return None
+            with self._lock:
+                if path in self._files:
+                    self._files.move_to_end(path)
+        return frame
+
+    def put(self, video: Hashable, idx: int, frame: np.ndarray) -> None:
+        """
+        Caches a copy of `frame`, so the caller can keep modifying its own array.
+
+        Args:
+            video: Key of the video
+            idx: Index of the frame
+            frame: The decoded frame
+        """
+        frame = np.array(frame)
+        frame.flags.writeable = False
+        self.memory.put((video, idx), frame)
+        if self.directory is None:
+            return
+        path = self._path(video, idx)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that readers never see a partial frame
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        with open(tmp_path, 'wb') as file:
+            np.save(file, frame)
+        size = tmp_path.stat().st_size
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._disk_bytes += size - self._files.pop(path, 0)
+            self._files[path] = size
+            self._evict()
+
+    def clear(self) -> None:
+        """Removes all frames from memory and `directory`"""
+        self.memory.clear()
+        if self.directory is not None:
+            with self._lock:
+                self._files.clear()
+                self._disk_bytes = 0
+            for path in self.directory.iterdir():
+                shutil.rmtree(path, ignore_errors=True)
+
+    @property
+    def disk_bytes(self) -> int:
+        """Total size of the frames in `directory`"""
+        return self._disk_bytes
+
+    def _evict(self) -> None:
+        # Must be called with `_lock` held
+        while self._disk_bytes > self.max_disk_bytes:
+            path, size = self._files.popitem(last=False)
+            self._disk_bytes -= size
+            try:
+                path.unlink()
+            except OSError:
+                pass
+
+    def _path(self, video: Hashable, idx: int) -> Path:
+        name = hashlib.sha256(repr(video).encode()).hexdigest()[:16]
+        return self.directory / name / f"{idx}.npy"
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(memory={self.memory!r}, " \
+               f"directory={self.directory}, disk_bytes={self._disk_bytes})"
@@ -0,0 +1,133 @@
+from typing import Dict, Optional, Tuple, Union
+
+import numpy as np
+
+Color = Union[int, Tuple[int, int, int]]
+
+
+def pack_colors(arr: np.ndarray) -> np.ndarray:
+    """
+    Packs the last (rgb) dimension of a uint8 array into a single uint32 per pixel
+    """
+    arr = arr.astype(np.uint32)
+    return (arr[..., 0] << 16) | (arr[..., 1] << 8) | arr[..., 2]
+
+
+def pack_color(color: Color) -> int:
+    if isinstance(color, (tuple, list)):
+        if len(color) == 1:
+            color = color[0]
+        else:
+            red, green, blue = color
+            return (int(red) << 16) | (int(green) << 8) | int(blue)
+    return (int(color) << 16) | (int(color) << 8) | int(color)
+
+
+class LabelMap:
+    """
+    Single channel index of the colors in a [H, W, 3] segmentation mask.
+
+    Each pixel of `labels` is the index of its color in `colors`. The area and bounding box of
+    every color are computed in the same pass so that the mask, area and bounding box of an
+    individual color only require a lookup and a comparison over its bounding box.
+
+    >>> label_map = LabelMap(mask_data.value)
+    >>> label_map.bbox((255, 0, 0))
+    >>> binary_mask = label_map.mask((255, 0, 0))
+
+    Args:
+        arr: uint8 array with shape [H, W, 3]
+    """
+
+    def __init__(self, arr: np.ndarray):
+        if arr.ndim != 3:
+            raise ValueError(
+                f"Expected an array with shape [H, W, 3]. Found {arr.shape}")
+        height, width = arr.shape[:2]
+        self.shape = (height, width)
+        packed = pack_colors(arr).ravel()
+
+        # A single stable sort groups the pixels of each color in raster order
+        order = np.argsort(packed, kind='stable')
+        sorted_colors = packed[order]
+        is_start = np.empty(len(sorted_colors), dtype=bool)
+        is_start[:1] = True
+        np.not_equal(sorted_colors[1:], sorted_colors[:-1], out=is_start[1:])
+        starts = np.flatnonzero(is_start)
+
+        packed_colors = sorted_colors[starts]
+        self.colors = np.stack(
+            [(packed_colors >> 16) & 255,
+             (packed_colors >> 8) & 255, packed_colors & 255],
+            axis=-1).astype(np.uint8)
+        self._indices: Dict[int, int] = {
+            color: idx for idx, color in enumerate(packed_colors.tolist())
+        }
+
+        dtype = np.min_scalar_type(max(len(starts) - 1, 0))
+        labels = np.empty(len(packed), dtype=dtype)
+        labels[order] = (np.cumsum(is_start) - 1).astype(dtype)
+        self.labels = labels.reshape(self.shape)
+
+        self.areas = np.diff(np.append(starts, len(order)))
+        self.bboxes = np.zeros((len(starts), 4), dtype=np.int64)
+        if len(starts):
+            rows, cols = np.divmod(order, width)
+            self.bboxes[:, 0] = np.minimum.reduceat(cols, starts)
+            self.bboxes[:, 1] = rows[starts]
+            self.bboxes[:, 2] = np.maximum.reduceat(cols, starts) + 1
+            self.bboxes[:, 3] = rows[starts + self.areas - 1] + 1
+
+    def index(self, color: Color) -> Optional[int]:
+        """
+        Returns the index of a color in `colors` or None if the color isn't in the mask
+        """
+        return self._indices.get(pack_color(color))
+
+    def area(self, color: Color) -> int:
+        """Number of pixels with this color"""
+        idx = self.index(color)
+        return 0 if idx is None else int(self.areas[idx])
+
+    def bbox(self, color: Color) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Bounding box of the pixels with this color as (xmin, ymin, xmax, ymax).
+        The max values are exclusive so that `arr[ymin:ymax, xmin:xmax]` contains the color.
+        Returns None if the color isn't in the mask.
+        """
+        idx = self.index(color)
+        return None if idx is None else tuple(self.bboxes[idx].tolist())
+
+    def mask(self,
+             color: Color,
+             crop: bool = False,
+             packed: bool = False) -> np.ndarray:
+        """
+        Binary mask of the pixels with this color.
+
+        Args:
+            color: RGB color or a single grayscale value
+            crop: Only return the part of the mask within `bbox(color)`
+            packed: Pack the mask into bits along the last axis with `np.packbits`.
+                Use `np.unpackbits(packed_mask, axis=-1, count=width)` to restore it.
+        Returns:
+            uint8 array of zeros and ones with shape [H, W], or the shape of the bounding box when cropped.
+        """
+        idx = self.index(color)
+        if idx is None:
+            mask = np.zeros((0, 0) if crop else self.shape, dtype=np.uint8)
+        else:
+            xmin, ymin, xmax, ymax = self.bboxes[idx]
+            region = (self.labels[ymin:ymax, xmin:xmax] == idx).view(np.uint8)
+            if crop:
+                mask = region
+            else:
+                mask = np.zeros(self.shape, dtype=np.uint8)
+                mask[ymin:ymax, xmin:xmax] = region
+        return np.packbits(mask, axis=-1) if packed else mask
+
+    def __len__(self) -> int:
+        return len(self.colors)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(shape={self.shape}, colors={len(self.colors)})"
@@ -1,17 +1,34 @@
 from abc import ABC
+from contextlib import contextmanager
 from io import BytesIO
-from typing import Callable, Optional, Union
+from typing import Callable, Generator, Hashable, Optional, Tuple, Union
 from typing_extensions import Literal
+import hashlib
+import math
+import os
 import numpy as np
 import requests
-from PIL import Image
+from PIL import Image, ImageFile
 from google.api_core import retry
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from pydantic import root_validator
 
 from .base_data import BaseData
+from .cache import ByteLRUCache
+from .label_map import LabelMap
+from .rle import RunLengthEncoding
+from ..signing import SigningCache
 from ..types import TypedArray
 
+# Process wide cache of decoded rasters. Disabled by default. See `RasterData.set_decode_cache`
+_decode_cache: Optional[ByteLRUCache] = None
+# Whether bytes read from `file_path` or `url` are stored in `im_bytes`
+_retain_bytes = True
+# Number of bytes requested at a time when reading image headers from a url
+HEADER_CHUNK_SIZE = 64 * 1024
+# Fields in the order that `value` reads them
+_SOURCES = ('arr', 'rle', 'im_bytes', 'file_path', 'url')
+
 
 class RasterData(BaseModel, ABC):
     """Represents an image or segmentation mask.
@@ -21,6 +38,36 @@ class RasterData(BaseModel, ABC):
     url: Optional[str] = None
     arr: Optional[TypedArray[Literal['uint8']]] = None
 
+    # (im_bytes, key) so that content is only hashed once
+    _bytes_key: Optional[Tuple[bytes, Hashable]] = PrivateAttr(None)
+    # (url, shape) so that headers are only fetched once
+    _url_shape: Optional[Tuple[str, Tuple[int, int, int]]] = PrivateAttr(None)
+
+    @staticmethod
+    def set_decode_cache(max_bytes: Optional[int],
+                         retain_bytes: bool = True) -> None:
+        """
+        Configures a process wide LRU cache of decoded rasters that is shared by all `RasterData` objects.
+
+        Decoded arrays are keyed by content: a hash of `im_bytes`, the path, size and modification time of `file_path`,
+        or the `url`. Repeated calls to `value` for the same content return the cached array instead of decoding again.
+        Cached arrays are read only.
+
+        >>> RasterData.set_decode_cache(max_bytes=1024 ** 3, retain_bytes=False)
+
+        Args:
+            max_bytes: Memory budget for decoded arrays. None disables the cache.
+            retain_bytes: Whether to keep the bytes read from `file_path` or `url` in `im_bytes`.
+                Set to False to only keep decoded arrays (in the cache). Evicted arrays are read or fetched again.
+        """
+        global _decode_cache, _retain_bytes
+        _decode_cache = None if max_bytes is None else ByteLRUCache(max_bytes)
+        _retain_bytes = retain_bytes
+
+    @staticmethod
+    def get_decode_cache() -> Optional[ByteLRUCache]:
+        return _decode_cache
+
     @classmethod
     def from_2D_arr(cls, arr: Union[TypedArray[Literal['uint8']],
                                     TypedArray[Literal['int']]],
@@ -60,7 +107,11 @@ class RasterData(BaseModel, ABC):
         Returns:
             numpy array representing the image
         """
-        arr = np.array(Image.open(BytesIO(image_bytes)))
+        return self._image_to_np(Image.open(BytesIO(image_bytes)))
+
+    @staticmethod
+    def _image_to_np(image: Image.Image) -> np.ndarray:
+        arr = np.array(image)
         if len(arr.shape) == 2:
             arr = np.stack((arr,) * 3, axis=-1)
         return arr[:, :, :3]
@@ -93,23 +144,195 @@ class RasterData(BaseModel, ABC):
         Returns:
             numpy representation of the raster
         """
-        if self.arr is not None:
-            return self.arr
+        arr = self._array()
+        if arr is not None:
+            return arr
+        cache = _decode_cache
+        if cache is None:
+            return self._decode()
+
+        key = self._decode_key()
+        arr = cache.get(key)
+        if arr is None:
+            arr = self._decode(key)
+            arr.flags.writeable = False
+            cache.put(key, arr)
+        return arr
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        """
+        Shape of `value` ([H, W, 3]) without decoding the raster.
+
+        Only the image header is read from `im_bytes` or `file_path`.
+        For urls, the header is fetched with range requests unless a custom fetch function is set.
+
+        Returns:
+            (height, width, 3)
+        """
+        arr = self._loaded_value()
+        if arr is not None:
+            return arr.shape
+        elif self.im_bytes is not None:
+            with Image.open(BytesIO(self.im_bytes)) as image:
+                width, height = image.size
+        elif self.file_path is not None:
+            with Image.open(self.file_path) as image:
+                width, height = image.size
+        elif self.url is not None:
+            if self._url_shape is not None and self._url_shape[0] == self.url:
+                return self._url_shape[1]
+            width, height = self._fetch_remote_size()
+            self._url_shape = (self.url, (height, width, 3))
+        else:
+            raise ValueError("Must set either url, file_path or im_bytes")
+        return (height, width, 3)
+
+    def read_region(self,
+                    box: Tuple[int, int, int, int],
+                    scale: float = 1.) -> np.ndarray:
+        """
+        Reads part of the raster, optionally at a reduced resolution.
+
+        JPEGs are decoded at the smallest resolution that is at least `scale` of the original
+        (see `PIL.Image.draft`) so thumbnails and crops don't require a full decode.
+        Other formats are decoded once and then cropped and resized.
+
+        >>> thumbnail = image_data.read_region((0, 0, width, height), scale=0.125)
+
+        Args:
+            box: (xmin, ymin, xmax, ymax) in pixels of the full resolution raster
+            scale: Resolution of the result relative to the full resolution raster. Must be in (0, 1].
+        Returns:
+            uint8 array with shape (round((ymax - ymin) * scale), round((xmax - xmin) * scale), 3)
+        """
+        if not 0 < scale <= 1:
+            raise ValueError(f"scale must be in (0, 1]. Found {scale}")
+        height, width, _ = self.shape
+        xmin, ymin, xmax, ymax = box
+        if not (0 <= xmin < xmax <= width and 0 <= ymin < ymax <= height):
+            raise ValueError(
+                f"Invalid box {box} for raster with shape {(height, width)}")
+        size = (max(round((xmax - xmin) * scale),
+                    1), max(round((ymax - ymin) * scale), 1))
+
+        arr = self._loaded_value()
+        if arr is not None:
+            image = Image.fromarray(arr[ymin:ymax, xmin:xmax])
+            if image.size != size:
+                image = image.resize(size, Image.BILINEAR)
+            return self._image_to_np(image)
+
+        with self._open_image() as image:
+            if scale < 1:
+                image.draft(
+                    'RGB',
+                    (math.ceil(width * scale), math.ceil(height * scale)))
+            # The draft may have reduced the resolution
+            x_scale, y_scale = image.size[0] / width, image.size[1] / height
+            region = image.crop(
+                (math.floor(xmin * x_scale), math.floor(ymin * y_scale),
+                 math.ceil(xmax * x_scale), math.ceil(ymax * y_scale)))
+            if region.size != size:
+                region = region.resize(size, Image.BILINEAR)
+            return self._image_to_np(region)
+
+    def _loaded_value(self) -> Optional[np.ndarray]:
+        # Returns the array if it doesn't have to be decoded
+        arr = self._array()
+        if arr is not None:
+            return arr
+        elif _decode_cache is None or self.im_bytes is not None:
+            # Hashing the bytes would cost more than reading the header
+            return None
+        elif self.file_path is not None or self.url is not None:
+            return _decode_cache.get(self._decode_key())
+        return None
+
+    def _array(self) -> Optional[np.ndarray]:
+        # The raster if it is stored as an array
+        return self.arr
+
+    @contextmanager
+    def _open_image(self) -> Generator[Image.Image, None, None]:
+        if self.im_bytes is not None:
+            image = Image.open(BytesIO(self.im_bytes))
+        elif self.file_path is not None:
+            image = Image.open(self.file_path)
+        elif self.url is not None:
+            im_bytes = self.fetch_remote()
+            if _retain_bytes:
+                self.im_bytes = im_bytes
+            image = Image.open(BytesIO(im_bytes))
+        else:
+            raise ValueError("Must set either url, file_path or im_bytes")
+        with image:
+            yield image
+
+    @retry.Retry(deadline=60.)
+    def _fetch_remote_size(self) -> Tuple[int, int]:
+        # A custom fetch function might be required for accessing the url
+        if 'fetch_remote' in self.__dict__ or type(
+                self).fetch_remote is not RasterData.fetch_remote:
+            with Image.open(BytesIO(self.fetch_remote())) as image:
+                return image.size
+
+        parser = ImageFile.Parser()
+        start = 0
+        while parser.image is None:
+            response = requests.get(
+                self.url,
+                headers={
+                    'Range': f'bytes={start}-{start + HEADER_CHUNK_SIZE - 1}'
+                })
+            response.raise_for_status()
+            parser.feed(response.content)
+            if response.status_code != 206:
+                # The server doesn't support ranges and returned the whole file
+                if _retain_bytes:
+                    self.im_bytes = response.content
+                break
+            elif len(response.content) < HEADER_CHUNK_SIZE:
+                break
+            start += HEADER_CHUNK_SIZE
+        if parser.image is None:
+            raise ValueError(f"Unable to read image header from {self.url}")
+        return parser.image.size
+
+    def _decode(self, key: Optional[Hashable] = None) -> np.ndarray:
         if self.im_bytes is not None:
             return self.bytes_to_np(self.im_bytes)
         elif self.file_path is not None:
             with open(self.file_path, "rb") as img:
                 im_bytes = img.read()
-            self.im_bytes = im_bytes
-            arr = self.bytes_to_np(im_bytes)
-            return arr
         elif self.url is not None:
             im_bytes = self.fetch_remote()
-            self.im_bytes = im_bytes
-            return self.bytes_to_np(im_bytes)
         else:
             raise ValueError("Must set either url, file_path or im_bytes")
 
+        if _retain_bytes:
+            self.im_bytes = im_bytes
+            if key is not None:
+                # The bytes have the same content as the file or url
+                self._bytes_key = (im_bytes, key)
+        return self.bytes_to_np(im_bytes)
+
+    def _decode_key(self) -> Hashable:
+        # Identifies the content without reading or decoding it
+        if self.im_bytes is not None:
+            im_bytes, key = self._bytes_key or (None, None)
+            if im_bytes is not self.im_bytes:
+                key = ('bytes', hashlib.sha256(self.im_bytes).digest())
+                self._bytes_key = (self.im_bytes, key)
+            return key
+        elif self.file_path is not None:
+            stat = os.stat(self.file_path)
+            return ('file', os.path.abspath(self.file_path), stat.st_size,
+                    stat.st_mtime_ns)
+        elif self.url is not None:
+            return ('url', self.url)
+        raise ValueError("Must set either url, file_path or im_bytes")
+
     def set_fetch_fn(self, fn):
         object.__setattr__(self, 'fetch_remote', lambda: fn(self))
 
@@ -126,29 +349,52 @@ class RasterData(BaseModel, ABC):
         return response.content
 
     @retry.Retry(deadline=30.)
-    def create_url(self, signer: Callable[[bytes], str]) -> str:
+    def create_url(self,
+                   signer: Callable[[bytes], str],
+                   signing_cache: Optional[SigningCache] = None) -> str:
         """
         Utility for creating a url from any of the other image representations.
 
         Args:
             signer: A function that accepts bytes and returns a signed url.
+            signing_cache: Optional cache for reusing the url of identical content
+                instead of uploading it again.
         Returns:
             url for the raster data
         """
         if self.url is not None:
             return self.url
+        elif signing_cache is not None:
+            self.url = self._sign_cached(signer, signing_cache)
         elif self.im_bytes is not None:
             self.url = signer(self.im_bytes)
         elif self.file_path is not None:
             with open(self.file_path, 'rb') as file:
                 self.url = signer(file.read())
-        elif self.arr is not None:
-            self.url = signer(self.np_to_bytes(self.arr))
+        elif self._array() is not None:
+            self.url = signer(self.np_to_bytes(self._array()))
         else:
             raise ValueError(
                 "One of url, im_bytes, file_path, arr must not be None.")
         return self.url
 
+    def _sign_cached(self, signer: Callable[[bytes], str],
+                     signing_cache: SigningCache) -> str:
+        if self.im_bytes is not None:
+            return signing_cache.sign(self.im_bytes, signer)
+        elif self.file_path is not None:
+            with open(self.file_path, 'rb') as file:
+                return signing_cache.sign(file.read(), signer)
+        arr = self._array()
+        if arr is not None:
+            # Hashing the array is much cheaper than png encoding it.
+            # So only encode if this content hasn't been uploaded yet.
+            return signing_cache.get_or_sign(signing_cache.array_key(arr),
+                                             lambda: self.np_to_bytes(arr),
+                                             signer)
+        raise ValueError(
+            "One of url, im_bytes, file_path, arr must not be None.")
+
     @root_validator()
     def validate_args(cls, values):
         file_path = values.get("file_path")
@@ -156,7 +402,8 @@ class RasterData(BaseModel, ABC):
         url = values.get("url")
         arr = values.get("arr")
         uid = values.get('uid')
-        if uid == file_path == im_bytes == url == None and arr is None:
+        rle = values.get('rle')
+        if uid == file_path == im_bytes == url == rle == None and arr is None:
             raise ValueError(
                 "One of `file_path`, `im_bytes`, `url`, `uid` or `arr` required."
             )
@@ -199,12 +446,56 @@ class MaskData(RasterData):
     >>>    [2, 2, 2],
     >>>])
 
+    Binary masks can be stored as a run length encoding. Pixels in the mask have the value 1.
+
+    >>> MaskData(rle=RunLengthEncoding.from_coco(segmentation))
+
     Args:
         im_bytes: Optional[bytes] = None
         file_path: Optional[str] = None
         url: Optional[str] = None
         arr: Optional[TypedArray[Literal['uint8']]] = None
+        rle: Optional[RunLengthEncoding] = None
     """
+    rle: Optional[RunLengthEncoding] = None
+
+    _label_map: Optional[LabelMap] = PrivateAttr(None)
+
+    @property
+    def label_map(self) -> LabelMap:
+        """
+        Index of the colors in this mask that is built on first access and shared by every `Mask` referencing it.
+
+        Rebuilt when the field that `value` is read from is assigned.
+        Modifying `arr` in place is not detected, reassign it instead.
+        """
+        if self._label_map is None:
+            self._label_map = LabelMap(self.value)
+        return self._label_map
+
+    @property
+    def shape(self) -> Tuple[int, int, int]:
+        if self.arr is None and self.rle is not None:
+            return (*self.rle.size, 3)
+        return super().shape
+
+    def _array(self) -> Optional[np.ndarray]:
+        if self.arr is None and self.rle is not None:
+            return np.stack((self.rle.to_array(),) * 3, axis=-1)
+        return self.arr
+
+    def __setattr__(self, name, value):
+        if name in _SOURCES and self._label_map is not None:
+            # Setting a lower priority field (e.g. the url from `create_url`) doesn't change `value`
+            higher = _SOURCES[:_SOURCES.index(name)]
+            if all(getattr(self, field) is None for field in higher):
+                self._label_map = None
+        super().__setattr__(name, value)
+
+    def __repr__(self) -> str:
+        if self.arr is None and self.rle is not None:
+            return f"{self.__class__.__name__}(rle={self.rle!r},url={self.url})"
+        return super().__repr__()
 
 
 class ImageData(RasterData, BaseData):
@@ -0,0 +1,221 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from typing_extensions import Literal
+import numpy as np
+from pydantic import BaseModel, root_validator, validator
+
+from ..types import TypedArray
+
+
+def _decode_counts(counts: str) -> List[int]:
+    # Inverse of `_encode_counts`. See `rleFrString` in pycocotools
+    decoded = []
+    idx = 0
+    while idx < len(counts):
+        value, shift, more = 0, 0, True
+        while more:
+            char = ord(counts[idx]) - 48
+            value |= (char & 0x1f) << shift
+            more = char & 0x20
+            idx += 1
+            shift += 5
+            if not more and char & 0x10:
+                value |= -1 << shift
+        if len(decoded) > 2:
+            value += decoded[-2]
+        decoded.append(value)
+    return decoded
+
+
+def _encode_counts(counts: np.ndarray) -> str:
+    # Compressed string representation of counts. See `rleToString` in pycocotools
+    chars = []
+    counts = counts.tolist()
+    for idx, value in enumerate(counts):
+        if idx > 2:
+            value -= counts[idx - 2]
+        more = True
+        while more:
+            char = value & 0x1f
+            value >>= 5
+            more = value != -1 if char & 0x10 else value != 0
+            if more:
+                char |= 0x20
+            chars.append(chr(char + 48))
+    return ''.join(chars)
+
+
+class RunLengthEncoding(BaseModel):
+    """
+    COCO compatible run length encoding of a binary mask.
+
+    `counts` alternates between the lengths of runs of zeros and ones, starting with zeros,
+    over the mask flattened in column major order. Area, bounding box, intersection, union and iou
+    are computed on the runs without decoding the mask.
+
+    >>> rle = RunLengthEncoding.from_coco({'counts': [6, 2, 4], 'size': [4, 3]})
+    >>> rle.area
+    2
+    >>> mask = Mask(mask=MaskData(rle=rle), color=1)
+
+    Args:
+        counts: Lengths of the runs. Lists and COCO compressed strings are converted to an int64 array.
+        size: (height, width) of the mask
+    """
+    counts: TypedArray[Literal['int64']]
+    size: Tuple[int, int]
+
+    @classmethod
+    def from_array(cls, mask: np.ndarray) -> "RunLengthEncoding":
+        """
+        Encodes a 2D array. Non zero values are part of the mask.
+        """
+        if mask.ndim != 2:
+            raise ValueError(
+                f"Expected an array with shape [H, W]. Found {mask.shape}")
+        flat = mask.ravel(order='F') != 0
+        changes = np.flatnonzero(flat[1:] != flat[:-1]) + 1
+        counts = np.diff(np.concatenate([[0], changes, [len(flat)]]))
+        if len(flat) and flat[0]:
+            counts = np.concatenate([[0], counts])
+        return cls(counts=counts.astype(np.int64), size=mask.shape)
+
+    @classmethod
+    def from_coco(cls, segmentation: Dict[str, Any]) -> "RunLengthEncoding":
+        """
+        Args:
+            segmentation: COCO rle segmentation. Either uncompressed (`counts` is a list) or compressed (`counts` is a string)
+        """
+        return cls(counts=segmentation['counts'], size=segmentation['size'])
+
+    def to_coco(self, compress: bool = False) -> Dict[str, Any]:
+        """
+        Args:
+            compress: Whether to encode `counts` as a compressed string (as produced by pycocotools)
+        Returns:
+            COCO rle segmentation
+        """
+        counts = _encode_counts(
+            self.counts) if compress else self.counts.tolist()
+        return {'counts': counts, 'size': list(self.size)}
+
+    def to_array(self) -> np.ndarray:
+        """
+        Returns:
+            uint8 array of zeros and ones with shape `size`
+        """
+        height, width = self.size
+        values = (np.arange(len(self.counts)) % 2).astype(np.uint8)
+        return np.ascontiguousarray(
+            np.repeat(values, self.counts).reshape(width, height).T)
+
+    @property
+    def area(self) -> int:
+        """Number of pixels in the mask"""
+        return int(self.counts[1::2].sum())
+
+    @property
+    def bbox(self) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Bounding box of the mask as (xmin, ymin, xmax, ymax) with exclusive max values.
+        Returns None if the mask is empty.
+        """
+        height = self.size[0]
+        ends = np.cumsum(self.counts)
+        starts = ends - self.counts
+        runs = self.counts[1::2] > 0
+        starts, ends = starts[1::2][runs], ends[1::2][runs] - 1
+        if not len(starts):
+            return None
+        start_cols, start_rows = np.divmod(starts, height)
+        end_cols, end_rows = np.divmod(ends, height)
+        # Runs that span multiple columns cover the first and last rows
+        single_col = start_cols == end_cols
+        ymin = start_rows.min() if single_col.all() else 0
+        ymax = end_rows.max() + 1 if single_col.all() else height
+        return (int(start_cols.min()), int(ymin), int(end_cols.max()) + 1,
+                int(ymax))
+
+    def intersection(self, other: "RunLengthEncoding") -> "RunLengthEncoding":
+        return self._merge(other, np.logical_and)
+
+    def union(self, other: "RunLengthEncoding") -> "RunLengthEncoding":
+        return self._merge(other, np.logical_or)
+
+    def iou(self, other: "RunLengthEncoding") -> float:
+        """
+        Intersection over union of two masks with the same size. Returns 0 if both masks are empty.
+        """
+        lengths, values, other_values = self._segments(other)
+        union = lengths[values | other_values].sum()
+        if not union:
+            return 0.
+        return float(lengths[values & other_values].sum() / union)
+
+    def _segments(
+        self, other: "RunLengthEncoding"
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        # Splits both masks at every run boundary of either mask so that both are constant within each segment
+        if tuple(self.size) != tuple(other.size):
+            raise ValueError(
+                f"Masks must have the same size. Found {self.size} and {other.size}"
+            )
+        ends, other_ends = np.cumsum(self.counts), np.cumsum(other.counts)
+        boundaries = np.union1d(ends, other_ends)
+        boundaries = boundaries[boundaries > 0]
+        starts = np.concatenate([[0], boundaries[:-1]])
+        # The number of runs that end at or before a position is odd within runs of ones
+        values = np.searchsorted(ends, starts, side='right') % 2 == 1
+        other_values = np.searchsorted(other_ends, starts,
+                                       side='right') % 2 == 1
+        return boundaries - starts, values, other_values
+
+    def _merge(
+        self, other: "RunLengthEncoding",
+        op: Callable[[np.ndarray, np.ndarray],
+                     np.ndarray]) -> "RunLengthEncoding":
+        lengths, values, other_values = self._segments(other)
+        values = op(values, other_values)
+        run_starts = np.flatnonzero(
+            np.concatenate([[True], values[1:] != values[:-1]]))
+        counts = np.add.reduceat(lengths, run_starts) if len(lengths) else \
+            lengths
+        if len(values) and values[0]:
+            counts = np.concatenate([[0], counts])
+        return RunLengthEncoding(counts=counts.astype(np.int64), size=self.size)
+
+    @validator('counts', pre=True)
+    def validate_counts(cls, counts: Union[str, List[int], np.ndarray]):
+        if isinstance(counts, (bytes, str)):
+            counts = _decode_counts(
+                counts.decode() if isinstance(counts, bytes) else counts)
+        counts = np.asarray(counts, dtype=np.int64)
+        if counts.ndim != 1:
+            raise ValueError("counts must be one dimensional")
+        elif (counts < 0).any():
+            raise ValueError(
+                "Found negative value for counts. They should all be zero or positive"
+            )
+        return counts
+
+    @root_validator(skip_on_failure=True)
+    def validate_size(cls, values):
+        height, width = values['size']
+        if height < 0 or width < 0:
+            raise ValueError(
+                f"size must be a non negative (height, width). Found {values['size']}"
+            )
+        if values['counts'].sum() != height * width:
+            raise ValueError(
+                f"counts must add up to height * width ({height * width}). Found {values['counts'].sum()}"
+            )
+        return values
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, RunLengthEncoding):
+            return False
+        return tuple(self.size) == tuple(other.size) and np.array_equal(
+            self.counts, other.counts)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(size={self.size}, runs={len(self.counts)})"
@@ -1,10 +1,74 @@
+import mmap
+import os
 from typing import Callable, Optional
+from uuid import uuid4
 
+import numpy as np
 import requests
 from google.api_core import retry
-from pydantic import root_validator
+from pydantic import PrivateAttr, root_validator
 
 from .base_data import BaseData
+from .download import download_file
+
+# Number of characters between the byte offsets stored for memory-mapped text
+CHAR_INDEX_STRIDE = 4096
+# Number of bytes scanned at a time when indexing memory-mapped text
+_INDEX_BLOCK_SIZE = 16 * 1024 * 1024
+
+
+class _MappedText:
+    """
+    Memory-mapped UTF-8 file with the byte offset of every `CHAR_INDEX_STRIDE`th character.
+    Character offsets are converted to byte offsets by scanning at most one stride from the nearest stored offset.
+    """
+
+    def __init__(self, file_path: str):
+        self.size = os.path.getsize(file_path)
+        if self.size:
+            with open(file_path, 'rb') as file:
+                self._mmap = mmap.mmap(file.fileno(),
+                                       0,
+                                       access=mmap.ACCESS_READ)
+        else:
+            self._mmap = b''
+        self._data = np.frombuffer(self._mmap, dtype=np.uint8)
+
+        # Every byte that isn't a utf-8 continuation byte (0b10xxxxxx) starts a character
+        checkpoints = []
+        self.n_chars = 0
+        self.ascii = True
+        for block_start in range(0, self.size, _INDEX_BLOCK_SIZE):
+            block = self._data[block_start:block_start + _INDEX_BLOCK_SIZE]
+            self.ascii = self.ascii and not (block >= 0x80).any()
+            char_starts = np.flatnonzero((block & 0xC0) != 0x80)
+            first = -self.n_chars % CHAR_INDEX_STRIDE
+            checkpoints.append(char_starts[first::CHAR_INDEX_STRIDE] +
+                               block_start)
+            self.n_chars += len(char_starts)
+        self._checkpoints = np.concatenate(checkpoints) if checkpoints else \
+            np.zeros(0, dtype=np.int64)
+
+    def byte_offset(self, char_offset: int) -> int:
+        if char_offset >= self.n_chars:
+            return self.size
+        elif self.ascii:
+            return char_offset
+        checkpoint, remainder = divmod(char_offset, CHAR_INDEX_STRIDE)
+        offset = int(self._checkpoints[checkpoint])
+        if not remainder:
+            return offset
+        # Characters are at most 4 bytes
+        window = self._data[offset:offset + 4 * CHAR_INDEX_STRIDE]
+        return offset + int(np.flatnonzero((window & 0xC0) != 0x80)[remainder])
+
+    def read(self, start: int, end: int) -> str:
+        return self._mmap[self.byte_offset(start):self.byte_offset(end)].decode(
+            'utf-8')
+
+    def __deepcopy__(self, memo) -> "_MappedText":
+        # The map is read only, so copies can share it
+        return self
 
 
 class TextData(BaseData):
@@ -13,14 +77,26 @@ class TextData(BaseData):
 
     >>> TextData(text="")
 
+    With `memory_map=True` the file is memory-mapped instead of read into `text`.
+    `slice` then only decodes the requested characters, so spans of many large documents
+    can be read without keeping the documents in memory. Urls are downloaded to a local file first.
+
+    >>> TextData(file_path="corpus.txt", memory_map=True).slice(1000000, 1000020)
+
     Args:
         file_path (str)
         text (str)
         url (str)
+        memory_map (bool): Whether to memory-map `file_path` (a utf-8 file) instead of reading it into `text`
+
+    Files are read as utf-8 without translating line endings, so `slice` matches `value` in both modes.
     """
     file_path: Optional[str] = None
     text: Optional[str] = None
     url: Optional[str] = None
+    memory_map: bool = False
+
+    _mapped: Optional[_MappedText] = PrivateAttr(None)
 
     @property
     def value(self) -> str:
@@ -32,8 +108,12 @@ class TextData(BaseData):
         """
         if self.text:
             return self.text
+        elif self.memory_map and (self.file_path or self.url):
+            mapped = self._get_mapped()
+            return mapped.read(0, mapped.n_chars)
         elif self.file_path:
-            with open(self.file_path, "r") as file:
+            with open(self.file_path, "r", encoding="utf-8",
+                      newline="") as file:
                 text = file.read()
             self.text = text
             return text
@@ -44,6 +124,35 @@ class TextData(BaseData):
         else:
             raise ValueError("Must set either url, file_path or im_bytes")
 
+    def slice(self, start: int, end: int) -> str:
+        """
+        Returns the characters from `start` up to (not including) `end`, the same as `value[start:end]`.
+
+        Memory-mapped text only decodes the requested characters.
+        """
+        if not self.memory_map or self.text:
+            return self.value[start:end]
+        mapped = self._get_mapped()
+        start, end, _ = slice(start, end).indices(mapped.n_chars)
+        return mapped.read(start, max(start, end))
+
+    def _get_mapped(self, download_dir='/tmp') -> _MappedText:
+        if self._mapped is None:
+            if self.file_path is None:
+                file_path = os.path.join(download_dir, f"{uuid4()}.txt")
+                download_file(self.url, file_path)
+                self.file_path = file_path
+            self._mapped = _MappedText(self.file_path)
+        return self._mapped
+
+    def __getstate__(self):
+        # Memory maps can't be pickled. `_get_mapped` maps the file again when it is needed.
+        state = super().__getstate__()
+        state['__private_attribute_values__'] = {
+            **state['__private_attribute_values__'], '_mapped': None
+        }
+        return state
+
     def set_fetch_fn(self, fn):
         object.__setattr__(self, 'fetch_remote', lambda: fn(self))
 
@@ -0,0 +1,162 @@
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Callable, Optional, Tuple, Union
+
+import numpy as np
+
+from .cache import ByteLRUCache
+
+TileKey = Tuple[str, int, int, int]
+
+
+class TileCache:
+    """
+    Cache for XYZ map tiles that is shared by every `TiledImageData` in the process.
+    See `TiledImageData.set_tile_cache`.
+
+    Decoded tiles are kept in memory. Optionally, the downloaded tile bytes are also written to
+    `directory` so that they can be reused across processes and runs.
+    Tiles are keyed by the tile layer url template and (z, x, y).
+
+    >>> TiledImageData.set_tile_cache(
+    >>>     TileCache(max_bytes=512 * 1024 * 1024, directory="~/.cache/tiles",
+    >>>               max_disk_bytes=10 * 1024 ** 3, ttl_seconds=7 * 24 * 3600))
+
+    Args:
+        max_bytes: Memory budget for decoded tiles
+        directory: Optional directory for storing downloaded tiles
+        max_disk_bytes: Budget for tiles in `directory`. The oldest tiles are deleted once it is exceeded.
+            Defaults to no limit.
+        ttl_seconds: Tiles older than this are downloaded again. Defaults to never expiring.
+    """
+
+    def __init__(self,
+                 max_bytes: int = 256 * 1024 * 1024,
+                 directory: Optional[Union[str, Path]] = None,
+                 max_disk_bytes: Optional[int] = None,
+                 ttl_seconds: Optional[float] = None):
+        self.memory = ByteLRUCache(max_bytes,
+                                   sizeof=lambda entry: entry[1].nbytes)
+        self.directory = None if directory is None else Path(
+            directory).expanduser()
+        self.max_disk_bytes = max_disk_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        # Tile files by modification time, oldest first
+        self._files: "OrderedDict[Path, int]" = OrderedDict()
+        self._disk_bytes = 0
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._index_directory()
+
+    def fetch(self, url: str, z: int, x: int, y: int, download: Callable[[],
+                                                                         bytes],
+              decode: Callable[[bytes], np.ndarray]) -> np.ndarray:
+        """
+        Returns the cached tile or downloads and caches it.
+
+        Args:
+            url: The tile layer url template
+            z, x, y: The tile coordinates
+            download: Returns the encoded tile
+            decode: Converts the encoded tile to an array
+        Returns:
+            The decoded tile. Cached tiles are read only.
+        """
+        key = (url, z, x, y)
+        entry = self.memory.get(key)
+        if entry is not None and not self._expired(entry[0]):
+            return entry[1]
+
+        fetched_at, tile_bytes = self._read(key)
+        if tile_bytes is None:
+            tile_bytes = download()
+            fetched_at = time.time()
+            self._write(key, tile_bytes)
+        arr = decode(tile_bytes)
+        arr.flags.writeable = False
+        self.memory.put(key, (fetched_at, arr))
+        return arr
+
+    def clear(self) -> None:
+        """Removes all tiles from memory and `directory`"""
+        self.memory.clear()
+        with self._lock:
+            for path in self._files:
+                self._remove_file(path)
+            self._files.clear()
+            self._disk_bytes = 0
+
+    @property
+    def disk_bytes(self) -> int:
+        """Total size of the tiles in `directory`"""
+        return self._disk_bytes
+
+    def _expired(self, fetched_at: float) -> bool:
+        return self.ttl_seconds is not None and time.time(
+        ) - fetched_at > self.ttl_seconds
+
+    def _path(self, key: TileKey) -> Path:
+        url, z, x, y = key
+        layer = hashlib.sha256(url.encode()).hexdigest()[:16]
+        return self.directory / layer / str(z) / str(x) / str(y)
+
+    def _read(self, key: TileKey) -> Tuple[Optional[float], Optional[bytes]]:
+        if self.directory is None:
+            return None, None
+        path = self._path(key)
+        try:
+            fetched_at = path.stat().st_mtime
+            if self._expired(fetched_at):
+                return None, None
+            return fetched_at, path.read_bytes()
+        except OSError:
+            return None, None
+
+    def _write(self, key: TileKey, tile_bytes: bytes) -> None:
+        if self.directory is None:
+            return
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first so that readers never see a partial tile
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(tile_bytes)
+        os.replace(tmp_path, path)
+        with self._lock:
+            self._disk_bytes -= self._files.pop(path, 0)
+            self._files[path] = len(tile_bytes)
+            self._disk_bytes += len(tile_bytes)
+            self._evict()
+
+    def _evict(self) -> None:
+        while self.max_disk_bytes is not None and \
+                self._disk_bytes > self.max_disk_bytes and self._files:
+            evicted, size = self._files.popitem(last=False)
+            self._disk_bytes -= size
+            self._remove_file(evicted)
+
+    def _index_directory(self) -> None:
+        files = []
+        for path in self.directory.glob('*/*/*/*'):
+            if path.is_file() and not path.name.endswith('.tmp'):
+                stat = path.stat()
+                files.append((stat.st_mtime, path, stat.st_size))
+        for _, path, size in sorted(files):
+            self._files[path] = size
+            self._disk_bytes += size
+        self._evict()
+
+    @staticmethod
+    def _remove_file(path: Path) -> None:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(memory={self.memory!r}, " \
+               f"directory={self.directory}, disk_bytes={self._disk_bytes})"
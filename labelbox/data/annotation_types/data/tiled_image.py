@@ -2,8 +2,9 @@ from functools import lru_cache
 import math
 import logging
 from enum import Enum
-from typing import Optional, List, Tuple, Any, Union, Dict, Callable
-from concurrent.futures import ThreadPoolExecutor
+from typing import (Optional, List, Tuple, Any, Union, Dict, Callable,
+                    Generator, TYPE_CHECKING)
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import BytesIO
 
 import requests
@@ -11,6 +12,7 @@ import numpy as np
 from google.api_core import retry
 from PIL import Image
 from pyproj import Transformer
+from pygeotile.meta import ORIGIN_SHIFT, TILE_SIZE, resolution
 from pygeotile.point import Point as PygeoPoint
 from pydantic import BaseModel, validator
 from pydantic.class_validators import root_validator
@@ -18,6 +20,10 @@ from pydantic.class_validators import root_validator
 from labelbox.data.annotation_types import Rectangle, Point, Line, Polygon
 from .base_data import BaseData
 from .raster import RasterData
+from .tile_cache import TileCache
+
+if TYPE_CHECKING:
+    from labelbox.data.annotation_types import Label
 
 VALID_LAT_RANGE = range(-90, 90)
 VALID_LNG_RANGE = range(-180, 180)
@@ -26,6 +32,9 @@ TILE_DOWNLOAD_CONCURRENCY = 4
 
 logger = logging.getLogger(__name__)
 
+# Process wide cache of downloaded tiles. Disabled by default. See `TiledImageData.set_tile_cache`
+_tile_cache: Optional[TileCache] = None
+
 VectorTool = Union[Point, Line, Rectangle, Polygon]
 
 
@@ -139,6 +148,24 @@ class TiledImageData(BaseData):
         if self.max_native_zoom is None:
             self.max_native_zoom = self.zoom_levels[0]
 
+    @staticmethod
+    def set_tile_cache(cache: Optional[TileCache]) -> None:
+        """
+        Sets the tile cache shared by all `TiledImageData` objects so that overlapping labels
+        and repeated calls to `value` don't download the same tiles again.
+
+        >>> TiledImageData.set_tile_cache(TileCache(max_bytes=512 * 1024 * 1024, directory="/tmp/tiles"))
+
+        Args:
+            cache: The cache to use. None disables caching.
+        """
+        global _tile_cache
+        _tile_cache = cache
+
+    @staticmethod
+    def get_tile_cache() -> Optional[TileCache]:
+        return _tile_cache
+
     def asdict(self) -> Dict[str, str]:
         return {
             "tileLayerUrl": self.tile_layer.url,
@@ -159,12 +186,95 @@ class TiledImageData(BaseData):
     def raster_data(self,
                     zoom: int = 0,
                     max_tiles: int = 32,
-                    multithread=True) -> RasterData:
+                    multithread=True,
+                    concurrency: Optional[int] = None) -> RasterData:
         """Converts the tiled image asset into a RasterData object containing an
         np.ndarray.
 
         Uses the minimum zoom provided to render the image.
+
+        Args:
+            zoom: Zoom level of the tiles to render
+            max_tiles: Raises a ValueError if more tiles than this are required.
+                Use `raster_windows` to render large regions with bounded memory.
+            multithread: Whether to download tiles concurrently
+            concurrency: Number of concurrent tile downloads. Defaults to `TILE_DOWNLOAD_CONCURRENCY`
         """
+        xstart, ystart, xend, yend = self._get_tile_bounds(zoom)
+        self._validate_num_tiles(xstart, ystart, xend, yend, max_tiles)
+
+        rounded_tiles, pixel_offsets = list(
+            zip(*[
+                self._tile_to_pixel(pt) for pt in [xstart, ystart, xend, yend]
+            ]))
+
+        image = self._fetch_image_for_bounds(*rounded_tiles,
+                                             zoom,
+                                             multithread,
+                                             concurrency=concurrency)
+        arr = self._crop_to_bounds(image, *pixel_offsets)
+        return RasterData(arr=arr)
+
+    def raster_windows(
+        self,
+        zoom: int = 0,
+        window_tiles: int = 8,
+        multithread=True,
+        concurrency: Optional[int] = None
+    ) -> Generator[Tuple[Tuple[int, int], np.ndarray], None, None]:
+        """Renders the tiled image asset in windows of at most `window_tiles` x `window_tiles` tiles.
+
+        Only one window is held in memory at a time, so regions that require far more tiles
+        than `raster_data` allows can be processed. Placing every window at its offset
+        reproduces the image from `raster_data`.
+
+        >>> for (x, y), window in tiled_image_data.raster_windows(zoom=18):
+        >>>     image[y:y + window.shape[0], x:x + window.shape[1]] = window
+
+        Args:
+            zoom: Zoom level of the tiles to render
+            window_tiles: Number of tiles along each side of a window
+            multithread: Whether to download tiles concurrently
+            concurrency: Number of concurrent tile downloads. Defaults to `TILE_DOWNLOAD_CONCURRENCY`
+        Yields:
+            ((x, y) pixel offset of the window in the full image, window array)
+        """
+        if window_tiles < 1:
+            raise ValueError(
+                f"window_tiles must be at least 1. Found {window_tiles}")
+        rounded_tiles, pixel_offsets = list(
+            zip(*
+                [self._tile_to_pixel(pt)
+                 for pt in self._get_tile_bounds(zoom)]))
+        x_tile_start, y_tile_start, x_tile_end, y_tile_end = rounded_tiles
+        x_px_start, y_px_start, x_px_end, y_px_end = pixel_offsets
+        # Region of the full tile mosaic that is within the bounds. See `_crop_to_bounds`
+        right = (x_tile_end - x_tile_start) * self.tile_size + max(x_px_end, 1)
+        bottom = (y_tile_end - y_tile_start) * self.tile_size + max(y_px_end, 1)
+
+        with self._tile_session(concurrency) as session:
+            for y in range(y_tile_start, y_tile_end + 1, window_tiles):
+                for x in range(x_tile_start, x_tile_end + 1, window_tiles):
+                    image = self._fetch_image_for_bounds(
+                        x,
+                        y,
+                        min(x + window_tiles - 1, x_tile_end),
+                        min(y + window_tiles - 1, y_tile_end),
+                        zoom,
+                        multithread,
+                        concurrency=concurrency,
+                        session=session)
+                    # Position of the window in the full tile mosaic
+                    mosaic_x = (x - x_tile_start) * self.tile_size
+                    mosaic_y = (y - y_tile_start) * self.tile_size
+                    left = max(x_px_start - mosaic_x, 0)
+                    top = max(y_px_start - mosaic_y, 0)
+                    window = image[top:bottom - mosaic_y, left:right - mosaic_x]
+                    offset = (mosaic_x + left - x_px_start,
+                              mosaic_y + top - y_px_start)
+                    yield offset, window
+
+    def _get_tile_bounds(self, zoom: int) -> Tuple[float, float, float, float]:
         if self.tile_bounds.epsg == EPSG.SIMPLEPIXEL:
             xstart, ystart, xend, yend = self._get_simple_image_params(zoom)
         elif self.tile_bounds.epsg == EPSG.EPSG4326:
@@ -182,17 +292,7 @@ class TiledImageData(BaseData):
                 zoom, transforming_bounds)
         else:
             raise ValueError(f"Unsupported epsg found: {self.tile_bounds.epsg}")
-
-        self._validate_num_tiles(xstart, ystart, xend, yend, max_tiles)
-
-        rounded_tiles, pixel_offsets = list(
-            zip(*[
-                self._tile_to_pixel(pt) for pt in [xstart, ystart, xend, yend]
-            ]))
-
-        image = self._fetch_image_for_bounds(*rounded_tiles, zoom, multithread)
-        arr = self._crop_to_bounds(image, *pixel_offsets)
-        return RasterData(arr=arr)
+        return xstart, ystart, xend, yend
 
     @property
     def value(self) -> np.ndarray:
@@ -260,51 +360,105 @@ class TiledImageData(BaseData):
         pixel_offset = int(self.tile_size * remainder)
         return rounded_tile, pixel_offset
 
-    def _fetch_image_for_bounds(self,
-                                x_tile_start: int,
-                                y_tile_start: int,
-                                x_tile_end: int,
-                                y_tile_end: int,
-                                zoom: int,
-                                multithread=True) -> np.ndarray:
+    def _fetch_image_for_bounds(
+            self,
+            x_tile_start: int,
+            y_tile_start: int,
+            x_tile_end: int,
+            y_tile_end: int,
+            zoom: int,
+            multithread=True,
+            concurrency: Optional[int] = None,
+            session: Optional[requests.Session] = None) -> np.ndarray:
         """Fetches the tiles and combines them into a single image. 
         
-        If a tile cannot be fetched, a padding of expected tile size is instead added.
+        Tiles are written into the image as they finish downloading.
+        If a tile cannot be fetched, the tile is left as zeros.
         """
-
+        if session is None:
+            with self._tile_session(concurrency) as session:
+                return self._fetch_image_for_bounds(x_tile_start,
+                                                    y_tile_start,
+                                                    x_tile_end,
+                                                    y_tile_end,
+                                                    zoom,
+                                                    multithread,
+                                                    concurrency=concurrency,
+                                                    session=session)
+
+        tile_size = self.tile_size
+        image = np.zeros(((y_tile_end - y_tile_start + 1) * tile_size,
+                          (x_tile_end - x_tile_start + 1) * tile_size, 3),
+                         dtype=np.uint8)
+
+        def place(x: int, y: int, tile: np.ndarray) -> None:
+            tile = tile[:tile_size, :tile_size]
+            top, left = (y - y_tile_start) * tile_size, (
+                x - x_tile_start) * tile_size
+            image[top:top + tile.shape[0], left:left + tile.shape[1]] = tile
+
+        coords = [(x, y)
+                  for y in range(y_tile_start, y_tile_end + 1)
+                  for x in range(x_tile_start, x_tile_end + 1)]
         if multithread:
-            tiles = {}
-            with ThreadPoolExecutor(
-                    max_workers=TILE_DOWNLOAD_CONCURRENCY) as exc:
-                for x in range(x_tile_start, x_tile_end + 1):
-                    for y in range(y_tile_start, y_tile_end + 1):
-                        tiles[(x, y)] = exc.submit(self._fetch_tile, x, y, zoom)
-
-        rows = []
-        for y in range(y_tile_start, y_tile_end + 1):
-            row = []
-            for x in range(x_tile_start, x_tile_end + 1):
+            with ThreadPoolExecutor(max_workers=concurrency or
+                                    TILE_DOWNLOAD_CONCURRENCY) as exc:
+                futures = {
+                    exc.submit(self._fetch_tile, x, y, zoom, session): (x, y)
+                    for x, y in coords
+                }
+                for future in as_completed(futures):
+                    try:
+                        place(*futures[future], future.result())
+                    except Exception:
+                        pass
+        else:
+            for x, y in coords:
                 try:
-                    if multithread:
-                        row.append(tiles[(x, y)].result())
-                    else:
-                        row.append(self._fetch_tile(x, y, zoom))
-                except:
-                    row.append(
-                        np.zeros(shape=(self.tile_size, self.tile_size, 3),
-                                 dtype=np.uint8))
-            rows.append(np.hstack(row))
-
-        return np.vstack(rows)
+                    place(x, y, self._fetch_tile(x, y, zoom, session))
+                except Exception:
+                    pass
+        return image
 
-    @retry.Retry(initial=1, maximum=16, multiplier=2)
-    def _fetch_tile(self, x: int, y: int, z: int) -> np.ndarray:
+    @staticmethod
+    def _tile_session(concurrency: Optional[int] = None) -> requests.Session:
+        # Keeps a connection open for each concurrent download
+        pool_size = max(concurrency or TILE_DOWNLOAD_CONCURRENCY, 1)
+        adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size,
+                                                pool_maxsize=pool_size)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
+    def _fetch_tile(self,
+                    x: int,
+                    y: int,
+                    z: int,
+                    session: Optional[requests.Session] = None) -> np.ndarray:
         """
         Fetches the image and returns an np array.
         """
-        data = requests.get(self.tile_layer.url.format(x=x, y=y, z=z))
+        cache = _tile_cache
+        if cache is None:
+            return self._decode_tile(self._download_tile(x, y, z, session))
+        return cache.fetch(self.tile_layer.url, z, x, y,
+                           lambda: self._download_tile(x, y, z, session),
+                           self._decode_tile)
+
+    @retry.Retry(initial=1, maximum=16, multiplier=2)
+    def _download_tile(self,
+                       x: int,
+                       y: int,
+                       z: int,
+                       session: Optional[requests.Session] = None) -> bytes:
+        data = (session or
+                requests).get(self.tile_layer.url.format(x=x, y=y, z=z))
         data.raise_for_status()
-        decoded = np.array(Image.open(BytesIO(data.content)))[..., :3]
+        return data.content
+
+    def _decode_tile(self, tile_bytes: bytes) -> np.ndarray:
+        decoded = np.array(Image.open(BytesIO(tile_bytes)))[..., :3]
         if decoded.shape[:2] != (self.tile_size, self.tile_size):
             logger.warning(f"Unexpected tile size {decoded.shape}.")
         return decoded
@@ -389,7 +543,10 @@ class EPSGTransformer(BaseModel):
                       pixel_bounds: TiledBounds,
                       geo_bounds: TiledBounds,
                       zoom=0) -> Callable:
-        """method to change from one projection to simple projection"""
+        """method to change from one projection to simple projection
+
+        The returned function accepts scalars or arrays of coordinates.
+        """
 
         pixel_bounds = pixel_bounds.bounds
         geo_bounds_epsg = geo_bounds.epsg
@@ -407,53 +564,38 @@ class EPSGTransformer(BaseModel):
         #get the range of pixels for both sets of bounds to use as a multiplification factor
         local_x_range, local_y_range = cls._get_ranges(bounds=local_bounds)
         global_x_range, global_y_range = cls._get_ranges(bounds=global_bounds)
+        minx, _, miny, _ = cls._min_max_x_y(bounds=global_bounds)
 
         if src_epsg == EPSG.SIMPLEPIXEL:
+            transformer = _get_transformer(EPSG.EPSG4326, geo_bounds_epsg)
 
-            def transform(x: int, y: int) -> Callable[[int, int], Transformer]:
-                scaled_xy = (x * (global_x_range) / (local_x_range),
-                             y * (global_y_range) / (local_y_range))
-
-                minx, _, miny, _ = cls._min_max_x_y(bounds=global_bounds)
-                x, y = map(lambda i, j: i + j, scaled_xy, (minx, miny))
-
-                point = PygeoPoint.from_pixel(pixel_x=x, pixel_y=y,
-                                              zoom=zoom).latitude_longitude
+            def transform(x, y) -> Tuple[np.ndarray, np.ndarray]:
+                x = np.asarray(x) * global_x_range / local_x_range + minx
+                y = np.asarray(y) * global_y_range / local_y_range + miny
+                latitude, longitude = _pixels_to_latitude_longitude(x, y, zoom)
                 #convert to the desired epsg
-                return Transformer.from_crs(EPSG.EPSG4326.value,
-                                            geo_bounds_epsg.value,
-                                            always_xy=True).transform(
-                                                point[1], point[0])
+                return transformer.transform(longitude, latitude)
 
             return transform
 
         #handles 4326 from lat,lng
         elif src_epsg == EPSG.EPSG4326:
 
-            def transform(x: int, y: int) -> Callable[[int, int], Transformer]:
-                point_in_px = PygeoPoint.from_latitude_longitude(
-                    latitude=y, longitude=x).pixels(zoom)
-
-                minx, _, miny, _ = cls._min_max_x_y(global_bounds)
-                x, y = map(lambda i, j: i - j, point_in_px, (minx, miny))
-
-                return (x * (local_x_range) / (global_x_range),
-                        y * (local_y_range) / (global_y_range))
+            def transform(x, y) -> Tuple[np.ndarray, np.ndarray]:
+                x, y = _latitude_longitude_to_pixels(y, x, zoom)
+                return ((x - minx) * local_x_range / global_x_range,
+                        (y - miny) * local_y_range / global_y_range)
 
             return transform
 
         #handles 3857 from meters
         elif src_epsg == EPSG.EPSG3857:
 
-            def transform(x: int, y: int) -> Callable[[int, int], Transformer]:
-                point_in_px = PygeoPoint.from_meters(meter_y=y,
-                                                     meter_x=x).pixels(zoom)
-
-                minx, _, miny, _ = cls._min_max_x_y(global_bounds)
-                x, y = map(lambda i, j: i - j, point_in_px, (minx, miny))
-
-                return (x * (local_x_range) / (global_x_range),
-                        y * (local_y_range) / (global_y_range))
+            def transform(x, y) -> Tuple[np.ndarray, np.ndarray]:
+                x, y = _latitude_longitude_to_pixels(
+                    *_meters_to_latitude_longitude(x, y), zoom)
+                return ((x - minx) * local_x_range / global_x_range,
+                        (y - miny) * local_y_range / global_y_range)
 
             return transform
 
@@ -470,8 +612,8 @@ class EPSGTransformer(BaseModel):
                 f"Cannot be used for Simple transformations. Found {src_epsg} and {tgt_epsg}"
             )
 
-        return EPSGTransformer(transformer=Transformer.from_crs(
-            src_epsg.value, tgt_epsg.value, always_xy=True).transform)
+        return EPSGTransformer(
+            transformer=_get_transformer(src_epsg, tgt_epsg).transform)
 
     @classmethod
     def create_geo_to_pixel_transformer(
@@ -502,24 +644,138 @@ class EPSGTransformer(BaseModel):
                                                zoom=zoom)
         return EPSGTransformer(transformer=transform_function)
 
-    def _get_point_obj(self, point) -> Point:
-        point = self.transformer(point.x, point.y)
-        return Point(x=point[0], y=point[1])
+    def transform(
+            self, xs: Union[np.ndarray, List[float]],
+            ys: Union[np.ndarray,
+                      List[float]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Transforms arrays of x and y coordinates in a single call
+
+        Args:
+            xs: x coordinates (or longitudes)
+            ys: y coordinates (or latitudes)
+        Returns:
+            The transformed (xs, ys) as float arrays
+        """
+        xs, ys = self.transformer(np.asarray(xs, dtype=float),
+                                  np.asarray(ys, dtype=float))
+        return np.asarray(xs, dtype=float), np.asarray(ys, dtype=float)
+
+    def transform_label(self, label: "Label") -> "Label":
+        """Transforms every point, line, polygon and rectangle annotation of a label in place.
+
+        The coordinates of all annotations are transformed together in a single call.
+
+        Returns:
+            The label with the transformed annotations
+        """
+        annotations = [
+            annotation for annotation in label.annotations if isinstance(
+                getattr(annotation, 'value', None), VectorTool.__args__)
+        ]
+        shapes = self([annotation.value for annotation in annotations])
+        for annotation, shape in zip(annotations, shapes):
+            annotation.value = shape
+        return label
 
     def __call__(
         self, shape: Union[Point, Line, Rectangle, Polygon]
     ) -> Union[VectorTool, List[VectorTool]]:
         if isinstance(shape, list):
-            return [self(geom) for geom in shape]
-        if isinstance(shape, Point):
-            return self._get_point_obj(shape)
-        if isinstance(shape, Line):
-            return Line(points=[self._get_point_obj(p) for p in shape.points])
-        if isinstance(shape, Polygon):
-            return Polygon(
-                points=[self._get_point_obj(p) for p in shape.points])
-        if isinstance(shape, Rectangle):
-            return Rectangle(start=self._get_point_obj(shape.start),
-                             end=self._get_point_obj(shape.end))
-        else:
-            raise ValueError(f"Unsupported type found: {type(shape)}")
\ No newline at end of file
+            return self._transform_shapes(shape)
+        return self._transform_shapes([shape])[0]
+
+    def _transform_shapes(self, shapes: List[VectorTool]) -> List[VectorTool]:
+        # Packs the coordinates of every shape into one array so that they are transformed together.
+        # Lines and polygons are read and rebuilt as arrays, so no `Point` is created for their vertices.
+        coordinates = []
+        for shape in shapes:
+            if isinstance(shape, Point):
+                coordinates.append([(shape.x, shape.y)])
+            elif isinstance(shape, (Line, Polygon)):
+                coordinates.append(shape.coordinates)
+            elif isinstance(shape, Rectangle):
+                coordinates.append([(shape.start.x, shape.start.y),
+                                    (shape.end.x, shape.end.y)])
+            else:
+                raise ValueError(f"Unsupported type found: {type(shape)}")
+        if not coordinates:
+            return []
+
+        lengths = [len(coords) for coords in coordinates]
+        xy = np.concatenate(coordinates).astype(float).reshape(-1, 2)
+        xs, ys = self.transform(xy[:, 0], xy[:, 1])
+        xy = np.stack([xs, ys], axis=1)
+
+        transformed = []
+        offset = 0
+        for shape, length in zip(shapes, lengths):
+            shape_xy = xy[offset:offset + length]
+            offset += length
+            if isinstance(shape, Point):
+                transformed.append(Point(x=shape_xy[0, 0], y=shape_xy[0, 1]))
+            elif isinstance(shape, (Line, Polygon)):
+                transformed.append(type(shape).from_array(shape_xy))
+            else:
+                start, end = shape_xy.tolist()
+                transformed.append(
+                    Rectangle(start=Point(x=start[0], y=start[1]),
+                              end=Point(x=end[0], y=end[1])))
+        return transformed
+
+
+@lru_cache(maxsize=None)
+def _get_transformer(src_epsg: EPSG, tgt_epsg: EPSG) -> Transformer:
+    # Creating a Transformer is much slower than using one, so one is kept for each pair of EPSGs
+    return Transformer.from_crs(src_epsg.value, tgt_epsg.value, always_xy=True)
+
+
+# Vectorized versions of the conversions in `pygeotile.point.Point`
+
+
+def _latitude_longitude_to_pixels(latitude, longitude,
+                                  zoom: int) -> Tuple[np.ndarray, np.ndarray]:
+    latitude, longitude = np.asarray(latitude), np.asarray(longitude)
+    if ((longitude < -180) |
+        (longitude > 180)).any() or ((latitude < -90) | (latitude > 90)).any():
+        raise ValueError(
+            "Longitude needs to be a value between -180.0 and 180.0 and latitude between -90.0 and 90.0."
+        )
+    meter_x = longitude * ORIGIN_SHIFT / 180.0
+    meter_y = np.log(np.tan(
+        (90.0 + latitude) * np.pi / 360.0)) / (np.pi / 180.0)
+    meter_y = meter_y * ORIGIN_SHIFT / 180.0
+    pixel_x = (meter_x + ORIGIN_SHIFT) / resolution(zoom=zoom)
+    pixel_y = (meter_y - ORIGIN_SHIFT) / resolution(zoom=zoom)
+    return np.abs(np.round(pixel_x)), np.abs(np.round(pixel_y))
+
+
+def _meters_to_latitude_longitude(meter_x,
+                                  meter_y) -> Tuple[np.ndarray, np.ndarray]:
+    meter_x, meter_y = np.asarray(meter_x), np.asarray(meter_y)
+    if (np.abs(meter_x) > ORIGIN_SHIFT).any() or (np.abs(meter_y) >
+                                                  ORIGIN_SHIFT).any():
+        raise ValueError(
+            f"Meters need to be values between -{ORIGIN_SHIFT} and {ORIGIN_SHIFT}."
+        )
+    longitude = (meter_x / ORIGIN_SHIFT) * 180.0
+    latitude = (meter_y / ORIGIN_SHIFT) * 180.0
+    latitude = 180.0 / np.pi * (
+        2 * np.arctan(np.exp(latitude * np.pi / 180.0)) - np.pi / 2.0)
+    return latitude, longitude
+
+
+def _pixels_to_latitude_longitude(pixel_x, pixel_y,
+                                  zoom: int) -> Tuple[np.ndarray, np.ndarray]:
+    pixel_x, pixel_y = np.asarray(pixel_x), np.asarray(pixel_y)
+    max_pixel = (2**zoom) * TILE_SIZE
+    if ((pixel_x < 0) |
+        (pixel_x > max_pixel)).any() or ((pixel_y < 0) |
+                                         (pixel_y > max_pixel)).any():
+        raise ValueError(
+            "Pixels need to be values between 0 and (2^zoom) * 256.")
+    meter_x = np.abs(pixel_x * resolution(zoom) - ORIGIN_SHIFT)
+    meter_y = np.abs(pixel_y * resolution(zoom) - ORIGIN_SHIFT)
+    half_size = int((TILE_SIZE * 2**zoom) / 2)
+    meter_x = np.where(pixel_x < half_size, -meter_x, meter_x)
+    meter_y = np.where(pixel_y > half_size, -meter_y, meter_y)
+    return _meters_to_latitude_longitude(meter_x, meter_y)
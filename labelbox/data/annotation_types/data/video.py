@@ -1,7 +1,9 @@
+import hashlib
+import itertools
 import logging
 import os
-import urllib.request
-from typing import Callable, Dict, Generator, Optional, Tuple
+from typing import (Callable, Dict, Generator, Hashable, Iterable, List,
+                    Optional, Tuple)
 from typing_extensions import Literal
 from uuid import uuid4
 
@@ -11,10 +13,18 @@ from google.api_core import retry
 from pydantic import root_validator
 
 from .base_data import BaseData
+from .download import download_file
+from .frame_cache import FrameCache
 from ..types import TypedArray
 
 logger = logging.getLogger(__name__)
 
+# Forward gaps of at most this many frames are skipped by grabbing frames instead of seeking
+MAX_GRAB_FRAMES = 16
+
+# Process wide cache of decoded frames. Disabled by default. See `VideoData.set_frame_cache`
+_frame_cache: Optional[FrameCache] = None
+
 
 class VideoData(BaseData):
     """
@@ -24,10 +34,31 @@ class VideoData(BaseData):
     url: Optional[str] = None
     frames: Optional[Dict[int, TypedArray[Literal['uint8']]]] = None
 
+    @staticmethod
+    def set_frame_cache(cache: Optional[FrameCache]) -> None:
+        """
+        Sets a bounded cache of decoded frames that is shared by all `VideoData` objects.
+
+        Frames read by `get_frames`, `__getitem__` and `frame_generator(cache_frames=True)` are stored in the
+        cache instead of `frames`, so recently used frames can be revisited without keeping the whole video in memory.
+
+        >>> VideoData.set_frame_cache(FrameCache(max_bytes=2 * 1024 ** 3))
+
+        Args:
+            cache: The cache to use. None disables caching.
+        """
+        global _frame_cache
+        _frame_cache = cache
+
+    @staticmethod
+    def get_frame_cache() -> Optional[FrameCache]:
+        return _frame_cache
+
     def load_frames(self, overwrite: bool = False) -> None:
         """
         Loads all frames into memory at once in order to access in non-sequential order.
-        This will use a lot of memory, especially for longer videos
+        This will use a lot of memory, especially for longer videos.
+        See `get_frames` and `set_frame_cache` for reading frames with bounded memory.
 
         Args:
             overwrite: Replace existing frames
@@ -45,43 +76,179 @@ class VideoData(BaseData):
         return self.frame_generator()
 
     def frame_generator(
-            self,
-            cache_frames=False,
-            download_dir='/tmp'
+        self,
+        cache_frames=False,
+        download_dir='/tmp',
+        start: int = 0,
+        end: Optional[int] = None,
+        stride: int = 1,
+        timestamps: Optional[Iterable[float]] = None,
+        color: Literal['rgb', 'bgr'] = 'rgb'
     ) -> Generator[Tuple[int, np.ndarray], None, None]:
         """
         A generator for accessing individual frames in a video.
 
+        Frames that are not yielded are skipped without being converted, or seeked past for large strides.
+
+        >>> for idx, frame in video_data.frame_generator(stride=30):
+        >>> for idx, frame in video_data.frame_generator(timestamps=[1.5, 60.]):
+
         Args:
             cache_frames (bool): Whether or not to cache frames while iterating through the video.
+                Frames are stored in the frame cache if one is set (see `set_frame_cache`), otherwise in `frames`
+                once the whole video has been read. Without a frame cache, only reading every frame can be cached.
             download_dir (str): Directory to save the video to. Defaults to `/tmp` dir
+            start (int): Index of the first frame
+            end (Optional[int]): Index after the last frame. Defaults to the end of the video.
+            stride (int): Yields every `stride`th frame from `start`
+            timestamps (Optional[Iterable[float]]): Yields the frames closest to these times in seconds,
+                in ascending order, instead of using `start`, `end` and `stride`.
+            color (str): 'rgb' or 'bgr' (the order OpenCV decodes to). Frames are views of the decoded frame
+                either way, 'bgr' frames are also contiguous.
         """
+        if stride < 1 or start < 0:
+            raise ValueError(
+                f"stride must be positive and start non negative. Found {stride} and {start}"
+            )
+        if color not in ('rgb', 'bgr'):
+            raise ValueError(f"color must be 'rgb' or 'bgr'. Found {color}")
+
         if self.frames is not None:
+            if timestamps is not None:
+                raise ValueError(
+                    "timestamps require a video file_path or url to read the frame rate from"
+                )
             for idx, frame in self.frames.items():
-                yield idx, frame
+                if idx >= start and (end is None or
+                                     idx < end) and (idx - start) % stride == 0:
+                    yield idx, frame if color == 'rgb' else frame[:, :, ::-1]
             return
-        elif self.url and not self.file_path:
-            file_path = os.path.join(download_dir, f"{uuid4()}.mp4")
+
+        cache = _frame_cache
+        sampled = timestamps is not None or start != 0 or end is not None or stride != 1
+        if cache_frames and cache is None and sampled:
+            # `frames` is used as the whole video afterwards
+            raise ValueError(
+                "Sampled frames can only be cached in a frame cache. See `VideoData.set_frame_cache`"
+            )
+
+        vidcap = cv2.VideoCapture(self._get_file_path(download_dir))
+        if timestamps is not None:
+            fps = vidcap.get(cv2.CAP_PROP_FPS)
+            indices = sorted({round(t * fps) for t in timestamps})
+            if indices and indices[0] < 0:
+                raise ValueError("timestamps must be non negative")
+        elif end is None:
+            indices = itertools.count(start, stride)
+        else:
+            indices = range(start, end, stride)
+
+        # The key is computed once since it can require a stat of the file
+        key = self._frame_cache_key(
+        ) if cache_frames and cache is not None else None
+        frames = {}
+        try:
+            for idx, frame in _read_frames(vidcap, indices):
+                rgb = frame[:, :, ::-1]
+                if cache_frames:
+                    if cache is None:
+                        frames[idx] = rgb
+                    else:
+                        # Cached before the frame is yielded and possibly modified
+                        cache.put(key, idx, rgb)
+                yield idx, rgb if color == 'rgb' else frame
+        finally:
+            vidcap.release()
+        # Only set once every frame was read so that `frames` is never a partial video
+        if cache_frames and cache is None:
+            self.frames = frames
+
+    def get_frame(self, idx: int, download_dir='/tmp') -> np.ndarray:
+        """
+        Reads a single frame without decoding the frames before it. See `get_frames`.
+
+        Args:
+            idx (int): Index of the frame
+            download_dir (str): Directory to save the video to. Defaults to `/tmp` dir
+        """
+        return self.get_frames([idx], download_dir=download_dir)[0]
+
+    def get_frames(self,
+                   indices: Iterable[int],
+                   download_dir='/tmp') -> List[np.ndarray]:
+        """
+        Reads frames in any order without decoding the whole video.
+
+        Frames are read in ascending order. The video seeks to each frame through the keyframe index
+        of the container, and short forward gaps are skipped without converting the frames in between.
+        The cost depends on the number of frames requested rather than the length of the video.
+        Frames in the frame cache (see `set_frame_cache`) are not read again.
+
+        >>> first, last = video_data.get_frames([0, 42000])
+
+        Args:
+            indices (Iterable[int]): Indices of the frames
+            download_dir (str): Directory to save the video to. Defaults to `/tmp` dir
+        Returns:
+            The RGB frames in the same order as `indices`
+        """
+        indices = list(indices)
+        if self.frames is not None:
+            missing = [idx for idx in indices if idx not in self.frames]
+            if missing:
+                raise ValueError(f"Frames {missing} were not found in frames")
+            return [self.frames[idx] for idx in indices]
+        if any(idx < 0 for idx in indices):
+            raise ValueError(
+                f"Frame indices must be non negative. Found {min(indices)}")
+
+        frames = {}
+        cache = _frame_cache
+        if cache is not None:
+            key = self._frame_cache_key()
+            for idx in set(indices):
+                frame = cache.get(key, idx)
+                if frame is not None:
+                    frames[idx] = frame
+        missing = sorted(set(indices) - frames.keys())
+        if not missing:
+            return [frames[idx] for idx in indices]
+
+        vidcap = cv2.VideoCapture(self._get_file_path(download_dir))
+        try:
+            for idx, frame in _read_frames(vidcap, missing):
+                frames[idx] = frame[:, :, ::-1]
+                if cache is not None:
+                    cache.put(key, idx, frames[idx])
+        finally:
+            vidcap.release()
+        for idx in missing:
+            if idx not in frames:
+                raise ValueError(f"Frame {idx} is out of range")
+        return [frames[idx] for idx in indices]
+
+    def _get_file_path(self, download_dir: str) -> str:
+        # Downloads the video if it is only available as a url.
+        # The path only depends on the url so that another attempt resumes an interrupted download.
+        if self.url and not self.file_path:
+            name = hashlib.sha256(self.url.encode()).hexdigest()[:32]
+            file_path = os.path.join(download_dir, f"{name}.mp4")
             logger.info("Downloading the video locally to %s", file_path)
             self.fetch_remote(file_path)
             self.file_path = file_path
+        return self.file_path
 
-        vidcap = cv2.VideoCapture(self.file_path)
-
-        success, frame = vidcap.read()
-        count = 0
-        if cache_frames:
-            self.frames = {}
-        while success:
-            frame = frame[:, :, ::-1]
-            yield count, frame
-            if cache_frames:
-                self.frames[count] = frame
-            success, frame = vidcap.read()
-            count += 1
+    def _frame_cache_key(self) -> Hashable:
+        if self.url is not None:
+            return ('url', self.url)
+        stat = os.stat(self.file_path)
+        return ('file_path', os.path.abspath(self.file_path), stat.st_size,
+                stat.st_mtime_ns)
 
     def __getitem__(self, idx: int) -> np.ndarray:
-        if self.frames is None:
+        if self.frames is None and _frame_cache is not None:
+            return self.get_frame(idx)
+        elif self.frames is None:
             raise ValueError(
                 "Cannot select by index without iterating over the entire video or loading all frames."
             )
@@ -90,18 +257,21 @@ class VideoData(BaseData):
     def set_fetch_fn(self, fn):
         object.__setattr__(self, 'fetch_remote', lambda: fn(self))
 
-    @retry.Retry(deadline=15.)
     def fetch_remote(self, local_path) -> None:
         """
         Method for downloading data from self.url
 
+        The video is downloaded with concurrent range requests that are retried individually.
+        An interrupted download resumes from the chunks already saved when it is fetched again
+        and a completed download is not fetched again. See `download_file`.
+
         If url is not publicly accessible or requires another access pattern
         simply override this function
 
         Args:
             local_path: Where to save the thing too.
         """
-        urllib.request.urlretrieve(self.url, local_path)
+        download_file(self.url, local_path)
 
     @retry.Retry(deadline=15.)
     def create_url(self, signer: Callable[[bytes], str]) -> None:
@@ -167,3 +337,22 @@ class VideoData(BaseData):
     class Config:
         # Required for discriminating between data types
         extra = 'forbid'
+
+
+def _read_frames(
+        vidcap: cv2.VideoCapture, indices: Iterable[int]
+) -> Generator[Tuple[int, np.ndarray], None, None]:
+    # Reads the BGR frames at ascending `indices` until the video ends.
+    # Short forward gaps are grabbed without converting the frames, otherwise the video seeks.
+    position = 0
+    for idx in indices:
+        if idx < position or idx - position > MAX_GRAB_FRAMES:
+            vidcap.set(cv2.CAP_PROP_POS_FRAMES, idx)
+            position = idx
+        while position < idx and vidcap.grab():
+            position += 1
+        success, frame = vidcap.read()
+        if position != idx or not success:
+            return
+        position += 1
+        yield idx, frame
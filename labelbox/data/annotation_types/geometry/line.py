@@ -4,27 +4,31 @@ import geojson
 import numpy as np
 import cv2
 from pydantic import validator
-from shapely.geometry import LineString as SLineString
+from shapely.geometry import LineString as SLineString, MultiLineString as SMultiLineString
 
 from .point import Point
-from .geometry import Geometry
+from .point_sequence import PointSequence
 
 
-class Line(Geometry):
+class Line(PointSequence):
     """Line annotation
 
     Args:
         points (List[Point]): A list of `Point` geometries
 
     >>> Line(points = [Point(x=3,y=4), Point(x=3,y=5)])
+    >>> Line.from_array(np.array([[3, 4], [3, 5]]))
 
     """
     points: List[Point]
 
     @property
     def geometry(self) -> geojson.MultiLineString:
-        return geojson.MultiLineString(
-            [[[point.x, point.y] for point in self.points]])
+        return geojson.MultiLineString([self.coordinates.tolist()])
+
+    @property
+    def shapely(self) -> SMultiLineString:
+        return SMultiLineString([self.coordinates])
 
     @classmethod
     def from_shapely(cls, shapely_obj: SLineString) -> "Line":
@@ -33,9 +37,7 @@ class Line(Geometry):
             raise TypeError(
                 f"Expected Shapely Line. Got {shapely_obj.geom_type}")
 
-        obj_coords = shapely_obj.__geo_interface__['coordinates']
-        return Line(
-            points=[Point(x=coords[0], y=coords[1]) for coords in obj_coords])
+        return Line.from_array(shapely_obj.coords)
 
     def draw(self,
              height: Optional[int] = None,
@@ -56,7 +58,7 @@ class Line(Geometry):
             numpy array representing the mask with the line drawn on it.
         """
         canvas = self.get_or_create_canvas(height, width, canvas)
-        pts = np.array(self.geometry['coordinates']).astype(np.int32)
+        pts = self.coordinates.astype(np.int32)[np.newaxis]
         return cv2.polylines(canvas,
                              pts,
                              False,
@@ -71,3 +73,11 @@ class Line(Geometry):
             )
 
         return points
+
+    @classmethod
+    def validate_array(cls, arr: np.ndarray) -> np.ndarray:
+        if len(arr) < 2:
+            raise ValueError(
+                f"A line must have at least 2 points to be valid. Found {arr.tolist()}"
+            )
+        return arr
@@ -1,11 +1,15 @@
-from typing import Callable, Optional, Tuple, Union, Dict, List
+from typing import Any, Callable, Optional, Tuple, Union, Dict, List
 
 import numpy as np
 from pydantic.class_validators import validator
+from pydantic import PrivateAttr
 from shapely.geometry import MultiPolygon, Polygon
+from shapely.geometry.base import BaseGeometry
 import cv2
 
-from ..data import MaskData
+from ..data import MaskData, RunLengthEncoding
+from ..data.label_map import pack_color
+from ..signing import SigningCache
 from .geometry import Geometry
 
 
@@ -35,12 +39,94 @@ class Mask(Geometry):
     mask: MaskData
     color: Union[Tuple[int, int, int], int]
 
+    # (label map or rle, packed color, polygons) of the last traced mask
+    _shapely: Optional[Tuple[Any, int, BaseGeometry]] = PrivateAttr(None)
+
+    @property
+    def rle(self) -> Optional[RunLengthEncoding]:
+        """
+        The run length encoding of this mask if its `MaskData` is stored as one, otherwise None.
+
+        Area, bounding box and iou can be computed from the runs without drawing the mask.
+        """
+        if self.mask.arr is None and self.mask.rle is not None:
+            if pack_color(self.color) == pack_color(1):
+                return self.mask.rle
+        return None
+
     @property
     def geometry(self) -> Dict[str, Tuple[int, int, int]]:
-        mask = self.draw(color=1)
-        contours, hierarchy = cv2.findContours(image=mask,
-                                               mode=cv2.RETR_TREE,
-                                               method=cv2.CHAIN_APPROX_NONE)
+        return self.shapely.__geo_interface__
+
+    @property
+    def shapely(self) -> BaseGeometry:
+        """
+        Polygons traced from the outline of the mask.
+
+        The result is cached until `mask` or `color` change (or the field of `mask` that its value is read from).
+        """
+        source = self.rle if self.rle is not None else self.mask.label_map
+        color = pack_color(self.color)
+        if self._shapely is not None:
+            cached_source, cached_color, polygons = self._shapely
+            if cached_source is source and cached_color == color:
+                return polygons
+
+        if self.rle is not None:
+            bbox = self.rle.bbox
+            region = None if bbox is None else self.rle.to_array()[
+                bbox[1]:bbox[3], bbox[0]:bbox[2]]
+        else:
+            bbox = source.bbox(self.color)
+            region = source.mask(self.color, crop=True)
+        polygons = self._trace(region, bbox)
+        self._shapely = (source, color, polygons)
+        return polygons
+
+    @staticmethod
+    def extract_shapely(
+        mask_data: MaskData,
+        colors: Optional[List[Union[int, Tuple[int, int, int]]]] = None
+    ) -> Dict[Tuple[int, int, int], BaseGeometry]:
+        """
+        Traces the polygons of every color in a `MaskData` in one pass over its label map.
+
+        Each color only processes the pixels within its bounding box. This is faster
+        than accessing `Mask.shapely` for every color when the masks aren't needed as `Mask` objects.
+
+        Args:
+            mask_data: The mask to trace
+            colors: Colors to trace. Defaults to every color except black (0, 0, 0)
+        Returns:
+            Polygons (the same as `Mask.shapely`) by rgb color
+        """
+        label_map = mask_data.label_map
+        if colors is None:
+            colors = [
+                tuple(color)
+                for color in label_map.colors.tolist()
+                if any(color)
+            ]
+        polygons = {}
+        for color in colors:
+            rgb = tuple(color) if isinstance(color,
+                                             (tuple, list)) else (color,) * 3
+            polygons[rgb] = Mask._trace(label_map.mask(color, crop=True),
+                                        label_map.bbox(color))
+        return polygons
+
+    @staticmethod
+    def _trace(region: np.ndarray, bbox: Optional[Tuple[int, int, int,
+                                                        int]]) -> BaseGeometry:
+        # Only the bounding box of the mask (`region`), with a background border, is searched for contours
+        if bbox is None:
+            contours, hierarchy = [], None
+        else:
+            xmin, ymin = bbox[:2]
+            contours, hierarchy = cv2.findContours(image=np.pad(region, 1),
+                                                   mode=cv2.RETR_TREE,
+                                                   method=cv2.CHAIN_APPROX_NONE,
+                                                   offset=(xmin - 1, ymin - 1))
 
         holes = []
         external_contours = []
@@ -51,10 +137,10 @@ class Mask(Geometry):
             else:
                 external_contours.append(contours[i])
 
-        external_polygons = self._extract_polygons_from_contours(
+        external_polygons = Mask._extract_polygons_from_contours(
             external_contours)
-        holes = self._extract_polygons_from_contours(holes)
-        return external_polygons.difference(holes).__geo_interface__
+        holes = Mask._extract_polygons_from_contours(holes)
+        return external_polygons.difference(holes)
 
     def draw(self,
              height: Optional[int] = None,
@@ -79,8 +165,9 @@ class Mask(Geometry):
                 as opposed to the mask that this object references which might have multiple objects determined by colors
         """
 
-        mask = self.mask.value
-        mask = np.alltrue(mask == self.color, axis=2).astype(np.uint8)
+        rle = self.rle
+        mask = rle.to_array() if rle is not None else self.mask.label_map.mask(
+            self.color)
 
         if height is not None or width is not None:
             mask = cv2.resize(mask,
@@ -96,23 +183,27 @@ class Mask(Geometry):
         canvas[mask.astype(bool)] = color
         return canvas
 
-    def _extract_polygons_from_contours(self, contours: List) -> MultiPolygon:
+    @staticmethod
+    def _extract_polygons_from_contours(contours: List) -> MultiPolygon:
         contours = map(np.squeeze, contours)
         filtered_contours = filter(lambda contour: len(contour) > 2, contours)
         polygons = map(Polygon, filtered_contours)
         return MultiPolygon(polygons)
 
-    def create_url(self, signer: Callable[[bytes], str]) -> str:
+    def create_url(self,
+                   signer: Callable[[bytes], str],
+                   signing_cache: Optional[SigningCache] = None) -> str:
         """
         Update the segmentation mask to have a url.
         Only update the mask if it doesn't already have a url
 
         Args:
             signer: A function that accepts bytes and returns a signed url.
+            signing_cache: Optional cache for reusing the url of identical masks.
         Returns:
             the url for the mask
         """
-        return self.mask.create_url(signer)
+        return self.mask.create_url(signer, signing_cache=signing_cache)
 
     @validator('color')
     def is_valid_color(cls, color):
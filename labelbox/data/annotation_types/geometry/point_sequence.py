@@ -0,0 +1,80 @@
+from typing import Any, List, Optional
+
+import numpy as np
+from pydantic import PrivateAttr
+
+from .geometry import Geometry
+from .point import Point
+
+
+class PointSequence(Geometry):
+    """Base class for geometries that are defined by a list of points (lines and polygons)
+
+    The points can either be provided as a list of `Point` objects or as an (N, 2) array with `from_array`.
+    Array backed geometries only create `Point` objects when `points` is accessed
+    (this includes `dict()`, `json()`, `copy()` and `==`).
+    After that, `points` is the source of truth and can be modified as usual.
+
+    >>> Polygon.from_array(np.array([[0, 0], [1, 0], [1, 1]]))
+
+    """
+    points: List[Point]
+    _array: Optional[np.ndarray] = PrivateAttr(None)
+
+    @classmethod
+    def from_array(cls, arr: Any) -> "PointSequence":
+        """Creates the geometry from an (N, 2) array of x, y coordinates without creating `Point` objects.
+
+        Args:
+            arr: (N, 2) array or nested list of x, y coordinates. The values are copied.
+        """
+        arr = np.array(arr, dtype=np.float64)
+        if arr.ndim != 2 or arr.shape[1] != 2:
+            raise ValueError(
+                f"Expected an array with shape (N, 2). Found {arr.shape}")
+        arr = cls.validate_array(arr)
+        arr.flags.writeable = False
+        geometry = cls.construct(_fields_set={'points'})
+        geometry._array = arr
+        return geometry
+
+    @classmethod
+    def validate_array(cls, arr: np.ndarray) -> np.ndarray:
+        """Equivalent of the `points` validator for array backed geometries."""
+        return arr
+
+    @property
+    def coordinates(self) -> np.ndarray:
+        """Read only (N, 2) array of x, y coordinates"""
+        if self._array is not None:
+            return self._array
+        arr = np.array([[point.x, point.y] for point in self.points],
+                       dtype=np.float64).reshape(-1, 2)
+        arr.flags.writeable = False
+        return arr
+
+    def __getattr__(self, name: str) -> Any:
+        # `points` is missing from `__dict__` until it is first accessed
+        if name == 'points' and self._array is not None:
+            points = [
+                Point.construct(x=x, y=y) for x, y in self._array.tolist()
+            ]
+            self.__dict__['points'] = points
+            self._array = None
+            return points
+        raise AttributeError(
+            f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name == 'points':
+            self._array = None
+        super().__setattr__(name, value)
+
+    def _iter(self, *args, **kwargs):
+        # pydantic reads fields directly from `__dict__` when exporting or comparing models
+        self.points
+        return super()._iter(*args, **kwargs)
+
+    def __repr_args__(self):
+        self.points
+        return super().__repr_args__()
@@ -6,16 +6,17 @@ import numpy as np
 from pydantic import validator
 from shapely.geometry import Polygon as SPolygon
 
-from .geometry import Geometry
 from .point import Point
+from .point_sequence import PointSequence
 
 
-class Polygon(Geometry):
+class Polygon(PointSequence):
     """Polygon geometry
 
     A polygon is created from a collection of points
 
     >>> Polygon(points=[Point(x=0, y=0), Point(x=1, y=0), Point(x=1, y=1), Point(x=0, y=0)])
+    >>> Polygon.from_array(np.array([[0, 0], [1, 0], [1, 1]]))
 
     Args:
         points (List[Point]): List of `Points`, minimum of three points. If you do not
@@ -27,9 +28,14 @@ class Polygon(Geometry):
 
     @property
     def geometry(self) -> geojson.Polygon:
-        if self.points[0] != self.points[-1]:
-            self.points.append(self.points[0])
-        return geojson.Polygon([[(point.x, point.y) for point in self.points]])
+        coords = [(x, y) for x, y in self.coordinates.tolist()]
+        if coords[0] != coords[-1]:
+            coords.append(coords[0])
+        return geojson.Polygon([coords])
+
+    @property
+    def shapely(self) -> SPolygon:
+        return SPolygon(self.coordinates)
 
     @classmethod
     def from_shapely(cls, shapely_obj: SPolygon) -> "Polygon":
@@ -38,9 +44,7 @@ class Polygon(Geometry):
         if not isinstance(shapely_obj, SPolygon):
             raise TypeError(
                 f"Expected Shapely Polygon. Got {shapely_obj.geom_type}")
-        obj_coords = shapely_obj.__geo_interface__['coordinates'][0]
-        return Polygon(
-            points=[Point(x=coords[0], y=coords[1]) for coords in obj_coords])
+        return Polygon.from_array(shapely_obj.exterior.coords)
 
     def draw(self,
              height: Optional[int] = None,
@@ -61,7 +65,7 @@ class Polygon(Geometry):
             numpy array representing the mask with the polygon drawn on it.
         """
         canvas = self.get_or_create_canvas(height, width, canvas)
-        pts = np.array(self.geometry['coordinates']).astype(np.int32)
+        pts = self.coordinates.astype(np.int32)[np.newaxis]
         if thickness == -1:
             return cv2.fillPoly(canvas, pts, color)
         return cv2.polylines(canvas, pts, True, color, thickness)
@@ -76,3 +80,13 @@ class Polygon(Geometry):
             points.append(points[0])
 
         return points
+
+    @classmethod
+    def validate_array(cls, arr: np.ndarray) -> np.ndarray:
+        if len(arr) < 3:
+            raise ValueError(
+                f"A polygon must have at least 3 points to be valid. Found {arr.tolist()}"
+            )
+        if (arr[0] != arr[-1]).any():
+            arr = np.vstack([arr, arr[:1]])
+        return arr
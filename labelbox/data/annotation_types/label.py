@@ -1,7 +1,10 @@
 from collections import defaultdict
-from typing import Any, Callable, Dict, List, Union, Optional
+from functools import wraps
+from typing import Any, Callable, Dict, List, Mapping, Type, Union, Optional
 
-from pydantic import BaseModel, validator
+from typing_extensions import Literal
+import numpy as np
+from pydantic import BaseModel, PrivateAttr, validator
 
 import labelbox
 from labelbox.data.annotation_types.data.tiled_image import TiledImageData
@@ -12,8 +15,95 @@ from .classification import ClassificationAnswer
 from .data import VideoData, TextData, ImageData
 from .geometry import Mask
 from .metrics import ScalarMetric, ConfusionMatrixMetric
+from .rasterize import rasterize_annotations
+from .signing import SigningCache
 from .types import Cuid
-from ..ontology import get_feature_schema_lookup
+from ..ontology import OntologyIndex
+
+
+def _mutates(method):
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class _AnnotationList(list):
+    """
+    List that counts modifications so that lookups derived from it can be lazily invalidated.
+    """
+    version = 0
+
+    append = _mutates(list.append)
+    extend = _mutates(list.extend)
+    insert = _mutates(list.insert)
+    remove = _mutates(list.remove)
+    pop = _mutates(list.pop)
+    clear = _mutates(list.clear)
+    sort = _mutates(list.sort)
+    reverse = _mutates(list.reverse)
+    __setitem__ = _mutates(list.__setitem__)
+    __delitem__ = _mutates(list.__delitem__)
+    __iadd__ = _mutates(list.__iadd__)
+    __imul__ = _mutates(list.__imul__)
+
+
+class _AnnotationIndex:
+    """
+    Lookups of a label's annotations by type, feature and frame.
+    Each lookup is built on first use from a single pass over the annotations.
+    """
+
+    def __init__(self, annotations: _AnnotationList):
+        self.annotations = annotations
+        self.version = annotations.version
+        self._by_type = {}
+        self._by_name = None
+        self._by_schema_id = None
+        self._by_frame = None
+
+    def is_valid(self, annotations: List) -> bool:
+        return annotations is self.annotations and annotations.version == self.version
+
+    def by_type(self, annotation_type: Type) -> List:
+        if annotation_type not in self._by_type:
+            self._by_type[annotation_type] = [
+                annot for annot in self.annotations
+                if isinstance(annot, annotation_type)
+            ]
+        return self._by_type[annotation_type]
+
+    def by_name(self) -> Dict[str, List]:
+        if self._by_name is None:
+            self._by_name = self._group(lambda annot: annot.name)
+        return self._by_name
+
+    def by_schema_id(self) -> Dict[str, List]:
+        if self._by_schema_id is None:
+            self._by_schema_id = self._group(
+                lambda annot: annot.feature_schema_id)
+        return self._by_schema_id
+
+    def by_frame(self) -> Dict[int, List]:
+        if self._by_frame is None:
+            self._by_frame = defaultdict(list)
+            for annotation in self.by_type(
+                (VideoObjectAnnotation, VideoClassificationAnnotation)):
+                self._by_frame[annotation.frame].append(annotation)
+        return self._by_frame
+
+    def _group(self, get_key: Callable) -> Dict[str, List]:
+        groups = defaultdict(list)
+        for annotation in self.annotations:
+            key = get_key(annotation) if isinstance(
+                annotation,
+                (ObjectAnnotation, ClassificationAnnotation)) else None
+            if key is not None:
+                groups[key].append(annotation)
+        return groups
 
 
 class Label(BaseModel):
@@ -43,6 +133,8 @@ class Label(BaseModel):
                             ConfusionMatrixMetric]] = []
     extra: Dict[str, Any] = {}
 
+    _index: Optional[_AnnotationIndex] = PrivateAttr(None)
+
     def object_annotations(self) -> List[ObjectAnnotation]:
         return self._get_annotations_by_type(ObjectAnnotation)
 
@@ -50,21 +142,96 @@ class Label(BaseModel):
         return self._get_annotations_by_type(ClassificationAnnotation)
 
     def _get_annotations_by_type(self, annotation_type):
-        return [
-            annot for annot in self.annotations
-            if isinstance(annot, annotation_type)
-        ]
+        index = self._get_index()
+        if index is None:
+            return [
+                annot for annot in self.annotations
+                if isinstance(annot, annotation_type)
+            ]
+        return list(index.by_type(annotation_type))
 
     def frame_annotations(
         self
     ) -> Dict[str, Union[VideoObjectAnnotation, VideoClassificationAnnotation]]:
-        frame_dict = defaultdict(list)
-        for annotation in self.annotations:
-            if isinstance(
-                    annotation,
-                (VideoObjectAnnotation, VideoClassificationAnnotation)):
-                frame_dict[annotation.frame].append(annotation)
-        return frame_dict
+        index = self._get_index()
+        if index is None:
+            index = _AnnotationIndex(self.annotations)
+        return defaultdict(
+            list, {
+                frame: list(annotations)
+                for frame, annotations in index.by_frame().items()
+            })
+
+    def feature_annotations(
+        self,
+        name: Optional[str] = None,
+        feature_schema_id: Optional[Cuid] = None
+    ) -> List[Union[ObjectAnnotation, ClassificationAnnotation]]:
+        """
+        Returns all object and classification annotations with the given name or feature schema id.
+
+        Lookups are indexed the first time they are used and the index is rebuilt
+        whenever `annotations` is modified. Changes made directly to the annotation objects
+        (e.g. setting a new name) are not tracked.
+
+        Args:
+            name: feature name to match
+            feature_schema_id: feature schema id to match
+        Returns:
+            annotations for the feature in the order they appear in the label
+        """
+        if (name is None) == (feature_schema_id is None):
+            raise ValueError(
+                "Must set exactly one of `name` or `feature_schema_id`.")
+        index = self._get_index()
+        if index is None:
+            index = _AnnotationIndex(self.annotations)
+        if name is not None:
+            return list(index.by_name().get(name, []))
+        return list(index.by_schema_id().get(feature_schema_id, []))
+
+    def _get_index(self) -> Optional[_AnnotationIndex]:
+        # Only annotations that can report modifications are indexed.
+        # Annotations assigned as a plain list are scanned on every call.
+        if not isinstance(self.annotations, _AnnotationList):
+            return None
+        if self._index is None or not self._index.is_valid(self.annotations):
+            self._index = _AnnotationIndex(self.annotations)
+        return self._index
+
+    def rasterize(self,
+                  height: Optional[int] = None,
+                  width: Optional[int] = None,
+                  mode: Literal['semantic', 'instance'] = 'semantic',
+                  class_map: Optional[Dict[str, int]] = None) -> np.ndarray:
+        """
+        Draws all object annotations onto one int32 canvas.
+
+        >>> semantic = label.rasterize(class_map={"dog": 1, "cat": 2})
+        >>> instances = label.rasterize(mode='instance')
+
+        Args:
+            height: Height of the canvas. Defaults to the height of the image.
+            width: Width of the canvas. Defaults to the width of the image.
+            mode: 'semantic' draws the class value from `class_map` for each annotation.
+                'instance' draws 1, 2, ... for each annotation in the order they are drawn.
+            class_map: Value to draw for each annotation name (or feature schema id if the name isn't set).
+                Annotations without a value in `class_map` are not drawn.
+                Defaults to 1, 2, ... for each name in the order they first appear.
+        Returns:
+            int32 array with shape (height, width). Pixels without an annotation are 0.
+        """
+        if height is None or width is None:
+            if not isinstance(self.data, ImageData):
+                raise ValueError(
+                    "height and width are required for non image data")
+            data_height, data_width, _ = self.data.shape
+            height, width = height or data_height, width or data_width
+        return rasterize_annotations(self.object_annotations(),
+                                     height,
+                                     width,
+                                     mode=mode,
+                                     class_map=class_map)
 
     def add_url_to_data(self, signer) -> "Label":
         """
@@ -79,7 +246,10 @@ class Label(BaseModel):
         self.data.create_url(signer)
         return self
 
-    def add_url_to_masks(self, signer) -> "Label":
+    def add_url_to_masks(
+            self,
+            signer,
+            signing_cache: Optional[SigningCache] = None) -> "Label":
         """
         Creates signed urls for all masks in the Label.
         Multiple masks can reference the same MaskData mask so this makes sure we only upload that url once.
@@ -87,21 +257,19 @@ class Label(BaseModel):
 
         Args:
             signer: A function that accepts bytes and returns a signed url.
+            signing_cache: Optional cache shared between labels so that identical
+                mask content is only uploaded once.
         Returns:
             Label with updated references to new mask url
         """
-        masks = []
-        for annotation in self.annotations:
-            # Allows us to upload shared masks once
-            if isinstance(annotation.value, Mask):
-                in_list = False
-                for mask in masks:
-                    if annotation.value.mask is mask:
-                        in_list = True
-                if not in_list:
-                    masks.append(annotation.value.mask)
-        for mask in masks:
-            mask.create_url(signer)
+        # Allows us to upload shared masks once
+        masks = {
+            id(annotation.value.mask): annotation.value.mask
+            for annotation in self.annotations
+            if isinstance(annotation.value, Mask)
+        }
+        for mask in masks.values():
+            mask.create_url(signer, signing_cache=signing_cache)
         return self
 
     def create_data_row(self, dataset: "labelbox.Dataset",
@@ -127,18 +295,23 @@ class Label(BaseModel):
         return self
 
     def assign_feature_schema_ids(
-            self, ontology_builder: ontology.OntologyBuilder) -> "Label":
+        self, ontology_builder: Union[ontology.OntologyBuilder, OntologyIndex]
+    ) -> "Label":
         """
         Adds schema ids to all FeatureSchema objects in the Labels.
         This is necessary for MAL.
 
         Args:
-            ontology_builder: The ontology that matches the feature names assigned to objects in this dataset
+            ontology_builder: The ontology that matches the feature names assigned to objects in this dataset.
+                Pass an `OntologyIndex` to avoid recompiling the ontology when assigning ids to many labels.
         Returns:
             Label. useful for chaining these modifying functions
         """
-        tool_lookup, classification_lookup = get_feature_schema_lookup(
-            ontology_builder)
+        if not isinstance(ontology_builder, OntologyIndex):
+            ontology_builder = OntologyIndex.from_ontology_builder(
+                ontology_builder)
+        tool_lookup = ontology_builder.tools
+        classification_lookup = ontology_builder.classifications
         for annotation in self.annotations:
             if isinstance(annotation, ClassificationAnnotation):
                 self._assign_or_raise(annotation, classification_lookup)
@@ -151,9 +324,11 @@ class Label(BaseModel):
             else:
                 raise TypeError(
                     f"Unexpected type found for annotation. {type(annotation)}")
+        # Schema ids changed so the feature lookups are stale
+        self._index = None
         return self
 
-    def _assign_or_raise(self, annotation, lookup: Dict[str, str]) -> None:
+    def _assign_or_raise(self, annotation, lookup: Mapping[str, str]) -> None:
         if annotation.feature_schema_id is not None:
             return
 
@@ -164,7 +339,7 @@ class Label(BaseModel):
         annotation.feature_schema_id = feature_schema_id
 
     def _assign_option(self, classification: ClassificationAnnotation,
-                       lookup: Dict[str, str]) -> None:
+                       lookup: Mapping[str, str]) -> None:
         if isinstance(classification.value.answer, str):
             pass
         elif isinstance(classification.value.answer, ClassificationAnswer):
@@ -192,3 +367,14 @@ class Label(BaseModel):
                     f"Annotations should be a list containing the following classes : {supported}. Found {type(v)}"
                 )
         return value
+
+    @validator("annotations", always=True)
+    def track_modifications(cls, value):
+        return _AnnotationList(value)
+
+    @classmethod
+    def construct(cls, _fields_set=None, **values) -> "Label":
+        # Validators are skipped so the annotations have to be wrapped here
+        label = super().construct(_fields_set, **values)
+        label.__dict__['annotations'] = _AnnotationList(label.annotations)
+        return label
@@ -0,0 +1,476 @@
+from collections import defaultdict
+from typing import Any, Dict, Generator, Iterable, List, Optional, Tuple, Union
+
+import numpy as np
+
+from .annotation import ObjectAnnotation, VideoObjectAnnotation
+from .collection import LabelGenerator, LabelList
+from .data import ImageData
+from .geometry import Line, Point, Polygon, Rectangle
+from .label import Label
+
+POINT, LINE, POLYGON, RECTANGLE = range(4)
+
+_GEOMETRY_TYPES = {
+    Point: POINT,
+    Line: LINE,
+    Polygon: POLYGON,
+    Rectangle: RECTANGLE
+}
+
+# Keys that identify vector annotations in the ndjson format
+_NDJSON_GEOMETRY_KEYS = {
+    'point': POINT,
+    'line': LINE,
+    'polygon': POLYGON,
+    'bbox': RECTANGLE
+}
+
+
+class LabelStore:
+    """
+    A columnar container for interacting with very large collections of labels.
+
+    Point, line, polygon and rectangle object annotations are stored as a struct of numpy arrays
+    with one entry per annotation. All coordinates are packed into a single (N, 2) array
+    and `offsets` marks where the coordinates of each annotation start and end.
+    All other annotations (classifications, masks, text entities, video annotations, metrics)
+    are kept as regular annotation objects.
+
+    `Label` objects are only created when a label is accessed.
+
+    >>> store = LabelStore.from_labels(label_list)
+    >>> boxes = store.filter(store.geometry_type == RECTANGLE)
+    >>> large = boxes.filter(boxes.areas() > 100)
+    >>> large.to_labels()
+
+    Attributes:
+        data: The data object of each label
+        uids: The uid of each label
+        extras: The extra dict of each label
+        feature_names: Feature name for each feature code
+        feature_schema_ids: Feature schema id for each feature code
+        label_index: Index of the label that each vector annotation belongs to
+        feature_index: Feature code of each vector annotation
+        geometry_type: One of POINT, LINE, POLYGON, RECTANGLE for each vector annotation
+        offsets: The coordinates of annotation `i` are `coordinates[offsets[i]:offsets[i + 1]]`
+        coordinates: Packed (x, y) coordinates of all vector annotations.
+            Rectangles are stored as their start and end points.
+    """
+
+    def __init__(self, data: List[Any], uids: List[Optional[str]],
+                 extras: List[Dict[str, Any]],
+                 other_annotations: List[List[Tuple[int, Any]]],
+                 feature_names: np.ndarray, feature_schema_ids: np.ndarray,
+                 label_index: np.ndarray, feature_index: np.ndarray,
+                 geometry_type: np.ndarray, offsets: np.ndarray,
+                 coordinates: np.ndarray, order: np.ndarray,
+                 annotation_extra: np.ndarray, classifications: np.ndarray):
+        self.data = data
+        self.uids = uids
+        self.extras = extras
+        self.feature_names = feature_names
+        self.feature_schema_ids = feature_schema_ids
+        self.label_index = label_index
+        self.feature_index = feature_index
+        self.geometry_type = geometry_type
+        self.offsets = offsets
+        self.coordinates = coordinates
+        # Position of each annotation within its label. Used to restore the annotation order.
+        self._order = order
+        # Only set for annotations that have extra fields or subclasses
+        self._annotation_extra = annotation_extra
+        self._classifications = classifications
+        self._other_annotations = other_annotations
+
+    @classmethod
+    def from_labels(cls, labels: Iterable[Label]) -> "LabelStore":
+        """
+        Builds a LabelStore from a LabelList, LabelGenerator, or any iterable of labels.
+        When given a LabelGenerator, only one label is held in memory at a time.
+        """
+        builder = _LabelStoreBuilder()
+        for label in labels:
+            label_idx = builder.add_label(label.data, label.uid, label.extra)
+            for position, annotation in enumerate(label.annotations):
+                geometry_type = _GEOMETRY_TYPES.get(
+                    type(getattr(annotation, 'value', None)))
+                if geometry_type is None or not isinstance(
+                        annotation, ObjectAnnotation) or isinstance(
+                            annotation, VideoObjectAnnotation):
+                    builder.add_other(label_idx, position, annotation)
+                    continue
+                builder.add_vector(label_idx, position, annotation.name,
+                                   annotation.feature_schema_id, geometry_type,
+                                   _flatten_geometry(annotation.value),
+                                   annotation.extra, annotation.classifications)
+        return builder.build()
+
+    @classmethod
+    def from_ndjson(cls, json_data: Iterable[Dict[str, Any]]) -> "LabelStore":
+        """
+        Builds a LabelStore from ndjson data (prediction import format).
+
+        Points, lines, polygons, and bounding boxes without subclasses are read directly into the columns.
+        Everything else is converted with `NDJsonConverter`.
+        """
+        from ..serialization.ndjson import NDJsonConverter
+        builder = _LabelStoreBuilder()
+        label_lookup = {}
+        position = 0
+        for row in json_data:
+            data_row_id = row['dataRow']['id']
+            geometry_type = next((_NDJSON_GEOMETRY_KEYS[key]
+                                  for key in _NDJSON_GEOMETRY_KEYS
+                                  if key in row), None)
+            if geometry_type is not None and not row.get('classifications'):
+                if data_row_id not in label_lookup:
+                    label_lookup[data_row_id] = builder.add_label(
+                        ImageData(uid=data_row_id), None, {})
+                builder.add_vector(label_lookup[data_row_id], position, None,
+                                   row['schemaId'], geometry_type,
+                                   _flatten_ndjson(row, geometry_type),
+                                   {'uuid': row.get('uuid')}, [])
+                position += 1
+                continue
+
+            for label in NDJsonConverter.deserialize([row]):
+                if data_row_id not in label_lookup:
+                    label_lookup[data_row_id] = builder.add_label(
+                        label.data, None, {})
+                elif not isinstance(label.data, ImageData):
+                    # The media type can only be inferred from non vector annotations
+                    builder.data[label_lookup[data_row_id]] = label.data
+                for annotation in label.annotations:
+                    builder.add_other(label_lookup[data_row_id], position,
+                                      annotation)
+                    position += 1
+        return builder.build()
+
+    @classmethod
+    def from_lbv1(
+            cls, json_data: Union[str, Iterable[Dict[str,
+                                                     Any]]]) -> "LabelStore":
+        """
+        Builds a LabelStore from a labelbox export (non-video).
+        """
+        from ..serialization.labelbox_v1 import LBV1Converter
+        return cls.from_labels(LBV1Converter.deserialize(json_data))
+
+    def to_ndjson(self) -> Generator[Dict[str, Any], None, None]:
+        """
+        Converts the labels to the labelbox ndjson format (prediction import format)
+        """
+        from ..serialization.ndjson import NDJsonConverter
+        return NDJsonConverter.serialize(self.to_labels())
+
+    def to_lbv1(self) -> Generator[Dict[str, Any], None, None]:
+        """
+        Converts the labels to the labelbox json export format
+        """
+        from ..serialization.labelbox_v1 import LBV1Converter
+        return LBV1Converter.serialize(self.to_labels())
+
+    def to_labels(self) -> LabelGenerator:
+        """
+        Returns a LabelGenerator that creates each `Label` as it is accessed.
+        """
+        return LabelGenerator(data=(self[idx] for idx in range(len(self))))
+
+    def as_list(self) -> LabelList:
+        return LabelList(data=[self[idx] for idx in range(len(self))])
+
+    def filter(self, mask: np.ndarray) -> "LabelStore":
+        """
+        Selects vector annotations with a boolean mask (or integer indices).
+        All labels and non vector annotations are kept.
+
+        >>> store.filter(store.names == "dog")
+
+        Args:
+            mask: A boolean array with one value per vector annotation or an array of indices
+        Returns:
+            A new LabelStore containing only the selected vector annotations
+        """
+        mask = np.asarray(mask)
+        if mask.dtype != bool:
+            indices = np.sort(mask)
+            mask = np.zeros(len(self.geometry_type), dtype=bool)
+            mask[indices] = True
+        elif mask.shape != self.geometry_type.shape:
+            raise ValueError(
+                f"Expected a mask with shape {self.geometry_type.shape}. Found {mask.shape}"
+            )
+        lengths = np.diff(self.offsets)
+        return LabelStore(data=self.data,
+                          uids=self.uids,
+                          extras=self.extras,
+                          other_annotations=self._other_annotations,
+                          feature_names=self.feature_names,
+                          feature_schema_ids=self.feature_schema_ids,
+                          label_index=self.label_index[mask],
+                          feature_index=self.feature_index[mask],
+                          geometry_type=self.geometry_type[mask],
+                          offsets=_lengths_to_offsets(lengths[mask]),
+                          coordinates=self.coordinates[np.repeat(mask,
+                                                                 lengths)],
+                          order=self._order[mask],
+                          annotation_extra=self._annotation_extra[mask],
+                          classifications=self._classifications[mask])
+
+    def group_by(self, key: str = 'name') -> Dict[Any, np.ndarray]:
+        """
+        Groups vector annotations.
+
+        Args:
+            key: One of `name`, `feature_schema_id`, `geometry_type`, or `label`
+        Returns:
+            A dict mapping each key to the indices of the vector annotations in that group
+        """
+        if key in ('name', 'feature_schema_id'):
+            values = self.feature_names if key == 'name' else self.feature_schema_ids
+            codes = self.feature_index
+        elif key == 'geometry_type':
+            values, codes = None, self.geometry_type
+        elif key == 'label':
+            values, codes = None, self.label_index
+        else:
+            raise ValueError(
+                "key must be one of `name`, `feature_schema_id`, `geometry_type`, or `label`."
+                f" Found {key}")
+
+        sort_idx = np.argsort(codes, kind='stable')
+        unique_codes, starts = np.unique(codes[sort_idx], return_index=True)
+        groups = defaultdict(list)
+        for code, indices in zip(unique_codes, np.split(sort_idx, starts[1:])):
+            group_key = code.item() if values is None else values[code]
+            # Different codes can share a name if their schema ids differ
+            groups[group_key].append(indices)
+        return {
+            group_key: np.sort(np.concatenate(indices))
+            for group_key, indices in groups.items()
+        }
+
+    @property
+    def names(self) -> np.ndarray:
+        return self.feature_names[self.feature_index]
+
+    @property
+    def schema_ids(self) -> np.ndarray:
+        return self.feature_schema_ids[self.feature_index]
+
+    def bounds(self) -> np.ndarray:
+        """
+        Returns:
+            (N, 4) array of [xmin, ymin, xmax, ymax] for each vector annotation
+        """
+        if not len(self.geometry_type):
+            return np.zeros((0, 4))
+        starts = self.offsets[:-1]
+        xs, ys = self.coordinates[:, 0], self.coordinates[:, 1]
+        return np.stack([
+            np.minimum.reduceat(xs, starts),
+            np.minimum.reduceat(ys, starts),
+            np.maximum.reduceat(xs, starts),
+            np.maximum.reduceat(ys, starts)
+        ],
+                        axis=1)
+
+    def areas(self) -> np.ndarray:
+        """
+        Returns:
+            Area of each vector annotation. Points and lines have an area of zero.
+        """
+        areas = np.zeros(len(self.geometry_type))
+        if not len(areas):
+            return areas
+
+        starts = self.offsets[:-1]
+        xs, ys = self.coordinates[:, 0], self.coordinates[:, 1]
+        # Shoelace formula. Polygons are closed so the last point of each
+        # polygon is paired with the first point of the next annotation and ignored.
+        cross = xs * np.roll(ys, -1) - np.roll(xs, -1) * ys
+        cross[self.offsets[1:] - 1] = 0.
+        polygon_areas = np.abs(np.add.reduceat(cross, starts)) / 2.
+
+        is_polygon = self.geometry_type == POLYGON
+        areas[is_polygon] = polygon_areas[is_polygon]
+        is_rectangle = self.geometry_type == RECTANGLE
+        rectangle_starts = starts[is_rectangle]
+        widths, heights = np.abs(self.coordinates[rectangle_starts + 1] -
+                                 self.coordinates[rectangle_starts]).T
+        areas[is_rectangle] = widths * heights
+        return areas
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def __iter__(self) -> Generator[Label, None, None]:
+        for idx in range(len(self)):
+            yield self[idx]
+
+    def __getitem__(self, idx: int) -> Label:
+        """
+        Materializes a single label.
+        """
+        if idx < 0:
+            idx += len(self)
+        if not 0 <= idx < len(self):
+            raise IndexError(
+                f"Label index out of range. Found {idx} for {len(self)} labels")
+        start, end = np.searchsorted(self.label_index, [idx, idx + 1])
+        annotations = list(self._other_annotations[idx])
+        for row in range(start, end):
+            annotations.append((self._order[row], self._annotation(row)))
+        annotations.sort(key=lambda item: item[0])
+        return Label(data=self.data[idx],
+                     uid=self.uids[idx],
+                     extra=self.extras[idx],
+                     annotations=[annotation for _, annotation in annotations])
+
+    def _annotation(self, row: int) -> ObjectAnnotation:
+        feature = self.feature_index[row]
+        return ObjectAnnotation(
+            name=self.feature_names[feature],
+            feature_schema_id=self.feature_schema_ids[feature],
+            value=self._geometry(row),
+            extra=self._annotation_extra[row] or {},
+            classifications=self._classifications[row] or [])
+
+    def _geometry(self, row: int) -> Union[Point, Line, Polygon, Rectangle]:
+        coords = self.coordinates[self.offsets[row]:self.offsets[row + 1]]
+        geometry_type = self.geometry_type[row]
+        if geometry_type == LINE:
+            return Line.from_array(coords)
+        elif geometry_type == POLYGON:
+            return Polygon.from_array(coords)
+        points = [Point(x=x, y=y) for x, y in coords.tolist()]
+        if geometry_type == POINT:
+            return points[0]
+        return Rectangle(start=points[0], end=points[1])
+
+
+class _LabelStoreBuilder:
+    """
+    Accumulates columns in python lists before converting them to arrays.
+    """
+
+    def __init__(self):
+        self.data = []
+        self.uids = []
+        self.extras = []
+        self.other_annotations = []
+        self.features = {}
+        self.label_index = []
+        self.feature_index = []
+        self.geometry_type = []
+        self.lengths = []
+        self.coordinates = []
+        self.order = []
+        self.annotation_extra = []
+        self.classifications = []
+
+    def add_label(self, data, uid: Optional[str], extra: Dict[str, Any]) -> int:
+        self.data.append(data)
+        self.uids.append(uid)
+        self.extras.append(extra)
+        self.other_annotations.append([])
+        return len(self.data) - 1
+
+    def add_other(self, label_idx: int, position: int, annotation) -> None:
+        self.other_annotations[label_idx].append((position, annotation))
+
+    def add_vector(self, label_idx: int, position: int, name: Optional[str],
+                   feature_schema_id: Optional[str], geometry_type: int,
+                   coordinates: List[float], extra: Dict[str, Any],
+                   classifications: List) -> None:
+        feature = self.features.setdefault((name, feature_schema_id),
+                                           len(self.features))
+        self.label_index.append(label_idx)
+        self.feature_index.append(feature)
+        self.geometry_type.append(geometry_type)
+        self.lengths.append(len(coordinates) // 2)
+        self.coordinates.extend(coordinates)
+        self.order.append(position)
+        self.annotation_extra.append(extra or None)
+        self.classifications.append(classifications or None)
+
+    def build(self) -> LabelStore:
+        features = list(self.features)
+        label_index = np.array(self.label_index, dtype=np.int64)
+        lengths = np.array(self.lengths, dtype=np.int64)
+        coordinates = np.array(self.coordinates,
+                               dtype=np.float64).reshape(-1, 2)
+        # Rows of interleaved labels (e.g. ndjson) are grouped by label so that the
+        # annotations of each label are a contiguous range of rows
+        rows = np.argsort(label_index, kind='stable')
+        offsets = _lengths_to_offsets(lengths)
+        coordinates = coordinates[_gather_ranges(offsets, rows)]
+        lengths = lengths[rows]
+        return LabelStore(
+            data=self.data,
+            uids=self.uids,
+            extras=self.extras,
+            other_annotations=self.other_annotations,
+            feature_names=_object_array([name for name, _ in features]),
+            feature_schema_ids=_object_array(
+                [schema_id for _, schema_id in features]),
+            label_index=label_index[rows],
+            feature_index=np.array(self.feature_index, dtype=np.int32)[rows],
+            geometry_type=np.array(self.geometry_type, dtype=np.int8)[rows],
+            offsets=_lengths_to_offsets(lengths),
+            coordinates=coordinates,
+            order=np.array(self.order, dtype=np.int64)[rows],
+            annotation_extra=_object_array(self.annotation_extra)[rows],
+            classifications=_object_array(self.classifications)[rows])
+
+
+def _object_array(values: List[Any]) -> np.ndarray:
+    # np.array would try to unpack nested lists and dicts
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    return arr
+
+
+def _lengths_to_offsets(lengths: np.ndarray) -> np.ndarray:
+    offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=offsets[1:])
+    return offsets
+
+
+def _gather_ranges(offsets: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    # Indices of the coordinates of `rows`, in the order of `rows`
+    lengths = offsets[rows + 1] - offsets[rows]
+    starts = np.repeat(offsets[rows], lengths)
+    new_starts = np.repeat(_lengths_to_offsets(lengths)[:-1], lengths)
+    return starts + np.arange(lengths.sum()) - new_starts
+
+
+def _flatten_geometry(
+        geometry: Union[Point, Line, Polygon, Rectangle]) -> List[float]:
+    if isinstance(geometry, Point):
+        return [geometry.x, geometry.y]
+    elif isinstance(geometry, Rectangle):
+        return [
+            geometry.start.x, geometry.start.y, geometry.end.x, geometry.end.y
+        ]
+    return geometry.coordinates.ravel().tolist()
+
+
+def _flatten_ndjson(row: Dict[str, Any], geometry_type: int) -> List[float]:
+    if geometry_type == POINT:
+        return [row['point']['x'], row['point']['y']]
+    elif geometry_type == RECTANGLE:
+        bbox = row['bbox']
+        return [
+            bbox['left'], bbox['top'], bbox['left'] + bbox['width'],
+            bbox['top'] + bbox['height']
+        ]
+    points = row['line'] if geometry_type == LINE else row['polygon']
+    coordinates = [
+        value for point in points for value in (point['x'], point['y'])
+    ]
+    if geometry_type == POLYGON and coordinates[:2] != coordinates[-2:]:
+        # Polygons are always closed. Same as the Polygon validator
+        coordinates.extend(coordinates[:2])
+    return coordinates
@@ -1,5 +1,6 @@
-from typing import Dict, Any
+from typing import Any, Callable, Dict, Iterable, List, Tuple
 
+import numpy as np
 from pydantic import BaseModel, root_validator
 
 
@@ -17,3 +18,84 @@ class TextEntity(BaseModel):
                 raise ValueError(
                     "Location end must be greater or equal to start")
         return values
+
+
+class TextEntityIndex:
+    """
+    Index of the `TextEntity` annotations of a label for overlap and containment queries.
+
+    Entities are grouped by the power of two above their length and sorted by start within each group.
+    A query is a binary search in each group followed by a scan of the entities that start within
+    that group's longest length of the query, so a few long entities (e.g. a whole paragraph)
+    don't turn every query into a scan of all entities.
+    Spans include both `start` and `end`, the same as `TextEntity` iou.
+
+    >>> index = TextEntityIndex(label.annotations)
+    >>> index.overlapping(100, 120)
+
+    Args:
+        annotations: Annotations to index. Annotations that aren't `TextEntity` annotations are ignored.
+    """
+
+    def __init__(self, annotations: Iterable[Any]):
+        self.annotations = [
+            annotation for annotation in annotations
+            if isinstance(getattr(annotation, 'value', None), TextEntity)
+        ]
+        starts = np.array(
+            [annotation.value.start for annotation in self.annotations],
+            dtype=np.int64)
+        ends = np.array(
+            [annotation.value.end for annotation in self.annotations],
+            dtype=np.int64)
+        self._order = np.argsort(starts, kind='stable')
+        self._starts, self._ends = starts[self._order], ends[self._order]
+
+        lengths = self._ends - self._starts
+        # Lengths in a group are at least half of the longest one
+        exponents = np.frexp(lengths.astype(np.float64))[1]
+        # (shortest length, longest length, positions in the sorted arrays, starts)
+        self._groups = []
+        for exponent in np.unique(exponents).tolist():
+            positions = np.flatnonzero(exponents == exponent)
+            self._groups.append(
+                (int(lengths[positions].min()), int(lengths[positions].max()),
+                 positions, self._starts[positions]))
+
+    def overlapping(self, start: int, end: int) -> List[Any]:
+        """Annotations that share at least one offset with `start` to `end`"""
+        return self._query(
+            lambda min_length, max_length: (start - max_length, end),
+            lambda ends: ends >= start)
+
+    def containing(self, start: int, end: int) -> List[Any]:
+        """Annotations that contain all of `start` to `end`"""
+        return self._query(
+            lambda min_length, max_length: (end - max_length, start),
+            lambda ends: ends >= end)
+
+    def within(self, start: int, end: int) -> List[Any]:
+        """Annotations that are contained in `start` to `end`"""
+        return self._query(
+            lambda min_length, max_length: (start, end - min_length),
+            lambda ends: ends <= end)
+
+    def _query(self, start_range: Callable[[int, int], Tuple[int, int]],
+               keep: Callable[[np.ndarray], np.ndarray]) -> List[Any]:
+        # `start_range` gives the starts to scan in a group from its shortest and longest lengths.
+        # `keep` filters the scanned entities by their ends.
+        found = []
+        for min_length, max_length, positions, starts in self._groups:
+            min_start, max_start = start_range(min_length, max_length)
+            lo = np.searchsorted(starts, min_start, side='left')
+            hi = np.searchsorted(starts, max_start, side='right')
+            candidates = positions[lo:hi]
+            found.append(candidates[keep(self._ends[candidates])])
+        if not found:
+            return []
+        # Results are in the order of their starts
+        positions = np.sort(np.concatenate(found))
+        return [self.annotations[i] for i in self._order[positions].tolist()]
+
+    def __len__(self) -> int:
+        return len(self.annotations)
@@ -0,0 +1,135 @@
+from typing import Dict, Iterable, List, Optional
+
+from typing_extensions import Literal
+import cv2
+import numpy as np
+
+from .annotation import ObjectAnnotation, VideoObjectAnnotation
+from .geometry import Line, Mask, Point, Polygon, Rectangle
+
+# Drawing parameters that match the defaults of each geometry's `draw`
+POINT_RADIUS = 10
+LINE_THICKNESS = 1
+
+
+def rasterize_annotations(
+        annotations: Iterable[ObjectAnnotation],
+        height: int,
+        width: int,
+        mode: Literal['semantic', 'instance'] = 'semantic',
+        class_map: Optional[Dict[str, int]] = None) -> np.ndarray:
+    """
+    Draws object annotations onto a single int32 canvas.
+
+    Annotations are drawn in order so later annotations are drawn over earlier ones.
+    Coordinates for all points, lines, polygons and rectangles are converted to pixels at once
+    and masks only write the pixels within their bounding box.
+    Video and non geometric (e.g. text entity) annotations are skipped.
+
+    Args:
+        annotations: The annotations to draw
+        height: Height of the canvas
+        width: Width of the canvas
+        mode: 'semantic' draws the class value from `class_map` for each annotation.
+            'instance' draws 1, 2, ... for each annotation in the order they are drawn.
+        class_map: Value to draw for each annotation name (or feature schema id if the name isn't set).
+            Annotations without a value in `class_map` are not drawn.
+            Defaults to 1, 2, ... for each name in the order they first appear.
+    Returns:
+        int32 array with shape (height, width). Pixels without an annotation are 0.
+    """
+    if mode not in ('semantic', 'instance'):
+        raise ValueError(f"mode must be 'semantic' or 'instance'. Found {mode}")
+
+    geometry_types = (Point, Line, Polygon, Rectangle, Mask)
+    annotations = [
+        annotation for annotation in annotations
+        if isinstance(annotation, ObjectAnnotation) and
+        not isinstance(annotation, VideoObjectAnnotation) and
+        isinstance(annotation.value, geometry_types)
+    ]
+    values = _class_values(annotations, class_map)
+    annotations = [
+        annotation for annotation, value in zip(annotations, values)
+        if value is not None
+    ]
+    if mode == 'semantic':
+        values = [value for value in values if value is not None]
+    else:
+        values = list(range(1, len(annotations) + 1))
+
+    canvas = np.zeros((height, width), dtype=np.int32)
+    pixels = iter(_to_pixels([annotation.value for annotation in annotations]))
+    for annotation, value in zip(annotations, values):
+        geometry = annotation.value
+        if isinstance(geometry, Mask):
+            _draw_mask(canvas, geometry, value)
+            continue
+
+        pts = next(pixels)
+        if isinstance(geometry, Point):
+            cv2.circle(canvas,
+                       tuple(pts[0].tolist()),
+                       radius=POINT_RADIUS,
+                       color=value,
+                       thickness=-1)
+        elif isinstance(geometry, Line):
+            cv2.polylines(canvas, [pts], False, value, LINE_THICKNESS)
+        else:
+            cv2.fillPoly(canvas, [pts], value)
+    return canvas
+
+
+def _class_values(annotations: List[ObjectAnnotation],
+                  class_map: Optional[Dict[str, int]]) -> List[Optional[int]]:
+    keys = [
+        annotation.name
+        if annotation.name is not None else annotation.feature_schema_id
+        for annotation in annotations
+    ]
+    if class_map is None:
+        class_map = {}
+        for key in keys:
+            class_map.setdefault(key, len(class_map) + 1)
+    return [class_map.get(key) for key in keys]
+
+
+def _to_pixels(geometries: List) -> List[np.ndarray]:
+    # Converts the coordinates of every vector geometry to int32 pixels in a single array operation
+    coordinates = []
+    for geometry in geometries:
+        if isinstance(geometry, Point):
+            coordinates.append([[geometry.x, geometry.y]])
+        elif isinstance(geometry, Rectangle):
+            start, end = geometry.start, geometry.end
+            coordinates.append([[start.x, start.y], [end.x, start.y],
+                                [end.x, end.y], [start.x, end.y]])
+        elif isinstance(geometry, (Line, Polygon)):
+            coordinates.append(geometry.coordinates)
+    if not coordinates:
+        return []
+    lengths = [len(coords) for coords in coordinates]
+    pixels = np.concatenate(coordinates).astype(np.int32)
+    return np.split(pixels, np.cumsum(lengths)[:-1])
+
+
+def _draw_mask(canvas: np.ndarray, mask: Mask, value: int) -> None:
+    rle = mask.rle
+    if rle is not None:
+        bbox = rle.bbox
+        shape = rle.size
+    else:
+        label_map = mask.mask.label_map
+        bbox = label_map.bbox(mask.color)
+        shape = label_map.shape
+
+    if tuple(shape) != canvas.shape:
+        canvas[mask.draw(height=canvas.shape[0], width=canvas.shape[1],
+                         color=1).astype(bool)] = value
+    elif bbox is not None:
+        xmin, ymin, xmax, ymax = bbox
+        if rle is not None:
+            region = rle.to_array()[ymin:ymax, xmin:xmax]
+        else:
+            region = label_map.mask(mask.color, crop=True)
+        canvas[ymin:ymax, xmin:xmax][region.astype(bool)] = value
@@ -0,0 +1,96 @@
+import hashlib
+import threading
+from typing import Callable, Dict, MutableMapping, Optional
+
+import numpy as np
+
+
+class SigningCache:
+    """
+    Content addressed cache of signed urls.
+
+    Payloads are keyed by a hash of their content so that identical bytes
+    referenced from different objects (or different labels) are only signed and uploaded once.
+    Concurrent requests for the same payload wait for the first upload instead of starting a new one.
+
+    >>> cache = SigningCache()
+    >>> labels.add_url_to_masks(signer, signing_cache=cache)
+
+    Args:
+        backend: Optional mapping used to store content keys and urls.
+            Pass a persistent mapping (e.g. `shelve.open(path)`) to reuse urls between runs.
+            Defaults to an in memory dict.
+    """
+
+    def __init__(self, backend: Optional[MutableMapping[str, str]] = None):
+        self._backend = {} if backend is None else backend
+        self._lock = threading.Lock()
+        self._pending: Dict[str, threading.Event] = {}
+
+    @staticmethod
+    def content_key(payload: bytes) -> str:
+        return hashlib.sha256(payload).hexdigest()
+
+    @staticmethod
+    def array_key(arr: np.ndarray) -> str:
+        digest = hashlib.sha256(f"{arr.dtype}{arr.shape}".encode())
+        digest.update(np.ascontiguousarray(arr).data)
+        return digest.hexdigest()
+
+    def sign(self, payload: bytes, signer: Callable[[bytes], str]) -> str:
+        """
+        Returns the url for the payload, only calling the signer if this content hasn't been signed yet.
+
+        Args:
+            payload: bytes to upload
+            signer: A function that accepts bytes and returns a signed url.
+        Returns:
+            url for the payload
+        """
+        return self.get_or_sign(self.content_key(payload), lambda: payload,
+                                signer)
+
+    def get_or_sign(self, key: str, get_payload: Callable[[], bytes],
+                    signer: Callable[[bytes], str]) -> str:
+        """
+        Same as `sign` but for callers that can compute the content key without producing the payload.
+        `get_payload` is only called if the key is not already in the cache.
+
+        Args:
+            key: content key. See `content_key` and `array_key`.
+            get_payload: A function that returns the bytes to upload
+            signer: A function that accepts bytes and returns a signed url.
+        Returns:
+            url for the payload
+        """
+        while True:
+            with self._lock:
+                url = self._backend.get(key)
+                if url is not None:
+                    return url
+                event = self._pending.get(key)
+                owner = event is None
+                if owner:
+                    event = self._pending[key] = threading.Event()
+            if owner:
+                break
+            # Another thread is uploading this payload. If that upload fails, try again.
+            event.wait()
+
+        try:
+            url = signer(get_payload())
+            with self._lock:
+                self._backend[key] = url
+        finally:
+            with self._lock:
+                del self._pending[key]
+            event.set()
+        return url
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            return key in self._backend
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._backend)
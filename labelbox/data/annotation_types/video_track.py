@@ -0,0 +1,232 @@
+from collections import defaultdict
+from typing import Iterable, List, Optional, Tuple
+
+from typing_extensions import Literal
+import numpy as np
+from pydantic import BaseModel, root_validator
+
+from .annotation import VideoObjectAnnotation
+from .geometry import Line, Point, Polygon, Rectangle
+from .types import Cuid, TypedArray
+
+_GEOMETRY_TYPES = {
+    'point': Point,
+    'line': Line,
+    'polygon': Polygon,
+    'rectangle': Rectangle
+}
+
+
+def assign_segments(frames: np.ndarray, segments: np.ndarray) -> np.ndarray:
+    """
+    Finds the segment that contains each frame with a binary search.
+
+    Args:
+        frames: Frame indices with shape (N,)
+        segments: Sorted, non overlapping (start, end) frames with shape (S, 2). Both ends are inclusive.
+    Returns:
+        int64 array with the index of the segment of each frame or -1 for frames outside all segments
+    """
+    frames = np.asarray(frames, dtype=np.int64)
+    segments = np.asarray(segments, dtype=np.int64).reshape(-1, 2)
+    if not len(segments):
+        return np.full(len(frames), -1, dtype=np.int64)
+    idx = np.searchsorted(segments[:, 0], frames, side='right') - 1
+    inside = (idx >= 0) & (frames <= segments[np.maximum(idx, 0), 1])
+    return np.where(inside, idx, -1)
+
+
+class VideoObjectTrack(BaseModel):
+    """
+    Keyframes of a single video object stored as arrays.
+
+    Frames between keyframes are linearly interpolated within each segment without creating an
+    annotation for every frame. Frames of a segment before its first or after its last keyframe
+    repeat the nearest keyframe.
+
+    >>> track, = VideoObjectTrack.from_annotations(video_object_annotations)
+    >>> frames, coordinates = track.interpolate()  # One row per frame of every segment
+
+    Args:
+        name: Name of the object
+        feature_schema_id: Feature schema id of the object
+        geometry: 'point', 'line', 'polygon' or 'rectangle'
+        keyframes: Increasing frame indices of the keyframes with shape (K,)
+        coordinates: (x, y) of the points of each keyframe with shape (K, P, 2).
+            Rectangles have two points, the start and the end.
+        segments: (start, end) frames with shape (S, 2). Both ends are inclusive.
+    """
+    name: Optional[str] = None
+    feature_schema_id: Optional[Cuid] = None
+    geometry: Literal['point', 'line', 'polygon', 'rectangle']
+    keyframes: TypedArray[Literal['int64']]
+    coordinates: TypedArray[Literal['float64']]
+    segments: TypedArray[Literal['int64']]
+
+    @classmethod
+    def from_annotations(
+        cls, annotations: Iterable[VideoObjectAnnotation]
+    ) -> List["VideoObjectTrack"]:
+        """
+        Creates a track for each feature (annotations with the same name and feature schema id).
+
+        Segments are the runs of consecutive frames that have an annotation.
+        Only annotations with `keyframe=True` are used as keyframes.
+        All keyframes of a track must have the same geometry type and number of points.
+        """
+        groups = defaultdict(list)
+        for annotation in annotations:
+            groups[(annotation.feature_schema_id,
+                    annotation.name)].append(annotation)
+
+        tracks = []
+        for (feature_schema_id, name), group in groups.items():
+            frames = np.unique([annotation.frame for annotation in group])
+            breaks = np.flatnonzero(np.diff(frames) != 1) + 1
+            starts = frames[np.concatenate([[0], breaks])]
+            ends = frames[np.concatenate([breaks - 1, [len(frames) - 1]])]
+
+            keyframes = sorted(
+                (annotation for annotation in group if annotation.keyframe),
+                key=lambda annotation: annotation.frame)
+            geometry = cls._geometry_name(keyframes)
+            coordinates = [
+                cls._coordinates(annotation.value) for annotation in keyframes
+            ]
+            if len({len(coords) for coords in coordinates}) > 1:
+                raise ValueError(
+                    f"Keyframes of {name or feature_schema_id} have different numbers of points"
+                )
+            n_points = len(coordinates[0]) if coordinates else 0
+            tracks.append(
+                cls(name=name,
+                    feature_schema_id=feature_schema_id,
+                    geometry=geometry,
+                    keyframes=np.array(
+                        [annotation.frame for annotation in keyframes],
+                        dtype=np.int64),
+                    coordinates=np.array(coordinates, dtype=np.float64).reshape(
+                        len(keyframes), n_points, 2),
+                    segments=np.stack([starts, ends], axis=1).astype(np.int64)))
+        return tracks
+
+    def interpolate(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Computes the coordinates of every frame of every segment at once.
+
+        Returns:
+            (frames, coordinates) with shapes (N,) and (N, P, 2).
+            Segments without a keyframe are left out.
+        """
+        starts, ends = self.segments[:, 0], self.segments[:, 1]
+        lengths = ends - starts + 1
+        frame_segments = np.repeat(np.arange(len(self.segments)), lengths)
+        frames = np.arange(lengths.sum()) - np.repeat(
+            np.cumsum(lengths) - lengths, lengths) + np.repeat(starts, lengths)
+        if not len(self.keyframes):
+            return frames[:0], self.coordinates[:0]
+
+        key_segments = assign_segments(self.keyframes, self.segments)
+        last = len(self.keyframes) - 1
+        left = np.searchsorted(self.keyframes, frames, side='right') - 1
+        right = np.minimum(left + 1, last)
+        left = np.maximum(left, 0)
+        has_left = (self.keyframes[left] <= frames) & (key_segments[left]
+                                                       == frame_segments)
+        has_right = (self.keyframes[right] >= frames) & (key_segments[right]
+                                                         == frame_segments)
+
+        span = np.maximum(self.keyframes[right] - self.keyframes[left], 1)
+        weights = np.where(has_left & has_right,
+                           (frames - self.keyframes[left]) / span,
+                           np.where(has_left, 0., 1.))[:, None, None]
+        coordinates = self.coordinates[left] * (
+            1 - weights) + self.coordinates[right] * weights
+        valid = has_left | has_right
+        return frames[valid], coordinates[valid]
+
+    def to_annotations(self,
+                       keyframes_only: bool = False
+                      ) -> List[VideoObjectAnnotation]:
+        """
+        Args:
+            keyframes_only: Whether to only create annotations for the keyframes
+        Returns:
+            A `VideoObjectAnnotation` for each interpolated frame (or keyframe).
+            Annotations on keyframes have `keyframe=True`.
+        """
+        if keyframes_only:
+            frames, coordinates = self.keyframes, self.coordinates
+        else:
+            frames, coordinates = self.interpolate()
+        is_keyframe = np.isin(frames, self.keyframes)
+        return [
+            VideoObjectAnnotation(name=self.name,
+                                  feature_schema_id=self.feature_schema_id,
+                                  frame=frame,
+                                  keyframe=keyframe,
+                                  value=self._to_geometry(coords))
+            for frame, keyframe, coords in zip(
+                frames.tolist(), is_keyframe.tolist(), coordinates.tolist())
+        ]
+
+    def _to_geometry(self, coordinates: List[List[float]]):
+        points = [Point(x=x, y=y) for x, y in coordinates]
+        if self.geometry == 'point':
+            return points[0]
+        elif self.geometry == 'rectangle':
+            return Rectangle(start=points[0], end=points[1])
+        return _GEOMETRY_TYPES[self.geometry](points=points)
+
+    @staticmethod
+    def _geometry_name(annotations: List[VideoObjectAnnotation]) -> str:
+        names = set()
+        for annotation in annotations:
+            for name, geometry_type in _GEOMETRY_TYPES.items():
+                if type(annotation.value) is geometry_type:
+                    names.add(name)
+                    break
+            else:
+                raise TypeError(
+                    f"Unsupported geometry for a track. Found {type(annotation.value)}"
+                )
+        if len(names) > 1:
+            raise ValueError(
+                f"Keyframes of a track must have the same geometry. Found {names}"
+            )
+        return names.pop() if names else 'rectangle'
+
+    @staticmethod
+    def _coordinates(geometry) -> List[Tuple[float, float]]:
+        if isinstance(geometry, Point):
+            return [(geometry.x, geometry.y)]
+        elif isinstance(geometry, Rectangle):
+            return [(geometry.start.x, geometry.start.y),
+                    (geometry.end.x, geometry.end.y)]
+        return [(point.x, point.y) for point in geometry.points]
+
+    @root_validator(skip_on_failure=True)
+    def validate_arrays(cls, values):
+        keyframes, coordinates, segments = values['keyframes'], values[
+            'coordinates'], values['segments']
+        if keyframes.ndim != 1 or (np.diff(keyframes) <= 0).any():
+            raise ValueError(
+                "keyframes must be a one dimensional array of increasing frames"
+            )
+        if coordinates.ndim != 3 or coordinates.shape[0] != len(
+                keyframes) or coordinates.shape[2] != 2:
+            raise ValueError(
+                f"Expected coordinates with shape ({len(keyframes)}, P, 2). Found {coordinates.shape}"
+            )
+        if segments.ndim != 2 or segments.shape[1] != 2:
+            raise ValueError(
+                f"Expected segments with shape (S, 2). Found {segments.shape}")
+        if (segments[:, 1] < segments[:, 0]).any() or (segments[1:, 0] <=
+                                                       segments[:-1, 1]).any():
+            raise ValueError(
+                "segments must be sorted and non overlapping with start <= end")
+        return values
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(name={self.name}, geometry={self.geometry}, " \
+               f"keyframes={len(self.keyframes)}, segments={len(self.segments)})"
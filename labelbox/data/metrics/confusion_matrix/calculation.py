@@ -2,7 +2,8 @@ from typing import List, Optional, Tuple, Union
 
 import numpy as np
 
-from ..iou.calculation import _get_mask_pairs, _get_vector_pairs, _get_ner_pairs, miou
+from ..iou.calculation import _get_mask_ious, _get_vector_ious, _get_ner_pairs, _mask_union, miou
+from ..matching import Matching, MatchingStrategy, match_ious, pairs_to_ious
 from ...annotation_types import (ObjectAnnotation, ClassificationAnnotation,
                                  Mask, Geometry, Checklist, Radio, TextEntity,
                                  ScalarMetricValue, ConfusionMatrixMetricValue)
@@ -10,12 +11,12 @@ from ..group import (get_feature_pairs, get_identifying_key, has_no_annotations,
                      has_no_matching_annotations)
 
 
-def confusion_matrix(ground_truths: List[Union[ObjectAnnotation,
-                                               ClassificationAnnotation]],
-                     predictions: List[Union[ObjectAnnotation,
-                                             ClassificationAnnotation]],
-                     include_subclasses: bool,
-                     iou: float) -> ConfusionMatrixMetricValue:
+def confusion_matrix(
+        ground_truths: List[Union[ObjectAnnotation, ClassificationAnnotation]],
+        predictions: List[Union[ObjectAnnotation, ClassificationAnnotation]],
+        include_subclasses: bool,
+        iou: float,
+        matching: MatchingStrategy = 'greedy') -> ConfusionMatrixMetricValue:
     """
     Computes the confusion matrix for an arbitrary set of ground truth and predicted annotations.
     It first computes the confusion matrix for each metric and then sums across all classes
@@ -26,6 +27,7 @@ def confusion_matrix(ground_truths: List[Union[ObjectAnnotation,
         include_subclasses (bool): Whether or not to include subclasses in the calculation.
             If set to True, the iou between two overlapping objects of the same type is 0 if the subclasses are not the same.
         iou: minimum overlap between objects for them to count as matching
+        matching: How objects are matched. 'greedy' or 'hungarian' (requires scipy)
     Returns:
         confusion matrix as a list: [TP,FP,TN,FN]
         Returns None if there are no annotations in ground_truth or prediction annotations
@@ -34,7 +36,7 @@ def confusion_matrix(ground_truths: List[Union[ObjectAnnotation,
     annotation_pairs = get_feature_pairs(ground_truths, predictions)
     conf_matrix = [
         feature_confusion_matrix(annotation_pair[0], annotation_pair[1],
-                                 include_subclasses, iou)
+                                 include_subclasses, iou, matching)
         for annotation_pair in annotation_pairs.values()
     ]
     matrices = [matrix for matrix in conf_matrix if matrix is not None]
@@ -42,10 +44,12 @@ def confusion_matrix(ground_truths: List[Union[ObjectAnnotation,
 
 
 def feature_confusion_matrix(
-        ground_truths: List[Union[ObjectAnnotation, ClassificationAnnotation]],
-        predictions: List[Union[ObjectAnnotation, ClassificationAnnotation]],
-        include_subclasses: bool,
-        iou: float) -> Optional[ConfusionMatrixMetricValue]:
+    ground_truths: List[Union[ObjectAnnotation, ClassificationAnnotation]],
+    predictions: List[Union[ObjectAnnotation, ClassificationAnnotation]],
+    include_subclasses: bool,
+    iou: float,
+    matching: MatchingStrategy = 'greedy'
+) -> Optional[ConfusionMatrixMetricValue]:
     """
     Computes confusion matrix for all features of the same class.
 
@@ -54,6 +58,7 @@ def feature_confusion_matrix(
         predictions: List of annotations  belonging to the same class.
         include_subclasses (bool): Whether or not to include subclasses in the calculation.
             If set to True, the iou between two overlapping objects of the same type is 0 if the subclasses are not the same.
+        matching: How objects are matched. 'greedy' or 'hungarian' (requires scipy)
     Returns:
         confusion matrix as a list: [TP,FP,TN,FN]
         Returns None if there are no annotations in ground_truth or prediction annotations
@@ -64,13 +69,16 @@ def feature_confusion_matrix(
         return None
     elif isinstance(predictions[0].value, Mask):
         return mask_confusion_matrix(ground_truths, predictions,
-                                     include_subclasses, iou)
+                                     include_subclasses, iou, matching)
     elif isinstance(predictions[0].value, Geometry):
-        return vector_confusion_matrix(ground_truths, predictions,
-                                       include_subclasses, iou)
+        return vector_confusion_matrix(ground_truths,
+                                       predictions,
+                                       include_subclasses,
+                                       iou,
+                                       matching=matching)
     elif isinstance(predictions[0].value, TextEntity):
         return ner_confusion_matrix(ground_truths, predictions,
-                                    include_subclasses, iou)
+                                    include_subclasses, iou, matching)
     elif isinstance(predictions[0], ClassificationAnnotation):
         return classification_confusion_matrix(ground_truths, predictions)
     else:
@@ -120,11 +128,14 @@ def classification_confusion_matrix(
         )
 
 
-def vector_confusion_matrix(ground_truths: List[ObjectAnnotation],
-                            predictions: List[ObjectAnnotation],
-                            include_subclasses: bool,
-                            iou: float,
-                            buffer=70.) -> Optional[ConfusionMatrixMetricValue]:
+def vector_confusion_matrix(
+    ground_truths: List[ObjectAnnotation],
+    predictions: List[ObjectAnnotation],
+    include_subclasses: bool,
+    iou: float,
+    buffer=70.,
+    matching: MatchingStrategy = 'greedy'
+) -> Optional[ConfusionMatrixMetricValue]:
     """
     Computes confusion matrix for any vector class (point, polygon, line, rectangle).
     Ground truths and predictions should all belong to the same class.
@@ -136,6 +147,7 @@ def vector_confusion_matrix(ground_truths: List[ObjectAnnotation],
         include_subclasses (bool): Whether or not to include subclasses in the calculation.
             If set to True, the iou between two overlapping objects of the same type is 0 if the subclasses are not the same.
         buffer: How much to buffer point and lines (used for determining if overlap meets iou threshold )
+        matching: How objects are matched. 'greedy' or 'hungarian' (requires scipy)
     Returns:
         confusion matrix as a list: [TP,FP,TN,FN]
          Returns None if there are no annotations in ground_truth or prediction annotations
@@ -145,54 +157,61 @@ def vector_confusion_matrix(ground_truths: List[ObjectAnnotation],
     elif has_no_annotations(ground_truths, predictions):
         return None
 
-    pairs = _get_vector_pairs(ground_truths, predictions, buffer=buffer)
-    return object_pair_confusion_matrix(pairs, include_subclasses, iou)
+    ious = _get_vector_ious(ground_truths, predictions, buffer=buffer)
+    return _iou_confusion_matrix(ground_truths, predictions, ious,
+                                 include_subclasses, iou, matching)
 
 
-def object_pair_confusion_matrix(pairs: List[Tuple[ObjectAnnotation,
-                                                   ObjectAnnotation,
-                                                   ScalarMetricValue]],
-                                 include_subclasses: bool,
-                                 iou: float) -> ConfusionMatrixMetricValue:
+def object_pair_confusion_matrix(
+        pairs: List[Tuple[ObjectAnnotation, ObjectAnnotation,
+                          ScalarMetricValue]],
+        include_subclasses: bool,
+        iou: float,
+        matching: MatchingStrategy = 'greedy') -> ConfusionMatrixMetricValue:
     """
     Computes the confusion matrix for a list of object annotation pairs.
-    Performs greedy matching of pairs.
+    Pairs are matched greedily by default.
 
     Args:
         pairs : A list of object annotation pairs with an iou score.
             This is used to determine matching priority (or if objects are matching at all) since objects can only be matched once.
         iou : iou threshold to deterine if objects are matching
+        matching: 'greedy' or 'hungarian'. See `labelbox.data.metrics.matching.match`
     Returns:
         confusion matrix as a list: [TP,FP,TN,FN]
     """
-    pairs.sort(key=lambda triplet: triplet[2], reverse=True)
-    prediction_ids = set()
-    ground_truth_ids = set()
-    matched_predictions = set()
-    matched_ground_truths = set()
-
-    for ground_truth, prediction, agreement in pairs:
-        prediction_id = id(prediction)
-        ground_truth_id = id(ground_truth)
-        prediction_ids.add(prediction_id)
-        ground_truth_ids.add(ground_truth_id)
-
-        if agreement > iou and \
-         prediction_id not in matched_predictions and \
-         ground_truth_id not in matched_ground_truths:
-            if include_subclasses and (ground_truth.classifications or
-                                       prediction.classifications):
-                if miou(ground_truth.classifications,
-                        prediction.classifications,
-                        include_subclasses=False) < 1.:
-                    # Incorrect if the subclasses don't 100% agree then there is no match
-                    continue
-            matched_predictions.add(prediction_id)
-            matched_ground_truths.add(ground_truth_id)
-    tps = len(matched_ground_truths)
-
-    fps = len(prediction_ids.difference(matched_predictions))
-    fns = len(ground_truth_ids.difference(matched_ground_truths))
+
+    return _iou_confusion_matrix(*pairs_to_ious(pairs), include_subclasses, iou,
+                                 matching)
+
+
+def _iou_confusion_matrix(
+        ground_truths: List[ObjectAnnotation],
+        predictions: List[ObjectAnnotation], ious: np.ndarray,
+        include_subclasses: bool, iou: float,
+        matching: MatchingStrategy) -> ConfusionMatrixMetricValue:
+    # Objects only match if they overlap by more than `iou`
+    eligible = np.nan_to_num(ious) > iou
+    if include_subclasses:
+        for i, j in zip(*np.nonzero(eligible)):
+            ground_truth, prediction = ground_truths[i], predictions[j]
+            if (ground_truth.classifications or prediction.classifications
+               ) and miou(ground_truth.classifications,
+                          prediction.classifications,
+                          include_subclasses=False) < 1.:
+                # Incorrect if the subclasses don't 100% agree then there is no match
+                eligible[i, j] = False
+    return matching_confusion_matrix(
+        match_ious(ground_truths, predictions, ious, matching, eligible))
+
+
+def matching_confusion_matrix(matching: Matching) -> ConfusionMatrixMetricValue:
+    """
+    Computes the confusion matrix of a `Matching`. Matched objects are true positives.
+    """
+    tps = len(matching)
+    fps = len(matching.predictions) - tps
+    fns = len(matching.ground_truths) - tps
     # Not defined for object detection.
     tns = 0
     return [tps, fps, tns, fns]
@@ -246,10 +265,12 @@ def checklist_confusion_matrix(
     return [tps, fps, 0, fns]
 
 
-def mask_confusion_matrix(ground_truths: List[ObjectAnnotation],
-                          predictions: List[ObjectAnnotation],
-                          include_subclasses: bool,
-                          iou: float) -> Optional[ScalarMetricValue]:
+def mask_confusion_matrix(
+        ground_truths: List[ObjectAnnotation],
+        predictions: List[ObjectAnnotation],
+        include_subclasses: bool,
+        iou: float,
+        matching: MatchingStrategy = 'greedy') -> Optional[ScalarMetricValue]:
     """
     Computes confusion matrix metric for two masks
 
@@ -272,31 +293,31 @@ def mask_confusion_matrix(ground_truths: List[ObjectAnnotation],
         # This results in a faily drastically different value than without subclasses.
         # If we have subclasses set to True, then this is object detection with masks
         # Otherwise this will compute metrics on each pixel.
-        pairs = _get_mask_pairs(ground_truths, predictions)
-        return object_pair_confusion_matrix(
-            pairs, include_subclasses=include_subclasses, iou=iou)
-
-    prediction_np = np.max([pred.value.draw(color=1) for pred in predictions],
-                           axis=0)
-    ground_truth_np = np.max(
-        [ground_truth.value.draw(color=1) for ground_truth in ground_truths],
-        axis=0)
+        ious = _get_mask_ious(ground_truths, predictions)
+        return _iou_confusion_matrix(ground_truths, predictions, ious,
+                                     include_subclasses, iou, matching)
+
+    prediction_np = _mask_union(predictions)
+    ground_truth_np = _mask_union(ground_truths)
     if prediction_np.shape != ground_truth_np.shape:
         raise ValueError(
             "Prediction and mask must have the same shape."
             f" Found {prediction_np.shape}/{ground_truth_np.shape}.")
 
-    tp_mask = prediction_np == ground_truth_np == 1
-    fp_mask = (prediction_np == 1) & (ground_truth_np == 0)
-    fn_mask = (prediction_np == 0) & (ground_truth_np == 1)
-    tn_mask = prediction_np == ground_truth_np == 0
-    return [np.sum(tp_mask), np.sum(fp_mask), np.sum(fn_mask), np.sum(tn_mask)]
+    tps = np.count_nonzero(prediction_np & ground_truth_np)
+    fps = np.count_nonzero(prediction_np) - tps
+    fns = np.count_nonzero(ground_truth_np) - tps
+    tns = prediction_np.size - tps - fps - fns
+    return [tps, fps, tns, fns]
 
 
-def ner_confusion_matrix(ground_truths: List[ObjectAnnotation],
-                         predictions: List[ObjectAnnotation],
-                         include_subclasses: bool,
-                         iou: float) -> Optional[ConfusionMatrixMetricValue]:
+def ner_confusion_matrix(
+    ground_truths: List[ObjectAnnotation],
+    predictions: List[ObjectAnnotation],
+    include_subclasses: bool,
+    iou: float,
+    matching: MatchingStrategy = 'greedy'
+) -> Optional[ConfusionMatrixMetricValue]:
     """Computes confusion matrix metric between two lists of TextEntity objects
 
     Args:
@@ -310,4 +331,5 @@ def ner_confusion_matrix(ground_truths: List[ObjectAnnotation],
     elif has_no_annotations(ground_truths, predictions):
         return None
     pairs = _get_ner_pairs(ground_truths, predictions)
-    return object_pair_confusion_matrix(pairs, include_subclasses, iou)
+    return object_pair_confusion_matrix(pairs, include_subclasses, iou,
+                                        matching)
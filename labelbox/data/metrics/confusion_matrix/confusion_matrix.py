@@ -7,17 +7,18 @@ from ...annotation_types import (Label, ObjectAnnotation,
                                  ClassificationAnnotation)
 
 from ..group import get_feature_pairs
+from ..matching import MatchingStrategy
 from .calculation import confusion_matrix
 from .calculation import feature_confusion_matrix
 import numpy as np
 
 
-def confusion_matrix_metric(ground_truths: List[Union[
-    ObjectAnnotation, ClassificationAnnotation]],
-                            predictions: List[Union[ObjectAnnotation,
-                                                    ClassificationAnnotation]],
-                            include_subclasses=True,
-                            iou=0.5) -> List[ConfusionMatrixMetric]:
+def confusion_matrix_metric(
+        ground_truths: List[Union[ObjectAnnotation, ClassificationAnnotation]],
+        predictions: List[Union[ObjectAnnotation, ClassificationAnnotation]],
+        include_subclasses=True,
+        iou=0.5,
+        matching: MatchingStrategy = 'greedy') -> List[ConfusionMatrixMetric]:
     """
     Computes confusion matrix metrics between two sets of annotations.
     These annotations should relate to the same data (image/video).
@@ -28,6 +29,7 @@ def confusion_matrix_metric(ground_truths: List[Union[
         prediction: Label representing model predictions
         include_subclasses (bool): Whether or not to include subclasses in the calculation.
             If set to True, the iou between two overlapping objects of the same type is 0 if the subclasses are not the same.
+        matching: How objects are matched. 'greedy' or 'hungarian' (requires scipy)
     Returns:
         Returns a list of ConfusionMatrixMetrics. Will be empty if there were no predictions and labels. Otherwise a single metric will be returned.
     """
@@ -35,7 +37,7 @@ def confusion_matrix_metric(ground_truths: List[Union[
         raise ValueError("iou must be between 0 and 1")
 
     value = confusion_matrix(ground_truths, predictions, include_subclasses,
-                             iou)
+                             iou, matching)
     # If both gt and preds are empty there is no metric
     if value is None:
         return []
@@ -50,6 +52,7 @@ def feature_confusion_matrix_metric(
     predictions: List[Union[ObjectAnnotation, ClassificationAnnotation]],
     include_subclasses=True,
     iou: float = 0.5,
+    matching: MatchingStrategy = 'greedy',
 ) -> List[ConfusionMatrixMetric]:
     """
     Computes the confusion matrix metrics for each type of class in the list of annotations.
@@ -61,6 +64,7 @@ def feature_confusion_matrix_metric(
         prediction: Label representing model predictions
         include_subclasses (bool): Whether or not to include subclasses in the calculation.
             If set to True, the iou between two overlapping objects of the same type is 0 if the subclasses are not the same.
+        matching: How objects are matched. 'greedy' or 'hungarian' (requires scipy)
     Returns:
         Returns a list of ConfusionMatrixMetrics.
         There will be one metric for each class in the union of ground truth and prediction classes.
@@ -71,7 +75,7 @@ def feature_confusion_matrix_metric(
     for key in annotation_pairs:
         value = feature_confusion_matrix(annotation_pairs[key][0],
                                          annotation_pairs[key][1],
-                                         include_subclasses, iou)
+                                         include_subclasses, iou, matching)
         if value is None:
             continue
         metrics.append(
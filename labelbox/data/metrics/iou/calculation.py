@@ -1,18 +1,22 @@
 from typing import List, Optional, Tuple, Union
+from functools import reduce
 from itertools import product
 
 from shapely.geometry import Polygon
 import numpy as np
 
 from ..group import get_feature_pairs, get_identifying_key, has_no_annotations, has_no_matching_annotations
+from ..matching import Matching, MatchingStrategy, match_ious, match_pairs
 from ...annotation_types import (ObjectAnnotation, ClassificationAnnotation,
-                                 Mask, Geometry, Point, Line, Checklist, Text,
-                                 TextEntity, Radio, ScalarMetricValue)
+                                 Mask, Geometry, Point, Line, Rectangle,
+                                 Checklist, Text, TextEntity, Radio,
+                                 ScalarMetricValue, RunLengthEncoding)
 
 
 def miou(ground_truths: List[Union[ObjectAnnotation, ClassificationAnnotation]],
          predictions: List[Union[ObjectAnnotation, ClassificationAnnotation]],
-         include_subclasses: bool) -> Optional[ScalarMetricValue]:
+         include_subclasses: bool,
+         matching: MatchingStrategy = 'greedy') -> Optional[ScalarMetricValue]:
     """
     Computes miou for an arbitrary set of ground truth and predicted annotations.
     It first computes the iou for each metric and then takes the average (weighting each class equally)
@@ -22,24 +26,25 @@ def miou(ground_truths: List[Union[ObjectAnnotation, ClassificationAnnotation]],
         prediction: Label representing model predictions
         include_subclasses (bool): Whether or not to include subclasses in the iou calculation.
             If set to True, the iou between two overlapping objects of the same type is 0 if the subclasses are not the same.
+        matching: How objects are matched. 'greedy' or 'hungarian' (requires scipy)
     Returns:
         float indicating the iou score for all features represented in the annotations passed to this function.
         Returns None if there are no annotations in ground_truth or prediction annotations
     """
     annotation_pairs = get_feature_pairs(predictions, ground_truths)
     ious = [
-        feature_miou(annotation_pair[0], annotation_pair[1], include_subclasses)
-        for annotation_pair in annotation_pairs.values()
+        feature_miou(annotation_pair[0], annotation_pair[1], include_subclasses,
+                     matching) for annotation_pair in annotation_pairs.values()
     ]
     ious = [iou for iou in ious if iou is not None]
     return None if not len(ious) else np.mean(ious)
 
 
-def feature_miou(ground_truths: List[Union[ObjectAnnotation,
-                                           ClassificationAnnotation]],
-                 predictions: List[Union[ObjectAnnotation,
-                                         ClassificationAnnotation]],
-                 include_subclasses: bool) -> Optional[ScalarMetricValue]:
+def feature_miou(
+        ground_truths: List[Union[ObjectAnnotation, ClassificationAnnotation]],
+        predictions: List[Union[ObjectAnnotation, ClassificationAnnotation]],
+        include_subclasses: bool,
+        matching: MatchingStrategy = 'greedy') -> Optional[ScalarMetricValue]:
     """
     Computes iou score for all features of the same class.
 
@@ -48,6 +53,7 @@ def feature_miou(ground_truths: List[Union[ObjectAnnotation,
         predictions: List of annotations with the same feature schema.
         include_subclasses (bool): Whether or not to include subclasses in the iou calculation.
             If set to True, the iou between two overlapping objects of the same type is 0 if the subclasses are not the same.
+        matching: How objects are matched. 'greedy' or 'hungarian' (requires scipy)
     Returns:
         float representing the iou score for the feature type if score can be computed otherwise None.
     """
@@ -56,22 +62,29 @@ def feature_miou(ground_truths: List[Union[ObjectAnnotation,
     elif has_no_annotations(ground_truths, predictions):
         return None
     elif isinstance(predictions[0].value, Mask):
-        return mask_miou(ground_truths, predictions, include_subclasses)
+        return mask_miou(ground_truths, predictions, include_subclasses,
+                         matching)
     elif isinstance(predictions[0].value, Geometry):
-        return vector_miou(ground_truths, predictions, include_subclasses)
+        return vector_miou(ground_truths,
+                           predictions,
+                           include_subclasses,
+                           matching=matching)
     elif isinstance(predictions[0], ClassificationAnnotation):
         return classification_miou(ground_truths, predictions)
     elif isinstance(predictions[0].value, TextEntity):
-        return ner_miou(ground_truths, predictions, include_subclasses)
+        return ner_miou(ground_truths, predictions, include_subclasses,
+                        matching)
     else:
         raise ValueError(
             f"Unexpected annotation found. Found {type(predictions[0].value)}")
 
 
-def vector_miou(ground_truths: List[ObjectAnnotation],
-                predictions: List[ObjectAnnotation],
-                include_subclasses: bool,
-                buffer=70.) -> Optional[ScalarMetricValue]:
+def vector_miou(
+        ground_truths: List[ObjectAnnotation],
+        predictions: List[ObjectAnnotation],
+        include_subclasses: bool,
+        buffer=70.,
+        matching: MatchingStrategy = 'greedy') -> Optional[ScalarMetricValue]:
     """
     Computes iou score for all features with the same feature schema id.
     Calculation includes subclassifications.
@@ -79,6 +92,7 @@ def vector_miou(ground_truths: List[ObjectAnnotation],
     Args:
         ground_truths: List of ground truth vector annotations
         predictions: List of prediction vector annotations
+        matching: How objects are matched. 'greedy' or 'hungarian' (requires scipy)
     Returns:
         float representing the iou score for the feature type.
          If there are no matches then this returns none
@@ -87,41 +101,55 @@ def vector_miou(ground_truths: List[ObjectAnnotation],
         return 0.
     elif has_no_annotations(ground_truths, predictions):
         return None
-    pairs = _get_vector_pairs(ground_truths, predictions, buffer=buffer)
-    return object_pair_miou(pairs, include_subclasses)
+    ious = _get_vector_ious(ground_truths, predictions, buffer=buffer)
+    return matching_miou(match_ious(ground_truths, predictions, ious, matching),
+                         include_subclasses)
 
 
-def object_pair_miou(pairs: List[Tuple[ObjectAnnotation, ObjectAnnotation,
-                                       ScalarMetricValue]],
-                     include_subclasses) -> ScalarMetricValue:
-    pairs.sort(key=lambda triplet: triplet[2], reverse=True)
+def object_pair_miou(
+        pairs: List[Tuple[ObjectAnnotation, ObjectAnnotation,
+                          ScalarMetricValue]],
+        include_subclasses,
+        matching: MatchingStrategy = 'greedy') -> ScalarMetricValue:
+    """
+    Computes the average iou of matched object pairs. Objects that aren't matched add a score of 0.
+
+    Args:
+        pairs: (ground truth, prediction, iou) of each pair of objects
+        include_subclasses (bool): Whether or not to average the iou of matched objects with the iou of their subclasses.
+        matching: 'greedy' or 'hungarian'. See `labelbox.data.metrics.matching.match`
+    """
+    return matching_miou(match_pairs(pairs, matching), include_subclasses)
+
+
+def matching_miou(matching: Matching,
+                  include_subclasses: bool) -> ScalarMetricValue:
+    """
+    Computes the average iou of the matched objects of a `Matching`. Objects that aren't matched add a score of 0.
+    """
     solution_agreements = []
-    solution_features = set()
-    all_features = set()
-    for prediction, ground_truth, agreement in pairs:
-        all_features.update({id(prediction), id(ground_truth)})
-        if id(prediction) not in solution_features and id(
-                ground_truth) not in solution_features:
-            solution_features.update({id(prediction), id(ground_truth)})
-            if include_subclasses:
-                classification_iou = miou(prediction.classifications,
-                                          ground_truth.classifications,
-                                          include_subclasses=False)
-                classification_iou = classification_iou if classification_iou is not None else agreement
-                solution_agreements.append(
-                    (agreement + classification_iou) / 2.)
-            else:
-                solution_agreements.append(agreement)
+    for ground_truth, prediction, agreement in matching.matches():
+        if include_subclasses:
+            classification_iou = miou(ground_truth.classifications,
+                                      prediction.classifications,
+                                      include_subclasses=False)
+            classification_iou = classification_iou if classification_iou is not None else agreement
+            solution_agreements.append((agreement + classification_iou) / 2.)
+        else:
+            solution_agreements.append(agreement)
 
     # Add zeros for unmatched Features
-    solution_agreements.extend([0.0] *
-                               (len(all_features) - len(solution_features)))
+    solution_agreements.extend(
+        [0.0] * (len(matching.ground_truths) + len(matching.predictions) -
+                 2 * len(matching)))
     return np.mean(solution_agreements)
 
 
-def mask_miou(ground_truths: List[ObjectAnnotation],
-              predictions: List[ObjectAnnotation],
-              include_subclasses: bool) -> Optional[ScalarMetricValue]:
+def mask_miou(
+        ground_truths: List[ObjectAnnotation],
+        predictions: List[ObjectAnnotation],
+        include_subclasses: bool,
+        matching: MatchingStrategy = 'greedy') -> Optional[ScalarMetricValue]:
     """
     Computes iou score for all features with the same feature schema id.
     Calculation includes subclassifications.
@@ -129,6 +157,7 @@ def mask_miou(ground_truths: List[ObjectAnnotation],
     Args:
         ground_truths: List of ground truth mask annotations
         predictions: List of prediction mask annotations
+        matching: How objects are matched. 'greedy' or 'hungarian' (requires scipy)
     Returns:
         float representing the iou score for the masks
     """
@@ -138,14 +167,22 @@ def mask_miou(ground_truths: List[ObjectAnnotation],
         return None
 
     if include_subclasses:
-        pairs = _get_mask_pairs(ground_truths, predictions)
-        return object_pair_miou(pairs, include_subclasses=include_subclasses)
-
-    prediction_np = np.max([pred.value.draw(color=1) for pred in predictions],
-                           axis=0)
-    ground_truth_np = np.max(
-        [ground_truth.value.draw(color=1) for ground_truth in ground_truths],
-        axis=0)
+        ious = _get_mask_ious(ground_truths, predictions)
+        return matching_miou(
+            match_ious(ground_truths, predictions, ious, matching),
+            include_subclasses)
+
+    prediction_rles = [pred.value.rle for pred in predictions]
+    ground_truth_rles = [
+        ground_truth.value.rle for ground_truth in ground_truths
+    ]
+    if None not in prediction_rles + ground_truth_rles:
+        # Union the masks without decoding them
+        return reduce(RunLengthEncoding.union, ground_truth_rles).iou(
+            reduce(RunLengthEncoding.union, prediction_rles))
+
+    prediction_np = _mask_union(predictions)
+    ground_truth_np = _mask_union(ground_truths)
     if prediction_np.shape != ground_truth_np.shape:
         raise ValueError(
             "Prediction and mask must have the same shape."
@@ -223,37 +260,274 @@ def _get_vector_pairs(
     """
     # Get iou score for all pairs of ground truths and predictions
     """
+    scores = _get_vector_ious(ground_truths, predictions, buffer).tolist()
     pairs = []
-    for ground_truth, prediction in product(ground_truths, predictions):
+    for (i, ground_truth), (j, prediction) in product(enumerate(ground_truths),
+                                                      enumerate(predictions)):
         if isinstance(prediction.value, Geometry) and isinstance(
                 ground_truth.value, Geometry):
-            if isinstance(prediction.value, (Line, Point)):
-
-                score = _polygon_iou(prediction.value.shapely.buffer(buffer),
-                                     ground_truth.value.shapely.buffer(buffer))
-            else:
-                score = _polygon_iou(prediction.value.shapely,
-                                     ground_truth.value.shapely)
-            pairs.append((ground_truth, prediction, score))
+            pairs.append((ground_truth, prediction, scores[i][j]))
     return pairs
 
 
+def _get_vector_ious(ground_truths: List[ObjectAnnotation],
+                     predictions: List[ObjectAnnotation],
+                     buffer: float) -> np.ndarray:
+    """
+    # Get the (N, M) iou matrix of ground truths and predictions. Pairs that aren't both geometries are nan.
+    # Pairs of rectangles are scored together with `_rectangle_iou_matrix`.
+    # Other pairs are only scored with shapely if their bounding boxes overlap.
+    """
+    ground_truth_boxes = _rectangle_boxes(ground_truths)
+    prediction_boxes = _rectangle_boxes(predictions)
+    scores = _rectangle_iou_matrix(ground_truth_boxes, prediction_boxes)
+    is_rectangle = np.logical_and.outer(~np.isnan(ground_truth_boxes[:, 0]),
+                                        ~np.isnan(prediction_boxes[:, 0]))
+
+    ground_truth_shapes = _VectorShapes(ground_truths, ground_truth_boxes,
+                                        buffer)
+    prediction_shapes = _VectorShapes(predictions, prediction_boxes, buffer)
+    # Both shapes are buffered when the prediction is a line or a point
+    buffered = np.array([
+        isinstance(prediction.value, (Line, Point))
+        for prediction in predictions
+    ],
+                        dtype=bool)
+    for use_buffer in [False, True]:
+        columns = np.flatnonzero(buffered == use_buffer)
+        rows = np.flatnonzero(~is_rectangle[:, columns].all(axis=1))
+        if not len(rows) or not len(columns):
+            continue
+        columns = columns[~is_rectangle[rows][:, columns].all(axis=0)]
+        candidates = _boxes_overlap(
+            ground_truth_shapes.bounds(rows, use_buffer),
+            prediction_shapes.bounds(columns, use_buffer))
+        candidates &= ~is_rectangle[np.ix_(rows, columns)]
+        for row, column in zip(*np.nonzero(candidates)):
+            i, j = rows[row], columns[column]
+            scores[i,
+                   j] = _polygon_iou(prediction_shapes.shape(j, use_buffer),
+                                     ground_truth_shapes.shape(i, use_buffer))
+
+    is_geometry = [
+        np.array([
+            isinstance(annotation.value, Geometry) for annotation in annotations
+        ],
+                 dtype=bool) for annotations in [ground_truths, predictions]
+    ]
+    scores[~np.logical_and.outer(*is_geometry)] = np.nan
+    return scores
+
+
+class _VectorShapes:
+    """
+    Creates the valid (and optionally buffered) shapely shape of each annotation once.
+    The bounds of rectangles that aren't buffered are read from `boxes` without creating shapes.
+    """
+
+    def __init__(self, annotations: List[ObjectAnnotation], boxes: np.ndarray,
+                 buffer: float):
+        self.annotations = annotations
+        self.boxes = boxes
+        self.buffer = buffer
+        self._shapes = {}
+
+    def shape(self, idx: int, use_buffer: bool):
+        key = (idx, use_buffer)
+        if key not in self._shapes:
+            shape = self.annotations[idx].value.shapely
+            if use_buffer:
+                shape = shape.buffer(self.buffer)
+            self._shapes[key] = _ensure_valid_poly(shape)
+        return self._shapes[key]
+
+    def bounds(self, indices: np.ndarray, use_buffer: bool) -> np.ndarray:
+        bounds = np.full((len(indices), 4), np.nan)
+        for row, idx in enumerate(indices):
+            if not use_buffer and not np.isnan(self.boxes[idx, 0]):
+                bounds[row] = self.boxes[idx]
+            elif isinstance(self.annotations[idx].value, Geometry):
+                # Empty shapes have no bounds and never overlap
+                bounds[row] = self.shape(idx, use_buffer).bounds or np.nan
+        return bounds
+
+
+def _boxes_overlap(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """(N, M) mask of the pairs of (min x, min y, max x, max y) boxes that overlap or touch"""
+    return ((boxes1[:, None, :2] <= boxes2[None, :, 2:]) &
+            (boxes2[None, :, :2] <= boxes1[:, None, 2:])).all(axis=2)
+
+
+def _rectangle_boxes(annotations: List[ObjectAnnotation]) -> np.ndarray:
+    """
+    Packs annotations into an (N, 4) array of (min x, min y, max x, max y).
+    Rows of annotations that aren't rectangles are nan.
+    """
+    boxes = np.full((len(annotations), 4), np.nan)
+    for idx, annotation in enumerate(annotations):
+        if isinstance(annotation.value, Rectangle):
+            boxes[idx] = (annotation.value.start.x, annotation.value.start.y,
+                          annotation.value.end.x, annotation.value.end.y)
+    # Rectangles can be drawn from any corner
+    return np.concatenate([
+        np.minimum(boxes[:, :2], boxes[:, 2:]),
+        np.maximum(boxes[:, :2], boxes[:, 2:])
+    ],
+                          axis=1)
+
+
+def _rectangle_iou_matrix(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """
+    Computes iou between every pair of axis aligned boxes.
+
+    Args:
+        boxes1: (N, 4) array of (min x, min y, max x, max y)
+        boxes2: (M, 4) array of (min x, min y, max x, max y)
+    Returns:
+        (N, M) array of ious. Pairs without any area are 0.
+    """
+    top_left = np.maximum(boxes1[:, None, :2], boxes2[None, :, :2])
+    bottom_right = np.minimum(boxes1[:, None, 2:], boxes2[None, :, 2:])
+    intersection = np.prod(np.clip(bottom_right - top_left, 0, None), axis=2)
+    areas1 = np.prod(boxes1[:, 2:] - boxes1[:, :2], axis=1)
+    areas2 = np.prod(boxes2[:, 2:] - boxes2[:, :2], axis=1)
+    union = areas1[:, None] + areas2[None, :] - intersection
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(union > 0, intersection / union, 0.)
+
+
 def _get_mask_pairs(
     ground_truths: List[ObjectAnnotation], predictions: List[ObjectAnnotation]
 ) -> List[Tuple[ObjectAnnotation, ObjectAnnotation, ScalarMetricValue]]:
     """
     # Get iou score for all pairs of ground truths and predictions
     """
+    scores = _get_mask_ious(ground_truths, predictions).tolist()
     pairs = []
-    for ground_truth, prediction in product(ground_truths, predictions):
+    for (i, ground_truth), (j, prediction) in product(enumerate(ground_truths),
+                                                      enumerate(predictions)):
         if isinstance(prediction.value, Mask) and isinstance(
                 ground_truth.value, Mask):
-            score = _mask_iou(prediction.value.draw(color=1),
-                              ground_truth.value.draw(color=1))
-            pairs.append((ground_truth, prediction, score))
+            pairs.append((ground_truth, prediction, scores[i][j]))
     return pairs
 
 
+def _get_mask_ious(ground_truths: List[ObjectAnnotation],
+                   predictions: List[ObjectAnnotation]) -> np.ndarray:
+    """
+    # Get the (N, M) iou matrix of ground truth and predicted masks. Pairs that aren't both masks are nan.
+    # Each mask is read once and only pairs whose bounding boxes overlap are compared.
+    """
+    ground_truth_regions = _mask_regions(ground_truths)
+    prediction_regions = _mask_regions(predictions)
+    _check_mask_shapes(ground_truth_regions + prediction_regions)
+
+    ious = np.full((len(ground_truths), len(predictions)), np.nan)
+    ious[np.logical_and.outer(
+        [region is not None for region in ground_truth_regions],
+        [region is not None for region in prediction_regions])] = 0.
+    ground_truth_boxes = _mask_boxes(ground_truth_regions)
+    prediction_boxes = _mask_boxes(prediction_regions)
+    # Max values are exclusive
+    inclusive = np.array([0, 0, 1, 1])
+    candidates = _boxes_overlap(ground_truth_boxes - inclusive,
+                                prediction_boxes - inclusive)
+    for i, j in zip(*np.nonzero(candidates)):
+        ious[i, j] = ground_truth_regions[i].iou(prediction_regions[j])
+    return ious
+
+
+class _MaskRegion:
+    """
+    Bounding box, area and pixels of a mask within its bounding box.
+    These are read from the run length encoding or the label map of the mask without drawing it.
+    """
+
+    def __init__(self, mask: Mask):
+        self.mask = mask
+        self.rle = mask.rle
+        if self.rle is not None:
+            self.shape = tuple(self.rle.size)
+            self.bbox = self.rle.bbox
+            self.area = self.rle.area
+        else:
+            label_map = mask.mask.label_map
+            self.shape = label_map.shape
+            self.bbox = label_map.bbox(mask.color)
+            self.area = label_map.area(mask.color)
+        self._pixels = None
+
+    @property
+    def pixels(self) -> np.ndarray:
+        """Boolean mask within `bbox`. Only available for masks with a bbox"""
+        if self._pixels is None:
+            xmin, ymin, xmax, ymax = self.bbox
+            if self.rle is not None:
+                self._pixels = self.rle.to_array()[ymin:ymax,
+                                                   xmin:xmax].astype(bool)
+            else:
+                self._pixels = self.mask.mask.label_map.mask(
+                    self.mask.color, crop=True).astype(bool)
+        return self._pixels
+
+    def iou(self, other: "_MaskRegion") -> ScalarMetricValue:
+        if self.bbox is None or other.bbox is None:
+            return 0.
+        if self.rle is not None and other.rle is not None:
+            return self.rle.iou(other.rle)
+        xmin, ymin = max(self.bbox[0],
+                         other.bbox[0]), max(self.bbox[1], other.bbox[1])
+        xmax, ymax = min(self.bbox[2],
+                         other.bbox[2]), min(self.bbox[3], other.bbox[3])
+        if xmin >= xmax or ymin >= ymax:
+            return 0.
+        intersection = np.count_nonzero(
+            self._crop(xmin, ymin, xmax, ymax) &
+            other._crop(xmin, ymin, xmax, ymax))
+        return intersection / (self.area + other.area - intersection)
+
+    def _crop(self, xmin: int, ymin: int, xmax: int, ymax: int) -> np.ndarray:
+        return self.pixels[ymin - self.bbox[1]:ymax - self.bbox[1],
+                           xmin - self.bbox[0]:xmax - self.bbox[0]]
+
+
+def _mask_regions(
+        annotations: List[ObjectAnnotation]) -> List[Optional[_MaskRegion]]:
+    return [
+        _MaskRegion(annotation.value)
+        if isinstance(annotation.value, Mask) else None
+        for annotation in annotations
+    ]
+
+
+def _mask_boxes(regions: List[Optional[_MaskRegion]]) -> np.ndarray:
+    # (N, 4) array of (xmin, ymin, xmax, ymax). Empty masks are nan and don't overlap anything.
+    boxes = np.full((len(regions), 4), np.nan)
+    for idx, region in enumerate(regions):
+        if region is not None and region.bbox is not None:
+            boxes[idx] = region.bbox
+    return boxes
+
+
+def _check_mask_shapes(regions: List[Optional[_MaskRegion]]) -> None:
+    shapes = {region.shape for region in regions if region is not None}
+    if len(shapes) > 1:
+        raise ValueError(
+            f"Masks must have the same shape. Found {sorted(shapes)}.")
+
+
+def _mask_union(annotations: List[ObjectAnnotation]) -> np.ndarray:
+    """Boolean union of mask annotations. Each mask is only written within its bounding box."""
+    regions = _mask_regions(annotations)
+    _check_mask_shapes(regions)
+    union = np.zeros(regions[0].shape, dtype=bool)
+    for region in regions:
+        if region.bbox is not None:
+            xmin, ymin, xmax, ymax = region.bbox
+            union[ymin:ymax, xmin:xmax] |= region.pixels
+    return union
+
+
 def _polygon_iou(poly1: Polygon, poly2: Polygon) -> ScalarMetricValue:
     """Computes iou between two shapely polygons."""
     poly1, poly2 = _ensure_valid_poly(poly1), _ensure_valid_poly(poly2)
@@ -299,9 +573,11 @@ def _ner_iou(ner1: TextEntity, ner2: TextEntity):
     return (intersection_end - intersection_start) / (union_end - union_start)
 
 
-def ner_miou(ground_truths: List[ObjectAnnotation],
-             predictions: List[ObjectAnnotation],
-             include_subclasses: bool) -> Optional[ScalarMetricValue]:
+def ner_miou(
+        ground_truths: List[ObjectAnnotation],
+        predictions: List[ObjectAnnotation],
+        include_subclasses: bool,
+        matching: MatchingStrategy = 'greedy') -> Optional[ScalarMetricValue]:
     """
     Computes iou score for all features with the same feature schema id.
     Calculation includes subclassifications.
@@ -309,6 +585,7 @@ def ner_miou(ground_truths: List[ObjectAnnotation],
     Args:
         ground_truths: List of ground truth ner annotations
         predictions: List of prediction ner annotations
+        matching: How objects are matched. 'greedy' or 'hungarian' (requires scipy)
     Returns:
         float representing the iou score for the feature type.
          If there are no matches then this returns none
@@ -318,4 +595,4 @@ def ner_miou(ground_truths: List[ObjectAnnotation],
     elif has_no_annotations(ground_truths, predictions):
         return None
     pairs = _get_ner_pairs(ground_truths, predictions)
-    return object_pair_miou(pairs, include_subclasses)
\ No newline at end of file
+    return object_pair_miou(pairs, include_subclasses, matching)
@@ -5,6 +5,7 @@ from ...annotation_types import (Label, ObjectAnnotation,
                                  ClassificationAnnotation)
 
 from ..group import get_feature_pairs
+from ..matching import MatchingStrategy
 from .calculation import feature_miou
 from .calculation import miou
 
@@ -13,7 +14,8 @@ def miou_metric(ground_truths: List[Union[ObjectAnnotation,
                                           ClassificationAnnotation]],
                 predictions: List[Union[ObjectAnnotation,
                                         ClassificationAnnotation]],
-                include_subclasses=True) -> List[ScalarMetric]:
+                include_subclasses=True,
+                matching: MatchingStrategy = 'greedy') -> List[ScalarMetric]:
     """
     Computes miou between two sets of annotations.
     These annotations should relate to the same data (image/video).
@@ -24,21 +26,22 @@ def miou_metric(ground_truths: List[Union[ObjectAnnotation,
         prediction: Label representing model predictions
         include_subclasses (bool): Whether or not to include subclasses in the iou calculation.
             If set to True, the iou between two overlapping objects of the same type is 0 if the subclasses are not the same.
+        matching: How objects are matched. 'greedy' or 'hungarian' (requires scipy)
     Returns:
         Returns a list of ScalarMetrics. Will be empty if there were no predictions and labels. Otherwise a single metric will be returned.
     """
-    iou = miou(ground_truths, predictions, include_subclasses)
+    iou = miou(ground_truths, predictions, include_subclasses, matching)
     # If both gt and preds are empty there is no metric
     if iou is None:
         return []
     return [ScalarMetric(metric_name="iou", value=iou)]
 
 
-def feature_miou_metric(ground_truths: List[Union[ObjectAnnotation,
-                                                  ClassificationAnnotation]],
-                        predictions: List[Union[ObjectAnnotation,
-                                                ClassificationAnnotation]],
-                        include_subclasses=True) -> List[ScalarMetric]:
+def feature_miou_metric(
+        ground_truths: List[Union[ObjectAnnotation, ClassificationAnnotation]],
+        predictions: List[Union[ObjectAnnotation, ClassificationAnnotation]],
+        include_subclasses=True,
+        matching: MatchingStrategy = 'greedy') -> List[ScalarMetric]:
     """
     Computes the miou for each type of class in the list of annotations.
     These annotations should relate to the same data (image/video).
@@ -48,6 +51,7 @@ def feature_miou_metric(ground_truths: List[Union[ObjectAnnotation,
         prediction: Label representing model predictions
         include_subclasses (bool): Whether or not to include subclasses in the iou calculation.
             If set to True, the iou between two overlapping objects of the same type is 0 if the subclasses are not the same.
+        matching: How objects are matched. 'greedy' or 'hungarian' (requires scipy)
     Returns:
         Returns a list of ScalarMetrics.
         There will be one metric for each class in the union of ground truth and prediction classes.
@@ -58,7 +62,7 @@ def feature_miou_metric(ground_truths: List[Union[ObjectAnnotation,
     for key in annotation_pairs:
 
         value = feature_miou(annotation_pairs[key][0], annotation_pairs[key][1],
-                             include_subclasses)
+                             include_subclasses, matching)
         if value is None:
             continue
         metrics.append(
@@ -0,0 +1,215 @@
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from typing import Literal
+except ImportError:
+    from typing_extensions import Literal
+
+try:
+    from scipy.optimize import linear_sum_assignment
+except ImportError:
+    linear_sum_assignment = None
+
+from ..annotation_types import ObjectAnnotation, ScalarMetricValue
+
+MatchingStrategy = Literal['greedy', 'hungarian']
+
+
+class Matching:
+    """
+    One to one matching between ground truth and predicted objects of a feature.
+
+    >>> matching = match_pairs(_get_vector_pairs(ground_truths, predictions, buffer=70.))
+    >>> for ground_truth, prediction, score in matching.matches(): ...
+
+    Args:
+        ground_truths: The ground truth objects. Rows of `ious`
+        predictions: The predicted objects. Columns of `ious`
+        ious: (N, M) array of pair scores. Pairs that were not scored are nan.
+        ground_truth_indices: Rows of the matched pairs
+        prediction_indices: Columns of the matched pairs
+    """
+
+    def __init__(self, ground_truths: List[ObjectAnnotation],
+                 predictions: List[ObjectAnnotation], ious: np.ndarray,
+                 ground_truth_indices: np.ndarray,
+                 prediction_indices: np.ndarray):
+        self.ground_truths = ground_truths
+        self.predictions = predictions
+        self.ious = ious
+        self.ground_truth_indices = ground_truth_indices
+        self.prediction_indices = prediction_indices
+
+    @property
+    def scores(self) -> np.ndarray:
+        """Scores of the matched pairs"""
+        return self.ious[self.ground_truth_indices, self.prediction_indices]
+
+    @property
+    def unmatched_ground_truths(self) -> List[ObjectAnnotation]:
+        return self._unmatched(self.ground_truths, self.ground_truth_indices)
+
+    @property
+    def unmatched_predictions(self) -> List[ObjectAnnotation]:
+        return self._unmatched(self.predictions, self.prediction_indices)
+
+    def matches(
+        self
+    ) -> List[Tuple[ObjectAnnotation, ObjectAnnotation, ScalarMetricValue]]:
+        """(ground truth, prediction, score) of each matched pair"""
+        return [(self.ground_truths[i], self.predictions[j], score)
+                for i, j, score in zip(self.ground_truth_indices.tolist(
+                ), self.prediction_indices.tolist(), self.scores.tolist())]
+
+    @staticmethod
+    def _unmatched(annotations: List[ObjectAnnotation],
+                   indices: np.ndarray) -> List[ObjectAnnotation]:
+        matched = set(indices.tolist())
+        return [
+            annotation for idx, annotation in enumerate(annotations)
+            if idx not in matched
+        ]
+
+    def __len__(self) -> int:
+        return len(self.ground_truth_indices)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(ground_truths={len(self.ground_truths)}, " \
+               f"predictions={len(self.predictions)}, matches={len(self)})"
+
+
+def match(
+        ious: np.ndarray,
+        strategy: MatchingStrategy = 'greedy',
+        eligible: Optional[np.ndarray] = None) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Matches rows to columns of a score matrix. Each row and column is matched at most once.
+
+    Args:
+        ious: (N, M) array of scores. Pairs with a nan score are never matched.
+        strategy: 'greedy' matches the highest scoring pairs first. Ties are matched in row major order.
+            'hungarian' maximizes the total score of the matched pairs and requires scipy.
+        eligible: Optional (N, M) boolean mask of the pairs that can be matched
+    Returns:
+        (rows, columns) of the matched pairs in the order they were matched
+    """
+    ious = np.asarray(ious, dtype=np.float64)
+    if ious.ndim != 2:
+        raise ValueError(f"Expected an (N, M) array. Found {ious.shape}")
+    allowed = ~np.isnan(ious)
+    if eligible is not None:
+        allowed &= eligible
+    if strategy == 'greedy':
+        return _greedy_match(ious, allowed)
+    elif strategy == 'hungarian':
+        return _hungarian_match(ious, allowed)
+    raise ValueError(
+        f"Expected strategy to be 'greedy' or 'hungarian'. Found {strategy}")
+
+
+def match_ious(ground_truths: List[ObjectAnnotation],
+               predictions: List[ObjectAnnotation],
+               ious: np.ndarray,
+               strategy: MatchingStrategy = 'greedy',
+               eligible: Optional[np.ndarray] = None) -> Matching:
+    """
+    Matches the objects of a feature from their iou matrix. See `match`.
+
+    Args:
+        ground_truths: Objects of the rows of `ious`
+        predictions: Objects of the columns of `ious`
+        ious: (N, M) array of scores. Objects without any score (rows or columns that are all nan) are left out.
+        strategy: 'greedy' or 'hungarian'
+        eligible: Optional (N, M) boolean mask of the pairs that can be matched
+    Returns:
+        `Matching` of the objects
+    """
+    ious = np.asarray(ious, dtype=np.float64)
+    scored = ~np.isnan(ious)
+    rows = np.flatnonzero(scored.any(axis=1))
+    columns = np.flatnonzero(scored.any(axis=0))
+    if len(rows) != len(ground_truths) or len(columns) != len(predictions):
+        ious = ious[np.ix_(rows, columns)]
+        eligible = None if eligible is None else eligible[np.ix_(rows, columns)]
+        ground_truths = [ground_truths[idx] for idx in rows.tolist()]
+        predictions = [predictions[idx] for idx in columns.tolist()]
+    ground_truth_indices, prediction_indices = match(ious, strategy, eligible)
+    return Matching(ground_truths, predictions, ious, ground_truth_indices,
+                    prediction_indices)
+
+
+def match_pairs(pairs: List[Tuple[ObjectAnnotation, ObjectAnnotation,
+                                  ScalarMetricValue]],
+                strategy: MatchingStrategy = 'greedy') -> Matching:
+    """
+    Matches the (ground truth, prediction, score) pairs of a feature. See `match`.
+
+    Args:
+        pairs: Scored pairs. Objects are rows and columns in the order they first appear.
+        strategy: 'greedy' or 'hungarian'
+    Returns:
+        `Matching` of the objects in `pairs`
+    """
+    return match_ious(*pairs_to_ious(pairs), strategy)
+
+
+def pairs_to_ious(
+    pairs: List[Tuple[ObjectAnnotation, ObjectAnnotation, ScalarMetricValue]]
+) -> Tuple[List[ObjectAnnotation], List[ObjectAnnotation], np.ndarray]:
+    """
+    Returns:
+        (ground truths, predictions, ious) with the objects in the order they first appear in `pairs`.
+        Pairs that are not in `pairs` are nan.
+    """
+    rows, columns = {}, {}
+    ground_truths, predictions = [], []
+    for ground_truth, prediction, _ in pairs:
+        if id(ground_truth) not in rows:
+            rows[id(ground_truth)] = len(ground_truths)
+            ground_truths.append(ground_truth)
+        if id(prediction) not in columns:
+            columns[id(prediction)] = len(predictions)
+            predictions.append(prediction)
+
+    ious = np.full((len(ground_truths), len(predictions)), np.nan)
+    for ground_truth, prediction, score in pairs:
+        ious[rows[id(ground_truth)], columns[id(prediction)]] = score
+    return ground_truths, predictions, ious
+
+
+def _greedy_match(ious: np.ndarray,
+                  allowed: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    candidates = np.flatnonzero(allowed)
+    # A stable sort keeps ties in row major order
+    order = candidates[np.argsort(-ious.ravel()[candidates], kind='stable')]
+    n_columns = ious.shape[1]
+    max_matches = min(ious.shape)
+    used_rows = np.zeros(ious.shape[0], dtype=bool)
+    used_columns = np.zeros(n_columns, dtype=bool)
+    rows, columns = [], []
+    for flat_idx in order.tolist():
+        if len(rows) == max_matches:
+            break
+        row, column = divmod(flat_idx, n_columns)
+        if used_rows[row] or used_columns[column]:
+            continue
+        used_rows[row] = used_columns[column] = True
+        rows.append(row)
+        columns.append(column)
+    return np.array(rows, dtype=np.int64), np.array(columns, dtype=np.int64)
+
+
+def _hungarian_match(ious: np.ndarray,
+                     allowed: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    if linear_sum_assignment is None:
+        raise ImportError(
+            "Hungarian matching requires scipy. Use `pip install scipy` or the greedy strategy"
+        )
+    # Pairs that can't be matched are dropped afterwards. The small bonus prefers
+    # pairs that can be matched over them when the scores are tied (e.g. both are 0).
+    rows, columns = linear_sum_assignment(np.where(allowed, ious + 1e-9, 0.),
+                                          maximize=True)
+    keep = allowed[rows, columns]
+    return rows[keep].astype(np.int64), columns[keep].astype(np.int64)
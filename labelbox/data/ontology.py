@@ -1,44 +1,177 @@
-from typing import Dict, List, Tuple, Union
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 from labelbox.schema import ontology
+from labelbox.schema.bulk_import_request import get_mal_schemas
 from .annotation_types import (Text, Dropdown, Checklist, Radio,
                                ClassificationAnnotation, ObjectAnnotation, Mask,
                                Point, Line, Polygon, Rectangle, TextEntity)
 
+# Indices compiled by `OntologyIndex.from_ontology`, keyed by ontology id and update time
+_MAX_CACHED_ONTOLOGIES = 32
+_ontology_indices: "OrderedDict[Tuple[str, Any], OntologyIndex]" = OrderedDict()
+_ontology_indices_lock = threading.Lock()
 
-def get_feature_schema_lookup(
-    ontology_builder: ontology.OntologyBuilder
-) -> Tuple[Dict[str, str], Dict[str, str]]:
-    tool_lookup = {}
-    classification_lookup = {}
 
-    def flatten_classification(classifications):
-        for classification in classifications:
-            if classification.feature_schema_id is None:
+class OntologyIndex:
+    """
+    Immutable lookup from feature names to feature schema ids, compiled once from an ontology.
+
+    Nested classifications and options are flattened into the classification lookup.
+    Build this once and reuse it for every label that is assigned schema ids.
+
+    >>> index = OntologyIndex.from_ontology_builder(ontology_builder)
+    >>> for label in labels:
+    >>>     label.assign_feature_schema_ids(index)
+
+    Args:
+        tools: Tool names to feature schema ids
+        classifications: Classification instructions and option values to feature schema ids
+        normalized_ontology: Optional ontology json in the format of `Ontology.normalized`. Only used for `mal_schemas`.
+    """
+
+    __slots__ = ('_tools', '_classifications', '_normalized_ontology',
+                 '_mal_schemas')
+
+    def __init__(self,
+                 tools: Mapping[str, str],
+                 classifications: Mapping[str, str],
+                 normalized_ontology: Optional[Dict[str, Any]] = None):
+        object.__setattr__(self, '_tools', MappingProxyType(dict(tools)))
+        object.__setattr__(self, '_classifications',
+                           MappingProxyType(dict(classifications)))
+        object.__setattr__(self, '_normalized_ontology', normalized_ontology)
+        object.__setattr__(self, '_mal_schemas', None)
+
+    @classmethod
+    def from_ontology_builder(
+            cls, ontology_builder: ontology.OntologyBuilder) -> "OntologyIndex":
+        tool_lookup = {}
+        classification_lookup = {}
+
+        def flatten_classification(classifications):
+            for classification in classifications:
+                if classification.feature_schema_id is None:
+                    raise ValueError(
+                        f"feature_schema_id cannot be None for classification `{classification.name}`."
+                    )
+                if isinstance(classification, ontology.Classification):
+                    classification_lookup[
+                        classification.
+                        instructions] = classification.feature_schema_id
+                elif isinstance(classification, ontology.Option):
+                    classification_lookup[
+                        classification.value] = classification.feature_schema_id
+                else:
+                    raise TypeError(
+                        f"Unexpected type found in ontology. `{type(classification)}`"
+                    )
+                flatten_classification(classification.options)
+
+        def normalize_classification(classification):
+            # Only the fields that are read by `get_mal_schemas`
+            return {
+                'type':
+                    classification.class_type.value,
+                'featureSchemaId':
+                    classification.feature_schema_id,
+                'options': [{
+                    'featureSchemaId': option.feature_schema_id
+                } for option in classification.options]
+            }
+
+        # The index keeps a snapshot of the ids instead of a copy of the builder, which can be modified afterwards
+        normalized_tools = []
+        for tool in ontology_builder.tools:
+            if tool.feature_schema_id is None:
                 raise ValueError(
-                    f"feature_schema_id cannot be None for classification `{classification.name}`."
-                )
-            if isinstance(classification, ontology.Classification):
-                classification_lookup[
-                    classification.
-                    instructions] = classification.feature_schema_id
-            elif isinstance(classification, ontology.Option):
-                classification_lookup[
-                    classification.value] = classification.feature_schema_id
-            else:
-                raise TypeError(
-                    f"Unexpected type found in ontology. `{type(classification)}`"
+                    f"feature_schema_id cannot be None for tool `{tool.name}`.")
+            tool_lookup[tool.name] = tool.feature_schema_id
+            flatten_classification(tool.classifications)
+            normalized_tools.append({
+                'tool':
+                    tool.tool.value,
+                'featureSchemaId':
+                    tool.feature_schema_id,
+                'classifications': [
+                    normalize_classification(classification)
+                    for classification in tool.classifications
+                ]
+            })
+        flatten_classification(ontology_builder.classifications)
+        return cls(
+            tool_lookup,
+            classification_lookup,
+            normalized_ontology={
+                'tools':
+                    normalized_tools,
+                'classifications': [
+                    normalize_classification(classification)
+                    for classification in ontology_builder.classifications
+                ]
+            })
+
+    @classmethod
+    def from_ontology(cls, ontology_: ontology.Ontology) -> "OntologyIndex":
+        """
+        Compiles the index of an ontology. Indices are immutable, so an ontology is only compiled
+        again once it has been updated.
+        """
+        key = (ontology_.uid, ontology_.updated_at)
+        with _ontology_indices_lock:
+            index = _ontology_indices.get(key)
+            if index is not None:
+                _ontology_indices.move_to_end(key)
+                return index
+        index = cls.from_ontology_builder(
+            ontology.OntologyBuilder.from_ontology(ontology_))
+        if ontology_.updated_at is not None:
+            with _ontology_indices_lock:
+                _ontology_indices[key] = index
+                while len(_ontology_indices) > _MAX_CACHED_ONTOLOGIES:
+                    _ontology_indices.popitem(last=False)
+        return index
+
+    @property
+    def tools(self) -> Mapping[str, str]:
+        return self._tools
+
+    @property
+    def classifications(self) -> Mapping[str, str]:
+        return self._classifications
+
+    @property
+    def mal_schemas(self) -> Dict[str, Any]:
+        """
+        Feature schemas keyed by feature schema id in the format used for MAL ndjson validation.
+        See `labelbox.schema.bulk_import_request.get_mal_schemas`.
+        """
+        if self._mal_schemas is None:
+            if self._normalized_ontology is None:
+                raise ValueError(
+                    "OntologyIndex must be created from an ontology to use mal_schemas."
                 )
-            flatten_classification(classification.options)
-
-    for tool in ontology_builder.tools:
-        if tool.feature_schema_id is None:
-            raise ValueError(
-                f"feature_schema_id cannot be None for tool `{tool.name}`.")
-        tool_lookup[tool.name] = tool.feature_schema_id
-        flatten_classification(tool.classifications)
-    flatten_classification(ontology_builder.classifications)
-    return tool_lookup, classification_lookup
+            object.__setattr__(self, '_mal_schemas',
+                               get_mal_schemas(self._normalized_ontology))
+        return self._mal_schemas
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{self.__class__.__name__} is immutable.")
+
+    def __repr__(self) -> str:
+        return f"OntologyIndex(tools={dict(self.tools)}, " \
+               f"classifications={dict(self.classifications)})"
+
+
+def get_feature_schema_lookup(
+    ontology_builder: Union[ontology.OntologyBuilder, OntologyIndex]
+) -> Tuple[Dict[str, str], Dict[str, str]]:
+    index = ontology_builder if isinstance(
+        ontology_builder, OntologyIndex
+    ) else OntologyIndex.from_ontology_builder(ontology_builder)
+    return dict(index.tools), dict(index.classifications)
 
 
 def _get_options(annotation: ClassificationAnnotation,
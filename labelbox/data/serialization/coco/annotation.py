@@ -6,16 +6,11 @@ from pydantic import BaseModel
 import numpy as np
 
 from .path import PathSerializerMixin
+from ...annotation_types import RunLengthEncoding
 
 
-def rle_decoding(rle_arr: List[int], w: int, h: int) -> np.ndarray:
-    indices = []
-    for idx, cnt in zip(rle_arr[0::2], rle_arr[1::2]):
-        indices.extend(list(range(idx - 1,
-                                  idx + cnt - 1)))  # RLE is 1-based index
-    mask = np.zeros(h * w, dtype=np.uint8)
-    mask[indices] = 1
-    return mask.reshape((w, h)).T
+def rle_decoding(rle_arr: Union[List[int], str], w: int, h: int) -> np.ndarray:
+    return RunLengthEncoding(counts=rle_arr, size=(h, w)).to_array()
 
 
 def get_annotation_lookup(annotations):
@@ -35,8 +30,9 @@ class SegmentInfo(BaseModel):
 
 
 class RLE(BaseModel):
-    counts: List[int]
-    size: Tuple[int, int]  # h,w or w,h?
+    # Run lengths or a compressed string
+    counts: Union[List[int], str]
+    size: Tuple[int, int]  # h,w
 
 
 class COCOObjectAnnotation(BaseModel):
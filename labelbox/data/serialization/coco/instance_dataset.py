@@ -8,10 +8,10 @@ import numpy as np
 from tqdm import tqdm
 from pydantic import BaseModel
 
-from ...annotation_types import ImageData, MaskData, Mask, ObjectAnnotation, Label, Polygon, Point, Rectangle
+from ...annotation_types import ImageData, MaskData, Mask, ObjectAnnotation, Label, Polygon, Point, Rectangle, RunLengthEncoding
 from ...annotation_types.collection import LabelCollection
 from .categories import Categories, hash_category_name
-from .annotation import COCOObjectAnnotation, RLE, get_annotation_lookup, rle_decoding
+from .annotation import COCOObjectAnnotation, RLE, get_annotation_lookup
 from .image import CocoImage, get_image, get_image_id
 import json
 
@@ -48,8 +48,7 @@ def vector_to_coco_object_annotation(annotation: ObjectAnnotation,
     xmin, ymin, xmax, ymax = shapely.bounds
     segmentation = []
     if isinstance(annotation.value, Polygon):
-        for point in annotation.value.points:
-            segmentation.extend([point.x, point.y])
+        segmentation.extend(annotation.value.coordinates.ravel().tolist())
     else:
         box = annotation.value
         segmentation.extend([
@@ -68,11 +67,10 @@ def vector_to_coco_object_annotation(annotation: ObjectAnnotation,
 
 def rle_to_common(class_annotations: COCOObjectAnnotation,
                   class_name: str) -> ObjectAnnotation:
-    mask = rle_decoding(class_annotations.segmentation.counts,
-                        *class_annotations.segmentation.size[::-1])
+    rle = RunLengthEncoding(counts=class_annotations.segmentation.counts,
+                            size=class_annotations.segmentation.size)
     return ObjectAnnotation(name=class_name,
-                            value=Mask(mask=MaskData.from_2D_arr(mask),
-                                       color=[1, 1, 1]))
+                            value=Mask(mask=MaskData(rle=rle), color=[1, 1, 1]))
 
 
 def segmentations_to_common(class_annotations: COCOObjectAnnotation,
@@ -1,4 +1,4 @@
-from typing import List, Union
+from typing import Any, Dict, List, Type, Union
 
 from pydantic.main import BaseModel
 
@@ -19,6 +19,17 @@ class LBV1ClassificationAnswer(LBV1Feature):
                                         'value': self.value
                                     })
 
+    @staticmethod
+    def trusted_to_common(answer: Dict[str, Any]) -> ClassificationAnswer:
+        return ClassificationAnswer.construct(
+            feature_schema_id=answer.get('schemaId'),
+            name=answer.get('title'),
+            keyframe=answer.get('keyframe'),
+            extra={
+                'feature_id': answer.get('featureId'),
+                'value': LBV1Feature.trusted_value(answer)
+            })
+
     @classmethod
     def from_common(
             cls,
@@ -36,6 +47,11 @@ class LBV1Radio(LBV1Feature):
     def to_common(self) -> Radio:
         return Radio(answer=self.answer.to_common())
 
+    @staticmethod
+    def trusted_to_common(classification: Dict[str, Any]) -> Radio:
+        return Radio.construct(answer=LBV1ClassificationAnswer.
+                               trusted_to_common(classification['answer']))
+
     @classmethod
     def from_common(cls, radio: Radio, feature_schema_id: Cuid,
                     **extra) -> "LBV1Radio":
@@ -50,6 +66,13 @@ class LBV1Checklist(LBV1Feature):
     def to_common(self) -> Checklist:
         return Checklist(answer=[answer.to_common() for answer in self.answers])
 
+    @staticmethod
+    def trusted_to_common(classification: Dict[str, Any]) -> Checklist:
+        return Checklist.construct(answer=[
+            LBV1ClassificationAnswer.trusted_to_common(answer)
+            for answer in classification['answers']
+        ])
+
     @classmethod
     def from_common(cls, checklist: Checklist, feature_schema_id: Cuid,
                     **extra) -> "LBV1Checklist":
@@ -67,6 +90,13 @@ class LBV1Dropdown(LBV1Feature):
     def to_common(self) -> Dropdown:
         return Dropdown(answer=[answer.to_common() for answer in self.answer])
 
+    @staticmethod
+    def trusted_to_common(classification: Dict[str, Any]) -> Dropdown:
+        return Dropdown.construct(answer=[
+            LBV1ClassificationAnswer.trusted_to_common(answer)
+            for answer in classification['answer']
+        ])
+
     @classmethod
     def from_common(cls, dropdown: Dropdown, feature_schema_id: Cuid,
                     **extra) -> "LBV1Dropdown":
@@ -84,6 +114,10 @@ class LBV1Text(LBV1Feature):
     def to_common(self) -> Text:
         return Text(answer=self.answer)
 
+    @staticmethod
+    def trusted_to_common(classification: Dict[str, Any]) -> Text:
+        return Text.construct(answer=str(classification['answer']))
+
     @classmethod
     def from_common(cls, text: Text, feature_schema_id: Cuid,
                     **extra) -> "LBV1Text":
@@ -107,6 +141,25 @@ class LBV1Classifications(BaseModel):
         ]
         return classifications
 
+    @staticmethod
+    def trusted_to_common(
+        classifications: List[Dict[str,
+                                   Any]]) -> List[ClassificationAnnotation]:
+        """
+        Same as `to_common` but builds the annotations directly from the exported json without validation.
+        """
+        return [
+            ClassificationAnnotation.construct(
+                value=LBV1Classifications.lookup_trusted_classification(
+                    classification).trusted_to_common(classification),
+                name=classification.get('title'),
+                feature_schema_id=classification.get('schemaId'),
+                extra={
+                    'value': LBV1Feature.trusted_value(classification),
+                    'feature_id': classification.get('featureId')
+                }) for classification in classifications
+        ]
+
     @classmethod
     def from_common(
             cls, annotations: List[ClassificationAnnotation]
@@ -133,3 +186,17 @@ class LBV1Classifications(BaseModel):
             Checklist: LBV1Checklist,
             Radio: LBV1Radio
         }.get(type(annotation.value))
+
+    @staticmethod
+    def lookup_trusted_classification(
+        classification: Dict[str, Any]
+    ) -> Type[Union[LBV1Text, LBV1Radio, LBV1Dropdown, LBV1Checklist]]:
+        # Matches the order that the `classifications` union is validated in
+        answer = classification.get('answer')
+        if isinstance(answer, dict):
+            return LBV1Radio
+        elif isinstance(answer, list):
+            return LBV1Dropdown
+        elif answer is None and 'answers' in classification:
+            return LBV1Checklist
+        return LBV1Text
@@ -20,29 +20,35 @@ class LBV1Converter:
 
     @staticmethod
     def deserialize_video(json_data: Union[str, Iterable[Dict[str, Any]]],
-                          client: "labelbox.Client") -> LabelGenerator:
+                          client: "labelbox.Client",
+                          trusted: bool = False) -> LabelGenerator:
         """
         Converts a labelbox video export into the common labelbox format.
 
         Args:
             json_data: An iterable representing the labelbox video export.
             client: The labelbox client for downloading video annotations
+            trusted: Skip validating the annotations. Only use this for exports that come directly from labelbox.
         Returns:
             LabelGenerator containing the video data.
         """
-        label_generator = (LBV1Label(**example).to_common()
+        to_common = LBV1Label.trusted_to_common if trusted else (
+            lambda example: LBV1Label(**example).to_common())
+        label_generator = (to_common(example)
                            for example in LBV1VideoIterator(json_data, client)
                            if example['Label'])
         return LabelGenerator(data=label_generator)
 
     @staticmethod
-    def deserialize(
-            json_data: Union[str, Iterable[Dict[str, Any]]]) -> LabelGenerator:
+    def deserialize(json_data: Union[str, Iterable[Dict[str, Any]]],
+                    trusted: bool = False) -> LabelGenerator:
         """
         Converts a labelbox export (non-video) into the common labelbox format.
 
         Args:
             json_data: An iterable representing the labelbox export.
+            trusted: Skip validating the annotations. Only use this for exports that come directly from labelbox.
+                Invalid data will not raise an error and can produce invalid annotations.
         Returns:
             LabelGenerator containing the export data.
         """
@@ -56,7 +62,10 @@ class LBV1Converter:
 
                 if example['Label']:
                     # Don't construct empty dict
-                    yield LBV1Label(**example).to_common()
+                    if trusted:
+                        yield LBV1Label.trusted_to_common(example)
+                    else:
+                        yield LBV1Label(**example).to_common()
 
         return LabelGenerator(data=label_generator())
 
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from pydantic import BaseModel, root_validator
 
@@ -19,6 +19,12 @@ class LBV1Feature(BaseModel):
             values['value'] = values['title']
         return values
 
+    @staticmethod
+    def trusted_value(data: Dict[str, Any]) -> Optional[str]:
+        # Same as `check_ids` for features that skip validation
+        value = data.get('value')
+        return data.get('title') if value is None else value
+
     def dict(self, *args, **kwargs):
         res = super().dict(*args, **kwargs)
         # This means these are no video frames ..
@@ -1,8 +1,8 @@
 from labelbox.data.annotation_types.data.tiled_image import TiledImageData
 from labelbox.utils import camel_case
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
 
 from ...annotation_types.annotation import (ClassificationAnnotation,
                                             ObjectAnnotation,
@@ -11,7 +11,8 @@ from ...annotation_types.annotation import (ClassificationAnnotation,
 from ...annotation_types.data import ImageData, TextData, VideoData
 from ...annotation_types.label import Label
 from .classification import LBV1Classifications
-from .objects import LBV1Objects, LBV1TextEntity
+from .feature import LBV1Feature
+from .objects import LBV1ObjectBase, LBV1Objects, LBV1TextEntity
 
 
 class LBV1LabelAnnotations(LBV1Classifications, LBV1Objects):
@@ -22,6 +23,15 @@ class LBV1LabelAnnotations(LBV1Classifications, LBV1Objects):
         objects = LBV1Objects.to_common(self)
         return [*objects, *classifications]
 
+    @staticmethod
+    def trusted_to_common(
+        label: Dict[str, Any]
+    ) -> List[Union[ObjectAnnotation, ClassificationAnnotation]]:
+        classifications = LBV1Classifications.trusted_to_common(
+            label.get('classifications', []))
+        objects = LBV1Objects.trusted_to_common(label['objects'])
+        return [*objects, *classifications]
+
     @classmethod
     def from_common(
         cls, annotations: List[Union[ClassificationAnnotation,
@@ -77,6 +87,39 @@ class LBV1LabelAnnotationsVideo(LBV1LabelAnnotations):
         ]
         return [*classifications, *objects]
 
+    @staticmethod
+    def trusted_to_common(
+        frame: Dict[str, Any]
+    ) -> List[Union[VideoClassificationAnnotation, VideoObjectAnnotation]]:
+        frame_number = frame['frameNumber']
+        classifications = [
+            VideoClassificationAnnotation.construct(
+                value=LBV1Classifications.lookup_trusted_classification(
+                    classification).trusted_to_common(classification),
+                frame=frame_number,
+                name=classification.get('title'),
+                feature_schema_id=classification.get('schemaId'))
+            for classification in frame.get('classifications', [])
+        ]
+
+        objects = [
+            VideoObjectAnnotation.construct(
+                value=LBV1Objects.lookup_trusted_object(obj).trusted_to_common(
+                    obj),
+                keyframe=obj.get('keyframe'),
+                classifications=LBV1ObjectBase.trusted_subclasses(obj),
+                name=obj.get('title'),
+                frame=frame_number,
+                feature_schema_id=obj.get('schemaId'),
+                extra={
+                    'value': LBV1Feature.trusted_value(obj),
+                    'instanceURI': obj.get('instanceURI'),
+                    'color': obj.get('color'),
+                    'feature_id': obj.get('featureId'),
+                }) for obj in frame['objects']
+        ]
+        return [*classifications, *objects]
+
     @classmethod
     def from_common(
         cls, annotations: List[Union[VideoObjectAnnotation,
@@ -154,11 +197,59 @@ class LBV1Label(BaseModel):
         return Label(data=self._data_row_to_common(),
                      uid=self.id,
                      annotations=annotations,
-                     extra={
-                         field.alias: getattr(self, field_name)
-                         for field_name, field in self.__fields__.items()
-                         if field.field_info.extra.get('extra_field')
-                     })
+                     extra=self._extra_to_common())
+
+    @classmethod
+    def trusted_to_common(cls, example: Dict[str, Any]) -> Label:
+        """
+        Same as `LBV1Label(**example).to_common()` for exports that are known to be valid.
+
+        The annotations are built directly from the json with `construct()` instead of being validated twice
+        (once by the LBV1 models and once by the annotation types). Only the top level export fields are validated.
+
+        Args:
+            example: A single label from a labelbox export
+        Returns:
+            Label
+        """
+        values, errors = {}, []
+        for field_name, field in cls.__fields__.items():
+            if field_name == 'label' or field.alias not in example:
+                continue
+            values[field_name], error = field.validate(example[field.alias],
+                                                       values,
+                                                       loc=field.alias,
+                                                       cls=cls)
+            if error:
+                errors.append(error)
+        if errors:
+            raise ValidationError(errors, cls)
+
+        label = example['Label']
+        if isinstance(label, list):
+            annotations = []
+            for frame in label:
+                annotations.extend(
+                    LBV1LabelAnnotationsVideo.trusted_to_common(frame))
+            values['media_type'] = values.get('media_type') or 'video'
+        else:
+            annotations = LBV1LabelAnnotations.trusted_to_common(label)
+            if not values.get('media_type') and label['objects']:
+                object_types = {
+                    LBV1Objects.lookup_trusted_object(obj)
+                    for obj in label['objects']
+                }
+                values['media_type'] = ('text' if LBV1TextEntity in object_types
+                                        else 'image')
+
+        # Media types are already known unless there are no object annotations
+        lbv1_label = cls.construct(label=LBV1LabelAnnotations.construct(
+            objects=[], classifications=[]),
+                                   **values)
+        return Label.construct(data=lbv1_label._data_row_to_common(),
+                               uid=lbv1_label.id,
+                               annotations=annotations,
+                               extra=lbv1_label._extra_to_common())
 
     @classmethod
     def from_common(cls, label: Label):
@@ -175,6 +266,13 @@ class LBV1Label(BaseModel):
                          external_id=label.data.external_id,
                          **label.extra)
 
+    def _extra_to_common(self) -> Dict[str, Any]:
+        return {
+            field.alias: getattr(self, field_name)
+            for field_name, field in self.__fields__.items()
+            if field.field_info.extra.get('extra_field')
+        }
+
     def _data_row_to_common(
             self) -> Union[ImageData, TextData, VideoData, TiledImageData]:
         # Use data row information to construct the appropriate annotation type
@@ -46,6 +46,26 @@ class LBV1ObjectBase(LBV1Feature):
             return subclasses
         return value
 
+    @staticmethod
+    def trusted_subclasses(
+            obj: Dict[str, Any]) -> List[ClassificationAnnotation]:
+        # Same as `validate_subclasses` followed by the subclass conversion in `to_common`
+        subclasses = []
+        for value in obj.get('classifications', []):
+            subclasses.extend(value if isinstance(value, list) else [value])
+        return [
+            ClassificationAnnotation.construct(
+                value=LBV1Classifications.lookup_trusted_classification(
+                    subclass).trusted_to_common(subclass),
+                feature_schema_id=subclass.get('schemaId'),
+                name=subclass.get('title'),
+                extra={
+                    'feature_id': subclass.get('featureId'),
+                    'title': subclass.get('title'),
+                    'value': LBV1Feature.trusted_value(subclass)
+                }) for subclass in subclasses
+        ]
+
 
 class TIPointCoordinate(BaseModel):
     coordinates: List[float]
@@ -71,15 +91,22 @@ class LBV1TIPoint(LBV1ObjectBase):
         lng, lat = self.geometry.coordinates
         return Point(x=lng, y=lat)
 
+    @staticmethod
+    def trusted_to_common(obj: Dict[str, Any]) -> Point:
+        lng, lat = obj['geometry']['coordinates']
+        return Point.construct(x=float(lng), y=float(lat))
+
 
 class LBV1TILine(LBV1ObjectBase):
     object_type: Literal['polyline'] = Field(..., alias='type')
     geometry: TILineCoordinate
 
     def to_common(self) -> Line:
-        return Line(points=[
-            Point(x=coord[0], y=coord[1]) for coord in self.geometry.coordinates
-        ])
+        return Line.from_array(self.geometry.coordinates)
+
+    @staticmethod
+    def trusted_to_common(obj: Dict[str, Any]) -> Line:
+        return Line.from_array(obj['geometry']['coordinates'])
 
 
 class LBV1TIPolygon(LBV1ObjectBase):
@@ -88,8 +115,12 @@ class LBV1TIPolygon(LBV1ObjectBase):
 
     def to_common(self) -> Polygon:
         for coord_list in self.geometry.coordinates:
-            return Polygon(
-                points=[Point(x=coord[0], y=coord[1]) for coord in coord_list])
+            return Polygon.from_array(coord_list)
+
+    @staticmethod
+    def trusted_to_common(obj: Dict[str, Any]) -> Polygon:
+        for coord_list in obj['geometry']['coordinates']:
+            return Polygon.from_array(coord_list)
 
 
 class LBV1TIRectangle(LBV1ObjectBase):
@@ -108,6 +139,15 @@ class LBV1TIRectangle(LBV1ObjectBase):
         return Rectangle(start=Point(x=start[0], y=start[1]),
                          end=Point(x=end[0], y=end[1]))
 
+    @staticmethod
+    def trusted_to_common(obj: Dict[str, Any]) -> Rectangle:
+        coord_list = np.array(obj['geometry']['coordinates'][0],
+                              dtype=np.float64)
+        min_x, min_y = coord_list.min(axis=0).tolist()
+        max_x, max_y = coord_list.max(axis=0).tolist()
+        return Rectangle.construct(start=Point.construct(x=min_x, y=min_y),
+                                   end=Point.construct(x=max_x, y=max_y))
+
 
 class _Point(BaseModel):
     x: float
@@ -129,6 +169,15 @@ class LBV1Rectangle(LBV1ObjectBase):
                          end=Point(x=self.bbox.left + self.bbox.width,
                                    y=self.bbox.top + self.bbox.height))
 
+    @staticmethod
+    def trusted_to_common(obj: Dict[str, Any]) -> Rectangle:
+        bbox = obj['bbox']
+        left, top = float(bbox['left']), float(bbox['top'])
+        return Rectangle.construct(start=Point.construct(x=left, y=top),
+                                   end=Point.construct(
+                                       x=left + float(bbox['width']),
+                                       y=top + float(bbox['height'])))
+
     @classmethod
     def from_common(cls, rectangle: Rectangle,
                     classifications: List[ClassificationAnnotation],
@@ -150,7 +199,11 @@ class LBV1Polygon(LBV1ObjectBase):
     polygon: List[_Point]
 
     def to_common(self) -> Polygon:
-        return Polygon(points=[Point(x=p.x, y=p.y) for p in self.polygon])
+        return Polygon.from_array([[p.x, p.y] for p in self.polygon])
+
+    @staticmethod
+    def trusted_to_common(obj: Dict[str, Any]) -> Polygon:
+        return Polygon.from_array([[p['x'], p['y']] for p in obj['polygon']])
 
     @classmethod
     def from_common(cls, polygon: Polygon,
@@ -159,7 +212,7 @@ class LBV1Polygon(LBV1ObjectBase):
                     extra: Dict[str, Any]) -> "LBV1Polygon":
         return cls(
             polygon=[
-                _Point(x=point.x, y=point.y) for point in polygon.points[:-1]
+                _Point(x=x, y=y) for x, y in polygon.coordinates[:-1].tolist()
             ],  # drop closing point
             classifications=classifications,
             schema_id=feature_schema_id,
@@ -173,6 +226,11 @@ class LBV1Point(LBV1ObjectBase):
     def to_common(self) -> Point:
         return Point(x=self.point.x, y=self.point.y)
 
+    @staticmethod
+    def trusted_to_common(obj: Dict[str, Any]) -> Point:
+        return Point.construct(x=float(obj['point']['x']),
+                               y=float(obj['point']['y']))
+
     @classmethod
     def from_common(cls, point: Point,
                     classifications: List[ClassificationAnnotation],
@@ -189,7 +247,11 @@ class LBV1Line(LBV1ObjectBase):
     line: List[_Point]
 
     def to_common(self) -> Line:
-        return Line(points=[Point(x=p.x, y=p.y) for p in self.line])
+        return Line.from_array([[p.x, p.y] for p in self.line])
+
+    @staticmethod
+    def trusted_to_common(obj: Dict[str, Any]) -> Line:
+        return Line.from_array([[p['x'], p['y']] for p in obj['line']])
 
     @classmethod
     def from_common(cls, polygon: Line,
@@ -197,7 +259,7 @@ class LBV1Line(LBV1ObjectBase):
                     feature_schema_id: Cuid, title: str,
                     extra: Dict[str, Any]) -> "LBV1Line":
         return cls(
-            line=[_Point(x=point.x, y=point.y) for point in polygon.points],
+            line=[_Point(x=x, y=y) for x, y in polygon.coordinates.tolist()],
             classifications=classifications,
             schema_id=feature_schema_id,
             title=title,
@@ -210,6 +272,11 @@ class LBV1Mask(LBV1ObjectBase):
     def to_common(self) -> Mask:
         return Mask(mask=MaskData(url=self.instanceURI), color=(255, 255, 255))
 
+    @staticmethod
+    def trusted_to_common(obj: Dict[str, Any]) -> Mask:
+        return Mask.construct(mask=MaskData(url=obj['instanceURI']),
+                              color=(255, 255, 255))
+
     @classmethod
     def from_common(cls, mask: Mask,
                     classifications: List[ClassificationAnnotation],
@@ -246,6 +313,12 @@ class LBV1TextEntity(LBV1ObjectBase):
             end=self.data.location.end,
         )
 
+    @staticmethod
+    def trusted_to_common(obj: Dict[str, Any]) -> TextEntity:
+        location = obj['data']['location']
+        return TextEntity.construct(start=int(location['start']),
+                                    end=int(location['end']))
+
     @classmethod
     def from_common(cls, text_entity: TextEntity,
                     classifications: List[ClassificationAnnotation],
@@ -289,6 +362,27 @@ class LBV1Objects(BaseModel):
         ]
         return objects
 
+    @staticmethod
+    def trusted_to_common(
+            objects: List[Dict[str, Any]]) -> List[ObjectAnnotation]:
+        """
+        Same as `to_common` but builds the annotations directly from the exported json without validation.
+        """
+        return [
+            ObjectAnnotation.construct(
+                value=LBV1Objects.lookup_trusted_object(obj).trusted_to_common(
+                    obj),
+                classifications=LBV1ObjectBase.trusted_subclasses(obj),
+                name=obj.get('title'),
+                feature_schema_id=obj.get('schemaId'),
+                extra={
+                    'instanceURI': obj.get('instanceURI'),
+                    'color': obj.get('color'),
+                    'feature_id': obj.get('featureId'),
+                    'value': LBV1Feature.trusted_value(obj),
+                }) for obj in objects
+        ]
+
     @classmethod
     def from_common(cls, annotations: List[ObjectAnnotation]) -> "LBV1Objects":
         objects = []
@@ -322,3 +416,28 @@ class LBV1Objects(BaseModel):
         if result is None:
             raise TypeError(f"Unexpected type {type(annotation.value)}")
         return result
+
+    @staticmethod
+    def lookup_trusted_object(
+        obj: Dict[str, Any]
+    ) -> Type[Union[LBV1Line, LBV1Point, LBV1Polygon, LBV1Rectangle,
+                    LBV1TextEntity, LBV1Mask, LBV1TIPoint, LBV1TILine,
+                    LBV1TIPolygon, LBV1TIRectangle]]:
+        # Matches the order that the `objects` union is validated in
+        for key, object_type in (('line', LBV1Line), ('point', LBV1Point),
+                                 ('polygon', LBV1Polygon),
+                                 ('bbox', LBV1Rectangle), ('data',
+                                                           LBV1TextEntity)):
+            if key in obj:
+                return object_type
+        if obj.get('instanceURI') is not None:
+            return LBV1Mask
+        result = {
+            'point': LBV1TIPoint,
+            'polyline': LBV1TILine,
+            'polygon': LBV1TIPolygon,
+            'rectangle': LBV1TIRectangle
+        }.get(obj.get('type'))
+        if result is None:
+            raise TypeError(f"Unexpected object {obj}")
+        return result
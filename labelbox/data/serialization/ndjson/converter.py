@@ -10,15 +10,19 @@ logger = logging.getLogger(__name__)
 class NDJsonConverter:
 
     @staticmethod
-    def deserialize(json_data: Iterable[Dict[str, Any]]) -> LabelGenerator:
+    def deserialize(json_data: Iterable[Dict[str, Any]],
+                    trusted: bool = False) -> LabelGenerator:
         """
         Converts ndjson data (prediction import format) into the common labelbox format.
 
         Args:
             json_data: An iterable representing the ndjson data
+            trusted: Skip validating vector annotations. Only use this for ndjson that is known to be valid.
         Returns:
             LabelGenerator containing the ndjson data.
         """
+        if trusted:
+            return NDLabel.trusted_to_common(json_data)
         data = NDLabel(**{'annotations': json_data})
         res = data.to_common()
         return res
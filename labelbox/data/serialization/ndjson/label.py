@@ -1,6 +1,6 @@
 from itertools import groupby
 from operator import itemgetter
-from typing import Dict, Generator, List, Tuple, Union
+from typing import Any, Dict, Generator, Iterable, List, Tuple, Union
 from collections import defaultdict
 import warnings
 
@@ -13,6 +13,7 @@ from ...annotation_types.label import Label
 from ...annotation_types.ner import TextEntity
 from ...annotation_types.classification import Dropdown
 from ...annotation_types.metrics import ScalarMetric, ConfusionMatrixMetric
+from ...annotation_types.video_track import assign_segments
 
 from .metric import NDScalarMetric, NDMetricAnnotation, NDConfusionMatrixMetric
 from .classification import NDChecklistSubclass, NDClassification, NDClassificationType, NDRadioSubclass
@@ -31,6 +32,25 @@ class NDLabel(BaseModel):
         return LabelGenerator(
             data=self._generate_annotations(grouped_annotations))
 
+    @classmethod
+    def trusted_to_common(
+            cls, json_data: Iterable[Dict[str, Any]]) -> LabelGenerator:
+        """
+        Same as `NDLabel(annotations=json_data).to_common()` for ndjson that is known to be valid.
+
+        Points, lines, polygons and bounding boxes without subclasses are built with `construct()`.
+        Each of the other annotations is validated on its own.
+        """
+        grouped_annotations = defaultdict(list)
+        for data in json_data:
+            if NDObject.lookup_trusted_object(data) is not None:
+                annotation = NDObject.trusted_to_common(data)
+            else:
+                annotation = cls(annotations=[data]).annotations[0]
+            grouped_annotations[data['dataRow']['id']].append(annotation)
+        return LabelGenerator(
+            data=cls._generate_annotations(grouped_annotations, trusted=True))
+
     @classmethod
     def from_common(cls,
                     data: LabelCollection) -> Generator["NDLabel", None, None]:
@@ -38,17 +58,23 @@ class NDLabel(BaseModel):
             yield from cls._create_non_video_annotations(label)
             yield from cls._create_video_annotations(label)
 
+    @classmethod
     def _generate_annotations(
-        self,
-        grouped_annotations: Dict[str,
-                                  List[Union[NDObjectType, NDClassificationType,
-                                             NDConfusionMatrixMetric,
-                                             NDScalarMetric, NDSegments]]]
-    ) -> Generator[Label, None, None]:
+            cls,
+            grouped_annotations: Dict[str,
+                                      List[Union[NDObjectType,
+                                                 NDClassificationType,
+                                                 NDConfusionMatrixMetric,
+                                                 NDScalarMetric, NDSegments,
+                                                 ObjectAnnotation]]],
+            trusted: bool = False) -> Generator[Label, None, None]:
         for data_row_id, annotations in grouped_annotations.items():
             annots = []
             for annotation in annotations:
-                if isinstance(annotation, NDSegments):
+                if isinstance(annotation, ObjectAnnotation):
+                    # Already converted by `trusted_to_common`
+                    annots.append(annotation)
+                elif isinstance(annotation, NDSegments):
                     annots.extend(
                         NDSegments.to_common(annotation, annotation.schema_id))
 
@@ -62,11 +88,15 @@ class NDLabel(BaseModel):
                 else:
                     raise TypeError(
                         f"Unsupported annotation. {type(annotation)}")
-            data = self._infer_media_type(annotations)(uid=data_row_id)
-            yield Label(annotations=annots, data=data)
+            data = cls._infer_media_type(annotations)(uid=data_row_id)
+            if trusted:
+                yield Label.construct(annotations=annots, data=data)
+            else:
+                yield Label(annotations=annots, data=data)
 
+    @classmethod
     def _infer_media_type(
-        self, annotations: List[Union[NDObjectType, NDClassificationType]]
+        cls, annotations: List[Union[NDObjectType, NDClassificationType]]
     ) -> Union[TextEntity, TextData, ImageData]:
         types = {type(annotation) for annotation in annotations}
         if TextEntity in types:
@@ -114,13 +144,17 @@ class NDLabel(BaseModel):
                     """Nested classifications are not currently supported
                     for video object annotations
                     and will not import alongside the object annotations.""")
-                segments = []
-                for start_frame, end_frame in consecutive_frames:
-                    segment = []
-                    for annotation in annotation_group:
-                        if annotation.keyframe and start_frame <= annotation.frame <= end_frame:
-                            segment.append(annotation)
-                    segments.append(segment)
+                keyframes = [
+                    annotation for annotation in annotation_group
+                    if annotation.keyframe
+                ]
+                segment_indices = assign_segments(
+                    [annotation.frame for annotation in keyframes],
+                    consecutive_frames)
+                segments = [[] for _ in consecutive_frames]
+                for annotation, idx in zip(keyframes, segment_indices.tolist()):
+                    if idx >= 0:
+                        segments[idx].append(annotation)
                 yield NDObject.from_common(segments, label.data)
 
     @classmethod
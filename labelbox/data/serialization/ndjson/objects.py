@@ -1,6 +1,7 @@
 from ast import Bytes
 from io import BytesIO
-from typing import Any, Dict, List, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Type, Union
+from uuid import uuid4
 import base64
 import numpy as np
 
@@ -45,6 +46,11 @@ class NDPoint(NDBaseObject):
     def to_common(self) -> Point:
         return Point(x=self.point.x, y=self.point.y)
 
+    @staticmethod
+    def trusted_to_common(data: Dict[str, Any]) -> Point:
+        return Point.construct(x=float(data['point']['x']),
+                               y=float(data['point']['y']))
+
     @classmethod
     def from_common(cls, point: Point,
                     classifications: List[ClassificationAnnotation],
@@ -64,7 +70,11 @@ class NDLine(NDBaseObject):
     line: List[_Point]
 
     def to_common(self) -> Line:
-        return Line(points=[Point(x=pt.x, y=pt.y) for pt in self.line])
+        return Line.from_array([[pt.x, pt.y] for pt in self.line])
+
+    @staticmethod
+    def trusted_to_common(data: Dict[str, Any]) -> Line:
+        return Line.from_array([[pt['x'], pt['y']] for pt in data['line']])
 
     @classmethod
     def from_common(cls, line: Line,
@@ -72,9 +82,9 @@ class NDLine(NDBaseObject):
                     feature_schema_id: Cuid, extra: Dict[str, Any],
                     data: Union[ImageData, TextData]) -> "NDLine":
         return cls(line=[{
-            'x': pt.x,
-            'y': pt.y
-        } for pt in line.points],
+            'x': x,
+            'y': y
+        } for x, y in line.coordinates.tolist()],
                    dataRow=DataRow(id=data.uid),
                    schema_id=feature_schema_id,
                    uuid=extra.get('uuid'),
@@ -85,7 +95,12 @@ class NDPolygon(NDBaseObject):
     polygon: List[_Point]
 
     def to_common(self) -> Polygon:
-        return Polygon(points=[Point(x=pt.x, y=pt.y) for pt in self.polygon])
+        return Polygon.from_array([[pt.x, pt.y] for pt in self.polygon])
+
+    @staticmethod
+    def trusted_to_common(data: Dict[str, Any]) -> Polygon:
+        return Polygon.from_array([[pt['x'], pt['y']] for pt in data['polygon']
+                                  ])
 
     @classmethod
     def from_common(cls, polygon: Polygon,
@@ -93,9 +108,9 @@ class NDPolygon(NDBaseObject):
                     feature_schema_id: Cuid, extra: Dict[str, Any],
                     data: Union[ImageData, TextData]) -> "NDPolygon":
         return cls(polygon=[{
-            'x': pt.x,
-            'y': pt.y
-        } for pt in polygon.points],
+            'x': x,
+            'y': y
+        } for x, y in polygon.coordinates.tolist()],
                    dataRow=DataRow(id=data.uid),
                    schema_id=feature_schema_id,
                    uuid=extra.get('uuid'),
@@ -110,6 +125,15 @@ class NDRectangle(NDBaseObject):
                          end=Point(x=self.bbox.left + self.bbox.width,
                                    y=self.bbox.top + self.bbox.height))
 
+    @staticmethod
+    def trusted_to_common(data: Dict[str, Any]) -> Rectangle:
+        bbox = data['bbox']
+        left, top = float(bbox['left']), float(bbox['top'])
+        return Rectangle.construct(start=Point.construct(x=left, y=top),
+                                   end=Point.construct(
+                                       x=left + float(bbox['width']),
+                                       y=top + float(bbox['height'])))
+
     @classmethod
     def from_common(cls, rectangle: Rectangle,
                     classifications: List[ClassificationAnnotation],
@@ -282,6 +306,35 @@ class NDObject:
                                 classifications=classifications,
                                 extra={'uuid': annotation.uuid})
 
+    @staticmethod
+    def trusted_to_common(data: Dict[str, Any]) -> ObjectAnnotation:
+        """
+        Same as `to_common` but builds the annotation directly from the json without validation.
+        Only supports objects without subclasses. See `lookup_trusted_object`.
+        """
+        return ObjectAnnotation.construct(
+            value=NDObject.lookup_trusted_object(data).trusted_to_common(data),
+            feature_schema_id=data['schemaId'],
+            classifications=[],
+            extra={'uuid': data.get('uuid') or str(uuid4())})
+
+    @staticmethod
+    def lookup_trusted_object(
+        data: Dict[str, Any]
+    ) -> Optional[Type[Union[NDLine, NDPolygon, NDPoint, NDRectangle]]]:
+        """
+        Returns the vector object type for ndjson that can skip validation.
+        Returns None for all other annotations.
+        """
+        if data.get('classifications'):
+            return None
+        # Matches the order that `NDObjectType` is validated in
+        for key, object_type in (('line', NDLine), ('polygon', NDPolygon),
+                                 ('point', NDPoint), ('bbox', NDRectangle)):
+            if key in data:
+                return object_type
+        return None
+
     @classmethod
     def from_common(
         cls, annotation: Union[ObjectAnnotation,
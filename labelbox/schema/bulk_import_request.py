@@ -408,7 +408,7 @@ def _validate_ndjson(lines: Iterable[Dict[str, Any]],
         MALValidationError: Raise for invalid NDJson
         UuidError: Duplicate UUID in upload
     """
-    feature_schemas = get_mal_schemas(project.ontology())
+    feature_schemas = _get_project_mal_schemas(project)
     uids: Set[str] = set()
     for idx, line in enumerate(lines):
         try:
@@ -425,6 +425,16 @@ def _validate_ndjson(lines: Iterable[Dict[str, Any]],
                 f"Invalid NDJson on line {idx}") from e
 
 
+def _get_project_mal_schemas(project: "Project") -> Dict[str, Any]:
+    # The compiled ontology is reused across uploads until the ontology changes
+    try:
+        from labelbox.data.ontology import OntologyIndex
+    except ImportError:
+        # labelbox[data] isn't installed
+        return get_mal_schemas(project.ontology())
+    return OntologyIndex.from_ontology(project.ontology()).mal_schemas
+
+
 #The rest of this file contains objects for MAL validation
 def parse_classification(tool):
     """
@@ -454,13 +464,13 @@ def get_mal_schemas(ontology):
     Converts a project ontology to a dict for easier lookup during ndjson validation
 
     Args:
-        ontology (Ontology)
+        ontology (Union[Ontology, Dict]): An ontology or its normalized json
     Returns:
         Dict : Useful for looking up a tool from a given feature schema id
     """
-
+    normalized = ontology if isinstance(ontology, dict) else ontology.normalized
     valid_feature_schemas = {}
-    for tool in ontology.normalized['tools']:
+    for tool in normalized['tools']:
         classifications = [
             parse_classification(classification_tool)
             for classification_tool in tool['classifications']
@@ -470,7 +480,7 @@ def get_mal_schemas(ontology):
             'tool': tool['tool'],
             'classifications': classifications
         }
-    for tool in ontology.normalized['classifications']:
+    for tool in normalized['classifications']:
         valid_feature_schemas[tool['featureSchemaId']] = parse_classification(
             tool)
     return valid_feature_schemas
@@ -255,12 +255,16 @@ class Project(DbObject, Updateable, Deletable):
                 "Or use project.label_generator() for text and imagery data.")
         return LBV1Converter.deserialize_video(json_data, self.client)
 
-    def label_generator(self, timeout_seconds=600, **kwargs):
+    def label_generator(self, timeout_seconds=600, trusted=False, **kwargs):
         """
         Download text and image annotations, or video annotations.
 
         For a mixture of text/image and video, use project.export_labels()
 
+        Args:
+            timeout_seconds (float): Max waiting time, in seconds.
+            trusted (bool): Build the annotations without validating them.
+                Exports come directly from labelbox so this is much faster and safe to use.
         Returns:
             LabelGenerator for accessing labels
         """
@@ -286,8 +290,10 @@ class Project(DbObject, Updateable, Deletable):
                 "Use project.export_labels() to export projects with mixed data types. "
             )
         if len(is_video) and all(is_video):
-            return LBV1Converter.deserialize_video(json_data, self.client)
-        return LBV1Converter.deserialize(json_data)
+            return LBV1Converter.deserialize_video(json_data,
+                                                   self.client,
+                                                   trusted=trusted)
+        return LBV1Converter.deserialize(json_data, trusted=trusted)
 
     def export_labels(self,
                       download=False,
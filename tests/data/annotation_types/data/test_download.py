@@ -0,0 +1,141 @@
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+from labelbox.data.annotation_types.data.download import (RangedDownload,
+                                                          download_file)
+
+CONTENT = os.urandom(1_000_003)
+
+
+class Handler(BaseHTTPRequestHandler):
+    ranges = True
+    # Range requests starting at or after this byte fail
+    fail_from = None
+    requested = []
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self._send_headers(len(CONTENT))
+
+    def do_GET(self):
+        header = self.headers.get('Range')
+        if header is None or not self.ranges:
+            self.send_response(200)
+            self._send_headers(len(CONTENT))
+            self.wfile.write(CONTENT)
+            return
+        start, end = map(int, header[len('bytes='):].split('-'))
+        self.requested.append(start)
+        if self.fail_from is not None and start >= self.fail_from:
+            self.send_response(500)
+            self._send_headers(0)
+            return
+        self.send_response(206)
+        self._send_headers(end - start + 1)
+        self.wfile.write(CONTENT[start:end + 1])
+
+    def _send_headers(self, length):
+        if self.ranges:
+            self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('Content-Length', str(length))
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def file_url():
+    Handler.ranges, Handler.fail_from, Handler.requested = True, None, []
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever,
+                              args=(0.01,),
+                              daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/video.mp4"
+    server.shutdown()
+    server.server_close()
+
+
+def test_download_file(file_url, tmp_path):
+    path = download_file(file_url,
+                         tmp_path / "video.mp4",
+                         chunk_size=100_000,
+                         concurrency=4)
+    assert path.read_bytes() == CONTENT
+    assert sorted(Handler.requested) == list(range(0, len(CONTENT), 100_000))
+    assert os.listdir(tmp_path) == ["video.mp4"]
+
+
+def test_download_resume(file_url, tmp_path):
+    download = RangedDownload(file_url,
+                              tmp_path / "video.mp4",
+                              chunk_size=100_000,
+                              concurrency=1)
+    Handler.fail_from = 500_000
+    with pytest.raises(requests.HTTPError):
+        download.run()
+    assert not download.path.exists()
+    with open(download.progress_path) as file:
+        assert json.load(file)['done'] == [0, 1, 2, 3, 4]
+
+    Handler.fail_from, Handler.requested = None, []
+    RangedDownload(file_url, tmp_path / "video.mp4", chunk_size=100_000).run()
+    assert download.path.read_bytes() == CONTENT
+    assert sorted(Handler.requested) == list(
+        range(500_000, len(CONTENT), 100_000))
+    assert not download.part_path.exists()
+    assert not download.progress_path.exists()
+
+
+def test_download_without_ranges(file_url, tmp_path):
+    Handler.ranges = False
+    path = download_file(file_url, tmp_path / "video.mp4", chunk_size=100_000)
+    assert path.read_bytes() == CONTENT
+    assert Handler.requested == []
+
+
+def test_download_in_background(file_url, tmp_path):
+    download = RangedDownload(file_url,
+                              tmp_path / "video.mp4",
+                              chunk_size=100_000).start()
+    part_path = download.wait(nbytes=250_000)
+    assert download.prefix >= 250_000
+    assert part_path in (download.part_path, download.path)
+    assert download.wait() == download.path
+    assert download.path.read_bytes() == CONTENT
+
+    Handler.fail_from = 0
+    with pytest.raises(requests.HTTPError):
+        RangedDownload(file_url, tmp_path / "other.mp4").start().wait()
+
+
+def test_concurrent_downloads(file_url, tmp_path):
+    path = tmp_path / "video.mp4"
+    errors = []
+
+    def download():
+        try:
+            download_file(file_url, path, chunk_size=100_000, concurrency=2)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=download) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    assert path.read_bytes() == CONTENT
+    assert os.listdir(tmp_path) == ["video.mp4"]
+    # Downloads of the same path wait for each other and the completed file is reused
+    assert sorted(Handler.requested) == list(range(0, len(CONTENT), 100_000))
+
+    # A stale .part file doesn't replace a completed download
+    (tmp_path / "video.mp4.part").write_bytes(b"stale")
+    assert download_file(file_url, path).read_bytes() == CONTENT
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from labelbox.data.annotation_types import Mask, MaskData
+from labelbox.data.annotation_types.data.label_map import LabelMap
+
+
+def test_label_map():
+    arr = np.zeros((6, 8, 3), dtype=np.uint8)
+    arr[1:3, 2:5] = (255, 0, 0)
+    arr[4, 1] = (255, 0, 0)
+    arr[3:6, 6:8] = (0, 0, 9)
+    label_map = LabelMap(arr)
+
+    assert len(label_map) == 3
+    assert label_map.colors.tolist() == [[0, 0, 0], [0, 0, 9], [255, 0, 0]]
+    assert label_map.area((255, 0, 0)) == 7
+    assert label_map.area(0) == 48 - 13
+    assert label_map.area((1, 2, 3)) == 0
+    assert label_map.bbox((255, 0, 0)) == (1, 1, 5, 5)
+    assert label_map.bbox((0, 0, 9)) == (6, 3, 8, 6)
+    assert label_map.bbox(0) == (0, 0, 8, 6)
+    assert label_map.bbox((1, 2, 3)) is None
+
+    for color in label_map.colors:
+        expected = np.all(arr == color, axis=-1).astype(np.uint8)
+        np.testing.assert_array_equal(label_map.mask(tuple(color)), expected)
+        xmin, ymin, xmax, ymax = label_map.bbox(tuple(color))
+        np.testing.assert_array_equal(label_map.mask(tuple(color), crop=True),
+                                      expected[ymin:ymax, xmin:xmax])
+        packed = label_map.mask(tuple(color), packed=True)
+        assert packed.shape == (6, 1)
+        np.testing.assert_array_equal(np.unpackbits(packed, axis=-1, count=8),
+                                      expected)
+
+    assert not label_map.mask((1, 2, 3)).any()
+
+
+def test_label_map_dtype():
+    idx = np.arange(300).reshape(30, 10)
+    arr = np.stack([idx // 256, idx % 256, idx * 0], axis=-1)
+    label_map = LabelMap(arr.astype(np.uint8))
+    assert len(label_map) == 300
+    assert label_map.labels.dtype == np.uint16
+    assert LabelMap(np.zeros((2, 2, 3), np.uint8)).labels.dtype == np.uint8
+
+    with pytest.raises(ValueError):
+        LabelMap(np.zeros((2, 2), np.uint8))
+
+
+def test_mask_data_label_map():
+    mask_data = MaskData.from_2D_arr(
+        np.array([[0, 1, 1], [2, 2, 0]], dtype=np.uint8))
+    label_map = mask_data.label_map
+    assert mask_data.label_map is label_map
+    masks = [Mask(mask=mask_data, color=color) for color in range(3)]
+    assert masks[1].draw(color=1).tolist() == [[0, 1, 1], [0, 0, 0]]
+    assert mask_data.label_map is label_map
+
+    # Doesn't change the value
+    mask_data.url = "https://my-mask.png"
+    assert mask_data.label_map is label_map
+
+    mask_data.arr = np.stack(
+        [np.array([[1, 1, 1], [2, 2, 0]], dtype=np.uint8)] * 3, axis=-1)
+    assert mask_data.label_map is not label_map
+    assert masks[1].draw(color=1).tolist() == [[1, 1, 1], [0, 0, 0]]
@@ -1,12 +1,13 @@
 import urllib.request
 from io import BytesIO
+from types import SimpleNamespace
 
 import numpy as np
 import pytest
 from PIL import Image
 from pydantic import ValidationError
 
-from labelbox.data.annotation_types.data import ImageData
+from labelbox.data.annotation_types.data import ImageData, raster
 
 
 def test_validate_schema():
@@ -43,3 +44,146 @@ def test_ref():
     data = ImageData(im_bytes=b'', external_id=external_id, uid=uid)
     assert data.external_id == external_id
     assert data.uid == uid
+
+
+@pytest.fixture
+def decode_cache():
+    ImageData.set_decode_cache(max_bytes=1024 * 1024)
+    yield ImageData.get_decode_cache()
+    ImageData.set_decode_cache(max_bytes=None)
+
+
+def encode(arr):
+    im_bytes = BytesIO()
+    Image.fromarray(arr).save(im_bytes, format="PNG")
+    return im_bytes.getvalue()
+
+
+def test_decode_cache_im_bytes(decode_cache):
+    data = (np.random.random((32, 32, 3)) * 255).astype(np.uint8)
+    im_bytes = encode(data)
+    value = ImageData(im_bytes=im_bytes).value
+    assert np.all(value == data)
+    assert not value.flags.writeable
+    # Same content from a different object
+    assert ImageData(im_bytes=im_bytes).value is value
+    assert decode_cache.hits == 1
+
+    raster_data = ImageData(im_bytes=im_bytes)
+    raster_data.im_bytes = encode(data[::-1])
+    assert np.all(raster_data.value == data[::-1])
+
+
+def test_decode_cache_file_path(decode_cache, tmp_path):
+    ImageData.set_decode_cache(max_bytes=1024 * 1024, retain_bytes=False)
+    data = (np.random.random((32, 32, 3)) * 255).astype(np.uint8)
+    file_path = tmp_path / "img.png"
+    file_path.write_bytes(encode(data))
+
+    raster_data = ImageData(file_path=str(file_path))
+    assert np.all(raster_data.value == data)
+    assert raster_data.im_bytes is None
+    assert raster_data.value is raster_data.value
+
+    file_path.write_bytes(encode(data[:16]))
+    assert raster_data.value.shape == (16, 32, 3)
+
+
+def test_decode_cache_url(decode_cache):
+    data = (np.random.random((32, 32, 3)) * 255).astype(np.uint8)
+    fetches = []
+    raster_data = ImageData(url="https://my-img.png")
+    raster_data.set_fetch_fn(lambda self: fetches.append(1) or encode(data))
+    assert np.all(raster_data.value == data)
+    assert np.all(raster_data.value == data)
+    assert ImageData(url="https://my-img.png").value is raster_data.value
+    assert len(fetches) == 1
+    # Bytes are retained by default and reuse the url key instead of being hashed
+    assert raster_data.im_bytes is not None
+    assert len(decode_cache) == 1
+
+
+def test_decode_cache_budget(decode_cache):
+    ImageData.set_decode_cache(max_bytes=32 * 32 * 3 * 2)
+    decode_cache = ImageData.get_decode_cache()
+    images = [
+        ImageData(im_bytes=encode(np.full((32, 32, 3), idx, dtype=np.uint8)))
+        for idx in range(3)
+    ]
+    for image in images:
+        image.value
+    assert len(decode_cache) == 2
+    assert decode_cache.nbytes <= decode_cache.max_bytes
+    images[1].value
+    assert decode_cache.hits == 1
+    images[0].value
+    assert decode_cache.misses == 4
+
+
+def test_shape(tmp_path):
+    data = (np.random.random((24, 32, 3)) * 255).astype(np.uint8)
+    file_path = tmp_path / "img.png"
+    file_path.write_bytes(encode(data))
+
+    assert ImageData(arr=data).shape == (24, 32, 3)
+    assert ImageData(im_bytes=encode(data)).shape == (24, 32, 3)
+    assert ImageData(im_bytes=encode(data[..., 0])).shape == (24, 32, 3)
+    raster_data = ImageData(file_path=str(file_path))
+    assert raster_data.shape == (24, 32, 3)
+    assert raster_data.im_bytes is None
+
+
+def test_shape_url(monkeypatch):
+    data = (np.random.random((600, 800, 3)) * 255).astype(np.uint8)
+    im_bytes = BytesIO()
+    Image.fromarray(data).save(im_bytes, format="JPEG")
+    im_bytes = im_bytes.getvalue()
+    requested = []
+
+    def get(url, headers):
+        start, end = map(int, headers['Range'][len('bytes='):].split('-'))
+        requested.append((start, end))
+        return SimpleNamespace(status_code=206,
+                               content=im_bytes[start:end + 1],
+                               raise_for_status=lambda: None)
+
+    monkeypatch.setattr(raster.requests, 'get', get)
+    monkeypatch.setattr(raster, 'HEADER_CHUNK_SIZE', 256)
+    raster_data = ImageData(url="https://my-img.jpg")
+    assert raster_data.shape == (600, 800, 3)
+    # Only the header was downloaded
+    assert requested[-1][1] < 2048 < len(im_bytes)
+    assert raster_data.shape == (600, 800, 3)
+    assert len(requested) == 3
+    assert raster_data.im_bytes is None
+
+
+def test_read_region():
+    data = (np.random.random((64, 96, 3)) * 255).astype(np.uint8)
+    raster_data = ImageData(im_bytes=encode(data))
+    region = raster_data.read_region((8, 16, 40, 48))
+    np.testing.assert_array_equal(region, data[16:48, 8:40])
+    np.testing.assert_array_equal(
+        ImageData(arr=data).read_region((8, 16, 40, 48)), region)
+    assert raster_data.read_region((0, 0, 96, 64),
+                                   scale=0.5).shape == (32, 48, 3)
+
+    with pytest.raises(ValueError):
+        raster_data.read_region((0, 0, 97, 64))
+    with pytest.raises(ValueError):
+        raster_data.read_region((0, 0, 96, 64), scale=2)
+
+
+def test_read_region_draft():
+    data = np.zeros((512, 512, 3), dtype=np.uint8)
+    data[:256] = 255
+    im_bytes = BytesIO()
+    Image.fromarray(data).save(im_bytes, format="JPEG")
+    raster_data = ImageData(im_bytes=im_bytes.getvalue())
+
+    thumbnail = raster_data.read_region((0, 0, 512, 512), scale=0.125)
+    assert thumbnail.shape == (64, 64, 3)
+    assert thumbnail[:28].min() > 200 and thumbnail[36:].max() < 50
+    region = raster_data.read_region((256, 192, 512, 320), scale=0.25)
+    assert region.shape == (32, 64, 3)
+    assert region[:12].min() > 200 and region[20:].max() < 50
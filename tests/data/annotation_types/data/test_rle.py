@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from labelbox.data.annotation_types import Mask, MaskData, RunLengthEncoding
+
+
+def random_mask(rng, shape):
+    return (rng.random(shape) < rng.random()).astype(np.uint8)
+
+
+def test_rle():
+    rle = RunLengthEncoding(counts=[6, 2, 4], size=(4, 3))
+    expected = np.zeros((4, 3), dtype=np.uint8)
+    expected[2:, 1] = 1
+    np.testing.assert_array_equal(rle.to_array(), expected)
+    assert rle.area == 2
+    assert rle.bbox == (1, 2, 2, 4)
+    assert RunLengthEncoding.from_array(expected) == rle
+    assert RunLengthEncoding(counts=[12], size=(4, 3)).bbox is None
+
+    with pytest.raises(ValidationError):
+        RunLengthEncoding(counts=[6, 2, 3], size=(4, 3))
+    with pytest.raises(ValidationError):
+        RunLengthEncoding(counts=[6, -2, 8], size=(4, 3))
+
+
+def test_rle_coco():
+    rle = RunLengthEncoding(counts=[0, 3, 500, 2, 95], size=(20, 30))
+    compressed = rle.to_coco(compress=True)
+    assert isinstance(compressed['counts'], str)
+    assert RunLengthEncoding.from_coco(compressed) == rle
+    assert rle.to_coco() == {'counts': [0, 3, 500, 2, 95], 'size': [20, 30]}
+
+
+def test_rle_ops():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        shape = tuple(rng.integers(1, 16, 2))
+        arr1, arr2 = random_mask(rng, shape), random_mask(rng, shape)
+        rle1 = RunLengthEncoding.from_array(arr1)
+        rle2 = RunLengthEncoding.from_array(arr2)
+        np.testing.assert_array_equal(rle1.to_array(), arr1)
+        assert rle1.area == arr1.sum()
+        if arr1.any():
+            ys, xs = np.nonzero(arr1)
+            assert rle1.bbox == (xs.min(), ys.min(), xs.max() + 1, ys.max() + 1)
+        np.testing.assert_array_equal(
+            rle1.intersection(rle2).to_array(), arr1 & arr2)
+        assert rle1.union(rle2) == RunLengthEncoding.from_array(arr1 | arr2)
+        union = (arr1 | arr2).sum()
+        assert rle1.iou(rle2) == pytest.approx((arr1 & arr2).sum() /
+                                               union if union else 0.)
+
+    with pytest.raises(ValueError):
+        rle1.iou(RunLengthEncoding(counts=[4], size=(2, 2)))
+
+
+def test_rle_mask():
+    arr = np.zeros((8, 6), dtype=np.uint8)
+    arr[2:5, 1:4] = 1
+    rle = RunLengthEncoding.from_array(arr)
+    mask_data = MaskData(rle=rle)
+    assert mask_data.shape == (8, 6, 3)
+    np.testing.assert_array_equal(mask_data.value, np.stack([arr] * 3, -1))
+
+    mask = Mask(mask=mask_data, color=1)
+    assert mask.rle == rle
+    np.testing.assert_array_equal(mask.draw(color=1), arr)
+    np.testing.assert_array_equal(
+        Mask(mask=mask_data, color=0).draw(color=1), 1 - arr)
+    assert Mask(mask=mask_data, color=0).rle is None
+
+    with pytest.raises(ValidationError):
+        MaskData()
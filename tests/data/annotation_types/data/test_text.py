@@ -1,9 +1,13 @@
+import copy
 import os
+import pickle
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
-from labelbox.data.annotation_types import TextData
+from labelbox.data.annotation_types import Label, TextData
+from labelbox.data.annotation_types.data import text
 
 
 def test_validate_schema():
@@ -39,3 +43,48 @@ def test_ref():
     data = TextData(text="hello world", external_id=external_id, uid=uid)
     assert data.external_id == external_id
     assert data.uid == uid
+
+
+@pytest.mark.parametrize(
+    'content',
+    ["", "plain ascii text " * 20, "héllo wörld, 你好世界 👋🏽 " * 20 + "end"])
+def test_memory_map(tmpdir, monkeypatch, content):
+    # Small strides and blocks so that the index has many entries
+    monkeypatch.setattr(text, 'CHAR_INDEX_STRIDE', 7)
+    monkeypatch.setattr(text, '_INDEX_BLOCK_SIZE', 64)
+    path = tmpdir.join("document.txt")
+    path.write_binary(content.encode('utf-8'))
+
+    text_data = TextData(file_path=path.strpath, memory_map=True)
+    assert text_data.value == content
+    assert text_data.text is None
+    rng = np.random.default_rng(0)
+    for start, end in rng.integers(-20, len(content) + 20, size=(200, 2)):
+        assert text_data.slice(start, end) == content[start:end]
+    assert text_data.slice(0, len(content)) == content
+    if content:
+        assert TextData(text=content).slice(3, 10) == content[3:10]
+
+
+def test_memory_map_matches_file(tmpdir):
+    content = "line one\r\nlíne two\r\n"
+    path = tmpdir.join("document.txt")
+    path.write_binary(content.encode('utf-8'))
+    mapped = TextData(file_path=path.strpath, memory_map=True)
+    assert mapped.slice(
+        0, len(content)) == TextData(file_path=path.strpath).value == content
+
+
+def test_memory_map_copy(tmpdir):
+    path = tmpdir.join("document.txt")
+    path.write_binary("héllo wörld".encode('utf-8'))
+    text_data = TextData(file_path=path.strpath, memory_map=True)
+    assert text_data.slice(0, 5) == "héllo"
+    label = Label(data=text_data)
+
+    for copied in [
+            copy.deepcopy(label),
+            label.copy(deep=True),
+            pickle.loads(pickle.dumps(label))
+    ]:
+        assert copied.data.slice(6, 11) == "wörld"
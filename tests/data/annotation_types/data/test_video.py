@@ -1,8 +1,11 @@
+import os
+
 import numpy as np
 import pytest
 from pydantic import ValidationError
 
 from labelbox.data.annotation_types import VideoData
+from labelbox.data.annotation_types.data.frame_cache import FrameCache
 
 
 def test_validate_schema():
@@ -36,6 +39,156 @@ def test_file_path():
     assert set(frame_indices) == set(list(range(28)))
 
 
+def test_get_frames():
+    path = 'tests/integration/media/cat.mp4'
+    frames = dict(VideoData(file_path=path).frame_generator())
+
+    video_data = VideoData(file_path=path)
+    indices = [20, 3, 27, 3, 0, 4, 15]
+    for idx, frame in zip(indices, video_data.get_frames(indices)):
+        np.testing.assert_array_equal(frame, frames[idx])
+    np.testing.assert_array_equal(video_data.get_frame(27), frames[27])
+    assert video_data.frames is None
+
+    with pytest.raises(ValueError):
+        video_data.get_frame(28)
+    with pytest.raises(ValueError):
+        video_data.get_frame(-1)
+
+    video_data.load_frames()
+    np.testing.assert_array_equal(video_data.get_frame(5), frames[5])
+    with pytest.raises(ValueError):
+        video_data.get_frame(28)
+
+
+def test_frame_generator_sampling():
+    path = 'tests/integration/media/cat.mp4'
+    frames = dict(VideoData(file_path=path).frame_generator())
+    video_data = VideoData(file_path=path)
+
+    for kwargs, expected in [({
+            'stride': 5
+    }, range(0, 28, 5)), ({
+            'start': 3,
+            'end': 20,
+            'stride': 4
+    }, range(3, 20, 4)), ({
+            'stride': 20
+    }, [0, 20]), ({
+            'start': 30
+    }, [])]:
+        sampled = list(video_data.frame_generator(**kwargs))
+        assert [idx for idx, _ in sampled] == list(expected)
+        for idx, frame in sampled:
+            np.testing.assert_array_equal(frame, frames[idx])
+
+    # cat.mp4 is 29.97 fps
+    sampled = dict(video_data.frame_generator(timestamps=[0.5, 0., 0.51]))
+    assert list(sampled) == [0, 15]
+    np.testing.assert_array_equal(sampled[15], frames[15])
+
+    idx, frame = next(video_data.frame_generator(start=2, color='bgr'))
+    assert idx == 2 and frame.flags.c_contiguous
+    np.testing.assert_array_equal(frame, frames[2][:, :, ::-1])
+
+    with pytest.raises(ValueError):
+        next(video_data.frame_generator(stride=0))
+
+    # Sampled frames aren't cached in `frames` because it's used as the whole video
+    with pytest.raises(ValueError):
+        next(video_data.frame_generator(cache_frames=True, stride=5))
+    assert video_data.frames is None
+    cached = dict(video_data.frame_generator(cache_frames=True))
+    assert sorted(video_data.frames) == sorted(cached) == list(range(28))
+    np.testing.assert_array_equal(video_data[27], frames[27])
+
+    video_data = VideoData(frames={idx: frames[idx] for idx in range(10)})
+    assert [idx for idx, _ in video_data.frame_generator(start=1, stride=3)
+           ] == [1, 4, 7]
+    with pytest.raises(ValueError):
+        next(video_data.frame_generator(timestamps=[1.]))
+
+
+@pytest.fixture
+def frame_cache():
+    yield
+    VideoData.set_frame_cache(None)
+
+
+def test_frame_cache(frame_cache):
+    path = 'tests/integration/media/cat.mp4'
+    frames = dict(VideoData(file_path=path).frame_generator())
+    frame_bytes = frames[0].nbytes
+
+    cache = FrameCache(max_bytes=4 * frame_bytes)
+    VideoData.set_frame_cache(cache)
+    video_data = VideoData(file_path=path)
+    np.testing.assert_array_equal(video_data[10], frames[10])
+    assert video_data.frames is None
+
+    for _ in video_data.frame_generator(cache_frames=True):
+        pass
+    assert video_data.frames is None
+    assert len(
+        cache.memory) == 4 and cache.memory.nbytes <= cache.memory.max_bytes
+
+    # Recent frames are read from the cache
+    hits = cache.memory.hits
+    for idx, frame in zip(range(24, 28), video_data.get_frames(range(24, 28))):
+        np.testing.assert_array_equal(frame, frames[idx])
+    assert cache.memory.hits == hits + 4
+    np.testing.assert_array_equal(video_data[0], frames[0])
+
+    # A sampled cached pass doesn't limit later reads
+    video_data = VideoData(file_path=path)
+    assert [
+        idx
+        for idx, _ in video_data.frame_generator(cache_frames=True, stride=7)
+    ] == [0, 7, 14, 21]
+    assert video_data.frames is None
+    assert len(dict(video_data.frame_generator())) == 28
+    np.testing.assert_array_equal(video_data[3], frames[3])
+
+
+def test_frame_cache_spill(frame_cache, tmp_path):
+    path = 'tests/integration/media/cat.mp4'
+    frames = dict(VideoData(file_path=path).frame_generator())
+
+    cache = FrameCache(max_bytes=0, directory=tmp_path)
+    VideoData.set_frame_cache(cache)
+    video_data = VideoData(file_path=path)
+    video_data.get_frames([3, 7])
+    assert len(cache.memory) == 0
+
+    frame = video_data[7]
+    assert isinstance(frame, np.memmap)
+    np.testing.assert_array_equal(frame, frames[7])
+    cache.clear()
+    assert not list(tmp_path.iterdir())
+
+    # The least recently used files are removed once they exceed max_disk_bytes
+    frame_bytes = frames[0].nbytes
+    cache = FrameCache(max_bytes=0,
+                       directory=tmp_path,
+                       max_disk_bytes=3 * frame_bytes + 1024)
+    VideoData.set_frame_cache(cache)
+    video_data = VideoData(file_path=path)
+    for idx, frame in video_data.frame_generator(cache_frames=True):
+        # Cached frames are copies, so the yielded ones can still be modified
+        frame[0, 0] = 0
+    assert len(list(tmp_path.glob('*/*.npy'))) == 3
+    assert cache.disk_bytes <= cache.max_disk_bytes
+    np.testing.assert_array_equal(cache.get(video_data._frame_cache_key(), 27),
+                                  frames[27])
+    assert cache.get(video_data._frame_cache_key(), 0) is None
+
+    # Files from earlier runs count towards the budget
+    cache = FrameCache(max_bytes=0,
+                       directory=tmp_path,
+                       max_disk_bytes=frame_bytes + 1024)
+    assert len(list(tmp_path.glob('*/*.npy'))) == 1
+
+
 def test_file_url():
     url = "http://commondatastorage.googleapis.com/gtv-videos-bucket/sample/ForBiggerMeltdowns.mp4"
     raster_data = VideoData(url=url)
@@ -61,3 +214,14 @@ def test_ref():
     data = VideoData(frames=data, external_id=external_id, uid=uid)
     assert data.external_id == external_id
     assert data.uid == uid
+
+
+def test_download_path(monkeypatch, tmp_path):
+    downloads = []
+    monkeypatch.setattr(VideoData, "fetch_remote",
+                        lambda self, path: downloads.append(path))
+    # Another attempt at the same url uses the same path and resumes the download
+    for url in ["https://a.com/video.mp4"] * 2 + ["https://a.com/other.mp4"]:
+        VideoData(url=url)._get_file_path(str(tmp_path))
+    assert downloads[0] == downloads[1] != downloads[2]
+    assert os.path.dirname(downloads[0]) == str(tmp_path)
@@ -21,3 +21,18 @@ def test_line():
 
     raster = line.draw(height=32, width=32, thickness=1)
     assert (cv2.imread("tests/data/assets/line.png") == raster).all()
+
+
+def test_line_from_array():
+    with pytest.raises(ValueError):
+        Line.from_array([[0, 1]])
+
+    points = [[0, 1], [0, 2], [2, 2]]
+    line = Line.from_array(points)
+    assert line.geometry == {"coordinates": [points], "type": "MultiLineString"}
+    assert line.shapely.length == 3.
+    raster = line.draw(height=32, width=32, thickness=1)
+    assert (cv2.imread("tests/data/assets/line.png") == raster).all()
+
+    assert line == Line(points=[Point(x=x, y=y) for x, y in points])
+    assert line.points[1] == Point(x=0, y=2)
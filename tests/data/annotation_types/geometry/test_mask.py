@@ -76,3 +76,31 @@ def test_mask():
                                                 color=(0, 255, 255))
     assert (raster1 == gt1).all()
     assert (raster2 == gt2).all()
+
+
+def test_mask_shapely_cache():
+    arr = np.zeros((32, 32), dtype=np.uint8)
+    arr[2:12, 4:20] = 1
+    arr[5:8, 8:12] = 0
+    arr[20:30, 20:30] = 2
+    mask_data = MaskData.from_2D_arr(arr)
+    mask = Mask(mask=mask_data, color=1)
+
+    shapely = mask.shapely
+    assert mask.shapely is shapely
+    assert shapely.area == 117
+    assert shapely.bounds == (4, 2, 19, 11)
+    assert len(shapely.interiors) == 1
+    assert mask.geometry == shapely.__geo_interface__
+
+    mask.color = 2
+    assert mask.shapely.bounds == (20, 20, 29, 29)
+    mask_data.arr = np.zeros((32, 32, 3), dtype=np.uint8)
+    assert mask.shapely.is_empty
+
+    polygons = Mask.extract_shapely(MaskData.from_2D_arr(arr))
+    assert set(polygons) == {(1, 1, 1), (2, 2, 2)}
+    assert polygons[(1, 1, 1)].equals(shapely)
+    assert Mask.extract_shapely(MaskData.from_2D_arr(arr),
+                                colors=[2])[(2, 2, 2)].bounds == (20, 20, 29,
+                                                                  29)
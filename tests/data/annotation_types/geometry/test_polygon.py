@@ -1,6 +1,7 @@
 from pydantic import ValidationError
 import pytest
 import cv2
+import numpy as np
 
 from labelbox.data.annotation_types import Polygon, Point
 
@@ -25,3 +26,38 @@ def test_polygon():
 
     raster = polygon.draw(10, 10)
     assert (cv2.imread("tests/data/assets/polygon.png") == raster).all()
+
+
+def test_polygon_from_array():
+    with pytest.raises(ValueError):
+        Polygon.from_array(np.array([[0, 1], [0, 1]]))
+
+    with pytest.raises(ValueError):
+        Polygon.from_array(np.array([0, 1, 2]))
+
+    points = [[0., 1.], [0., 2.], [2., 2.], [2., 0.]]
+    polygon = Polygon.from_array(np.array(points))
+    assert 'points' not in polygon.__dict__
+    assert polygon.coordinates.tolist() == points + [points[0]]
+    assert polygon.geometry == {
+        "coordinates": [points + [points[0]]],
+        "type": "Polygon"
+    }
+    assert polygon.shapely.area == 3.
+    raster = polygon.draw(10, 10)
+    assert (cv2.imread("tests/data/assets/polygon.png") == raster).all()
+    assert 'points' not in polygon.__dict__
+
+    assert polygon == Polygon(points=[Point(x=x, y=y) for x, y in points])
+    polygon.points.append(Point(x=0, y=3))
+    assert polygon.coordinates.tolist()[-1] == [0, 3]
+
+
+def test_polygon_geometry_does_not_modify_points():
+    polygon = Polygon(
+        points=[Point(x=0, y=1),
+                Point(x=0, y=2),
+                Point(x=2, y=2)])
+    polygon.points.pop()
+    assert len(polygon.geometry['coordinates'][0]) == 4
+    assert len(polygon.points) == 3
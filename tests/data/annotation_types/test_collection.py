@@ -6,7 +6,8 @@ import pytest
 
 from labelbox.data.annotation_types import (LabelList, LabelGenerator,
                                             ObjectAnnotation, ImageData,
-                                            MaskData, Line, Mask, Point, Label)
+                                            MaskData, Line, Mask, Point, Label,
+                                            SigningCache)
 from labelbox import OntologyBuilder, Tool
 
 
@@ -168,3 +169,49 @@ def test_adding_to_masks(signer):
     labels = LabelList([label]).add_url_to_masks(signer(uuid))
     assert next(labels).annotations[0].value.mask.url == uuid
     assert labels[0].annotations[0].value.mask.url == uuid
+
+
+def test_adding_to_masks_dedupes_content():
+    arr = np.random.random((32, 32, 3)).astype(np.uint8)
+    labels = [
+        Label(data=ImageData(arr=arr),
+              annotations=[
+                  ObjectAnnotation(name="1234",
+                                   value=Mask(mask=MaskData(arr=arr.copy()),
+                                              color=[255, 255, 255]))
+              ]) for _ in range(4)
+    ]
+    calls = []
+
+    def counting_signer(payload):
+        calls.append(payload)
+        return str(uuid4())
+
+    labels = LabelList(labels).add_url_to_masks(counting_signer)
+    assert len(calls) == 1
+    assert len({label.annotations[0].value.mask.url for label in labels}) == 1
+
+
+def test_signing_cache_backend():
+    backend = {}
+    cache = SigningCache(backend=backend)
+    mask_data = MaskData(arr=np.ones((8, 8, 3), dtype=np.uint8))
+    url = mask_data.create_url(lambda _: "first", signing_cache=cache)
+    assert url == "first"
+    assert list(backend.values()) == ["first"]
+
+    # A new cache over the same backend doesn't upload again
+    other = MaskData(arr=np.ones((8, 8, 3), dtype=np.uint8))
+    assert other.create_url(lambda _: "second",
+                            signing_cache=SigningCache(backend)) == "first"
+
+    generator = LabelGenerator([
+        Label(data=ImageData(arr=np.ones((8, 8, 3), dtype=np.uint8)),
+              annotations=[
+                  ObjectAnnotation(name="1234",
+                                   value=Mask(mask=MaskData(
+                                       arr=np.ones((8, 8, 3), dtype=np.uint8)),
+                                              color=1))
+              ])
+    ]).add_url_to_masks(lambda _: "third", signing_cache=cache)
+    assert next(generator).annotations[0].value.mask.url == "first"
@@ -1,10 +1,12 @@
 import numpy as np
+import pytest
 
 from labelbox import OntologyBuilder, Tool, Classification as OClassification, Option
 from labelbox.data.annotation_types import (ClassificationAnswer, Radio, Text,
                                             ClassificationAnnotation,
                                             ObjectAnnotation, Point, Line,
-                                            ImageData, Label)
+                                            ImageData, Label, Mask, MaskData,
+                                            Polygon, Rectangle)
 
 
 def test_schema_assignment_geometry():
@@ -167,3 +169,84 @@ def test_highly_nested():
         0].feature_schema_id == classification_schema_id
     assert label.annotations[0].classifications[
         0].value.answer.feature_schema_id == option_schema_id
+
+
+def test_annotation_lookups_follow_modifications():
+    point = ObjectAnnotation(value=Point(x=1, y=2), name="point")
+    text = ClassificationAnnotation(value=Text(answer="a"), name="caption")
+    label = Label(data=ImageData(arr=np.ones((32, 32, 3), dtype=np.uint8)),
+                  annotations=[point, text])
+
+    assert label.object_annotations() == [point]
+    assert label.classification_annotations() == [text]
+    assert label.feature_annotations(name="point") == [point]
+    assert label.feature_annotations(name="missing") == []
+
+    line = ObjectAnnotation(value=Line(points=[Point(x=1, y=2),
+                                               Point(x=2, y=2)]),
+                            name="point")
+    label.annotations.append(line)
+    assert label.object_annotations() == [point, line]
+    assert label.feature_annotations(name="point") == [point, line]
+
+    del label.annotations[0]
+    assert label.object_annotations() == [line]
+
+    label.annotations = [text]
+    assert label.object_annotations() == []
+    assert label.classification_annotations() == [text]
+
+
+def test_feature_lookup_after_schema_assignment():
+    label = Label(data=ImageData(arr=np.ones((32, 32, 3), dtype=np.uint8)),
+                  annotations=[
+                      ObjectAnnotation(value=Point(x=1, y=2), name="point")
+                  ])
+    assert label.feature_annotations(feature_schema_id="expected_id") == []
+    label.assign_feature_schema_ids(
+        OntologyBuilder(tools=[
+            Tool(Tool.Type.POINT, name="point", feature_schema_id="expected_id")
+        ]))
+    assert label.feature_annotations(
+        feature_schema_id="expected_id") == label.annotations
+
+
+def test_rasterize():
+    mask_arr = np.zeros((32, 48), dtype=np.uint8)
+    mask_arr[20:30, 30:40] = 1
+    annotations = [
+        ObjectAnnotation(value=Rectangle(start=Point(x=0, y=0),
+                                         end=Point(x=10, y=10)),
+                         name="box"),
+        ObjectAnnotation(value=Polygon.from_array([[5, 5], [20, 5], [20, 15]]),
+                         name="triangle"),
+        ObjectAnnotation(value=Mask(mask=MaskData.from_2D_arr(mask_arr),
+                                    color=1),
+                         name="box"),
+        ObjectAnnotation(value=Point(x=40, y=5), name="point"),
+        ObjectAnnotation(value=Line.from_array([[0, 31], [47, 31]]),
+                         name="line"),
+        ClassificationAnnotation(value=Text(answer="text"), name="text")
+    ]
+    label = Label(data=ImageData(arr=np.zeros((32, 48, 3), dtype=np.uint8)),
+                  annotations=annotations)
+
+    semantic = label.rasterize()
+    assert semantic.shape == (32, 48) and semantic.dtype == np.int32
+    expected = np.zeros((32, 48), dtype=np.int32)
+    for value, annotation in zip([1, 2, 1, 3, 4], annotations):
+        drawn = annotation.value.draw(height=32, width=48, color=1)
+        expected[drawn.reshape(32, 48, -1)[..., 0].astype(bool)] = value
+    np.testing.assert_array_equal(semantic, expected)
+
+    instances = label.rasterize(mode='instance')
+    assert set(np.unique(instances)) == {0, 1, 2, 3, 4, 5}
+    assert instances[25, 35] == 3 and semantic[25, 35] == 1
+
+    only_boxes = label.rasterize(class_map={"box": 7}, height=16, width=48)
+    assert only_boxes.shape == (16, 48)
+    assert set(np.unique(only_boxes)) == {0, 7}
+    assert only_boxes[8, 15] == 0
+
+    with pytest.raises(ValueError):
+        label.rasterize(mode='panoptic')
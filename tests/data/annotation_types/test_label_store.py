@@ -0,0 +1,164 @@
+import json
+
+import numpy as np
+import pytest
+
+from labelbox.data.annotation_types import (ClassificationAnnotation,
+                                            ClassificationAnswer, ImageData,
+                                            Label, LabelList, LabelStore, Line,
+                                            ObjectAnnotation, Point, Polygon,
+                                            Radio, Rectangle)
+from labelbox.data.annotation_types.label_store import POLYGON, RECTANGLE
+from labelbox.data.serialization import NDJsonConverter
+
+
+@pytest.fixture
+def labels():
+    return LabelList([
+        Label(data=ImageData(uid="ckrazctum0z8a0ybc0b0o0g0v"),
+              annotations=[
+                  ObjectAnnotation(name="box",
+                                   value=Rectangle(start=Point(x=0, y=0),
+                                                   end=Point(x=10, y=5))),
+                  ClassificationAnnotation(
+                      name="weather",
+                      value=Radio(answer=ClassificationAnswer(name="sunny"))),
+                  ObjectAnnotation(
+                      name="tree",
+                      value=Polygon(points=[
+                          Point(x=0, y=0),
+                          Point(x=4, y=0),
+                          Point(x=4, y=3)
+                      ]),
+                      classifications=[
+                          ClassificationAnnotation(
+                              name="kind",
+                              value=Radio(answer=ClassificationAnswer(
+                                  name="oak")))
+                      ]),
+              ]),
+        Label(data=ImageData(uid="ckrazctum0z8a0ybc0b0o0g0w"),
+              annotations=[
+                  ObjectAnnotation(name="path",
+                                   value=Line(points=[
+                                       Point(x=1, y=1),
+                                       Point(x=2, y=2),
+                                       Point(x=3, y=1)
+                                   ])),
+                  ObjectAnnotation(name="tree",
+                                   value=Point(x=5, y=6),
+                                   extra={'uuid': 'abc'}),
+              ])
+    ])
+
+
+def test_round_trip(labels):
+    store = LabelStore.from_labels(labels)
+    assert len(store) == 2
+    assert len(store.geometry_type) == 4
+    assert store.offsets.tolist() == [0, 2, 6, 9, 10]
+    assert list(store.as_list()) == list(labels)
+    assert list(store.to_labels()) == list(labels)
+    assert store[-1] == labels[-1] and store[-2] == labels[0]
+    for idx in [2, -3]:
+        with pytest.raises(IndexError):
+            store[idx]
+
+
+def test_columns(labels):
+    store = LabelStore.from_labels(labels)
+    assert store.names.tolist() == ["box", "tree", "path", "tree"]
+    assert store.label_index.tolist() == [0, 0, 1, 1]
+    np.testing.assert_array_equal(
+        store.bounds(),
+        [[0, 0, 10, 5], [0, 0, 4, 3], [1, 1, 3, 2], [5, 6, 5, 6]])
+    np.testing.assert_array_equal(store.areas(), [50, 6, 0, 0])
+
+
+def test_filter(labels):
+    store = LabelStore.from_labels(labels)
+    trees = store.filter(store.names == "tree")
+    assert trees.coordinates.tolist() == [[0, 0], [4, 0], [4, 3], [0, 0],
+                                          [5, 6]]
+    assert trees.offsets.tolist() == [0, 4, 5]
+
+    first, second = trees.to_labels()
+    # Non vector annotations are always kept
+    assert [annot.name for annot in first.annotations] == ["weather", "tree"]
+    assert second.annotations[0].value == Point(x=5, y=6)
+    assert second.annotations[0].extra == {'uuid': 'abc'}
+
+    polygons = store.filter(
+        np.isin(store.geometry_type, [POLYGON, RECTANGLE]) &
+        (store.areas() < 10))
+    assert polygons.names.tolist() == ["tree"]
+    assert store.filter(np.array([0, 2])).names.tolist() == ["box", "path"]
+
+    with pytest.raises(ValueError):
+        store.filter(np.array([True]))
+
+
+def test_group_by(labels):
+    store = LabelStore.from_labels(labels)
+    groups = store.group_by('name')
+    assert {key: value.tolist() for key, value in groups.items()} == {
+        "box": [0],
+        "tree": [1, 3],
+        "path": [2]
+    }
+    assert store.group_by('label')[1].tolist() == [2, 3]
+    assert store.group_by('geometry_type')[RECTANGLE].tolist() == [0]
+    with pytest.raises(ValueError):
+        store.group_by('color')
+
+
+def test_ndjson():
+    with open('tests/data/assets/ndjson/image_import.json', 'r') as file:
+        data = json.load(file)
+
+    store = LabelStore.from_ndjson(data)
+    assert list(store.to_labels()) == list(NDJsonConverter.deserialize(data))
+    assert list(store.to_ndjson()) == list(
+        NDJsonConverter.serialize(NDJsonConverter.deserialize(data)))
+
+
+def test_ndjson_interleaved_data_rows():
+    rows = [{
+        'uuid': str(idx),
+        'schemaId': 'ckrazcueb16og0z6609jj7y3y',
+        'dataRow': {
+            'id': data_row_id
+        },
+        'point': {
+            'x': idx,
+            'y': idx
+        }
+    } for idx, data_row_id in enumerate(['a', 'b', 'a', 'b', 'a'])]
+    rows.insert(
+        2, {
+            'uuid': 'polygon',
+            'schemaId': 'ckrazcueb16og0z6609jj7y3y',
+            'dataRow': {
+                'id': 'b'
+            },
+            'polygon': [{
+                'x': 0,
+                'y': 0
+            }, {
+                'x': 5,
+                'y': 0
+            }, {
+                'x': 0,
+                'y': 5
+            }]
+        })
+
+    store = LabelStore.from_ndjson(rows)
+    assert store.label_index.tolist() == [0, 0, 0, 1, 1, 1]
+    labels = list(store)
+    assert [label.data.uid for label in labels] == ['a', 'b']
+    assert [[annotation.extra['uuid']
+             for annotation in label.annotations]
+            for label in labels] == [['0', '2', '4'], ['1', 'polygon', '3']]
+    assert labels[1].annotations[1].value.points[1] == Point(x=5, y=0)
+    assert labels[0].annotations[2].value == Point(x=4, y=4)
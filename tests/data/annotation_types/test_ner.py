@@ -1,4 +1,9 @@
-from labelbox.data.annotation_types import TextEntity
+from itertools import product
+
+import numpy as np
+
+from labelbox.data.annotation_types import (ObjectAnnotation, Point, TextEntity,
+                                            TextEntityIndex)
 
 
 def test_ner():
@@ -7,3 +12,63 @@ def test_ner():
     text_entity = TextEntity(start=start, end=end)
     assert text_entity.start == start
     assert text_entity.end == end
+
+
+def test_text_entity_index():
+    spans = [(0, 5), (3, 4), (10, 30), (12, 14), (40, 40), (4, 12)]
+    annotations = [
+        ObjectAnnotation(name=str(idx), value=TextEntity(start=start, end=end))
+        for idx, (start, end) in enumerate(spans)
+    ] + [ObjectAnnotation(name="point", value=Point(x=1, y=1))]
+    index = TextEntityIndex(annotations)
+    assert len(index) == len(spans)
+
+    def names(result):
+        return sorted(int(annotation.name) for annotation in result)
+
+    for start, end in product(range(-2, 45), range(-2, 45)):
+        if start > end:
+            continue
+        assert names(index.overlapping(start, end)) == [
+            idx for idx, (s, e) in enumerate(spans)
+            if max(s, start) <= min(e, end)
+        ]
+        assert names(index.containing(start, end)) == [
+            idx for idx, (s, e) in enumerate(spans) if s <= start and e >= end
+        ]
+        assert names(index.within(start, end)) == [
+            idx for idx, (s, e) in enumerate(spans) if s >= start and e <= end
+        ]
+    assert TextEntityIndex([]).overlapping(0, 10) == []
+
+
+def test_text_entity_index_long_entities():
+    rng = np.random.default_rng(0)
+    starts = rng.integers(0, 10_000, 500)
+    lengths = np.where(rng.random(500) < 0.05, 10_000, rng.integers(0, 20, 500))
+    spans = list(zip(starts.tolist(), (starts + lengths).tolist()))
+    index = TextEntityIndex([
+        ObjectAnnotation(name=str(idx), value=TextEntity(start=start, end=end))
+        for idx, (start, end) in enumerate(spans)
+    ])
+    for start in rng.integers(-10, 20_000, 50).tolist():
+        end = start + 15
+        result = [
+            annotation.name for annotation in index.overlapping(start, end)
+        ]
+        expected = [(s, idx)
+                    for idx, (s, e) in enumerate(spans)
+                    if max(s, start) <= min(e, end)]
+        # Results are sorted by start
+        assert result == [str(idx) for _, idx in sorted(expected)]
+        assert {annotation.name for annotation in index.containing(start, end)
+               } == {
+                   str(idx)
+                   for idx, (s, e) in enumerate(spans)
+                   if s <= start and e >= end
+               }
+        assert {annotation.name for annotation in index.within(start, end)} == {
+            str(idx)
+            for idx, (s, e) in enumerate(spans)
+            if s >= start and e <= end
+        }
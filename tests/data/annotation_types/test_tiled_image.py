@@ -1,4 +1,14 @@
+import math
+import time
+from io import BytesIO
+from types import SimpleNamespace
+
+import numpy as np
 import pytest
+from PIL import Image
+
+from labelbox.data.annotation_types.data import tiled_image
+from labelbox.data.annotation_types.data.tile_cache import TileCache
 from labelbox.data.annotation_types.geometry.polygon import Polygon
 from labelbox.data.annotation_types.geometry.point import Point
 from labelbox.data.annotation_types.geometry.line import Line
@@ -7,6 +17,8 @@ from labelbox.data.annotation_types.data.tiled_image import (EPSG, TiledBounds,
                                                              TileLayer,
                                                              TiledImageData,
                                                              EPSGTransformer)
+from labelbox.data.annotation_types import (ClassificationAnnotation, ImageData,
+                                            Label, ObjectAnnotation, Text)
 from pydantic import ValidationError
 
 
@@ -101,3 +113,173 @@ def test_epsg_point_projections():
         other_simple_shape = transformer_4326_simple(shape=shape_4326)
 
         assert shape_simple == other_simple_shape
+
+
+def test_epsg_batch_transforms():
+    bounds_simple = TiledBounds(epsg=EPSG.SIMPLEPIXEL,
+                                bounds=[Point(x=0, y=0),
+                                        Point(x=256, y=256)])
+    bounds_4326 = TiledBounds(epsg=EPSG.EPSG4326,
+                              bounds=[
+                                  Point(x=-104.150390625, y=30.789036751261136),
+                                  Point(x=-81.8701171875, y=45.920587344733654)
+                              ])
+    to_geo = EPSGTransformer.create_pixel_to_geo_transformer(
+        src_epsg=EPSG.SIMPLEPIXEL,
+        pixel_bounds=bounds_simple,
+        geo_bounds=bounds_4326,
+        zoom=4)
+    to_pixel = EPSGTransformer.create_geo_to_pixel_transformer(
+        src_epsg=EPSG.EPSG4326,
+        pixel_bounds=bounds_simple,
+        geo_bounds=bounds_4326,
+        zoom=4)
+
+    shapes = [
+        Point(x=10, y=20),
+        Line(points=[Point(x=0, y=0), Point(x=100, y=50)]),
+        Polygon(
+            points=[Point(x=5, y=5),
+                    Point(x=200, y=5),
+                    Point(x=100, y=200)]),
+        Rectangle(start=Point(x=10, y=10), end=Point(x=90, y=120))
+    ]
+    transformed = to_geo(shapes)
+    assert transformed == [to_geo(shape) for shape in shapes]
+    assert [type(shape) for shape in transformed] == [type(s) for s in shapes]
+
+    xs, ys = to_geo.transform([10., 0.], [20., 0.])
+    assert (xs[0], ys[0]) == (transformed[0].x, transformed[0].y)
+    np.testing.assert_allclose(to_pixel.transform(xs, ys), [[10, 0], [20, 0]],
+                               atol=1)
+    assert to_geo([]) == []
+    with pytest.raises(ValueError):
+        to_geo("not a shape")
+
+    # Array backed lines and polygons are transformed without creating points
+    array_shapes = [
+        Line.from_array([[0, 0], [100, 50]]),
+        Polygon.from_array([[5, 5], [200, 5], [100, 200]])
+    ]
+    arrays = to_geo(array_shapes)
+    assert all(shape._array is not None for shape in array_shapes + arrays)
+    for shape, expected in zip(arrays, transformed[1:3]):
+        np.testing.assert_allclose(shape.coordinates, expected.coordinates)
+
+    label = Label(
+        data=ImageData(arr=np.zeros((256, 256, 3), dtype=np.uint8)),
+        annotations=[
+            ObjectAnnotation(name=str(idx), value=shape)
+            for idx, shape in enumerate(shapes)
+        ] +
+        [ClassificationAnnotation(name="text", value=Text(answer="answer"))])
+    assert to_geo.transform_label(label) is label
+    assert [annotation.value for annotation in label.object_annotations()
+           ] == transformed
+
+    # Transformers between the same EPSGs are reused
+    assert tiled_image._get_transformer(
+        EPSG.EPSG4326, EPSG.EPSG3857) is tiled_image._get_transformer(
+            EPSG.EPSG4326, EPSG.EPSG3857)
+
+
+@pytest.fixture
+def tile_server(monkeypatch):
+    requested = []
+
+    def get(url):
+        requested.append(url)
+        x, y = map(int, url[:-len('.png')].split('/')[-2:])
+        tile = np.full((256, 256, 3), 1 + x + 16 * y, dtype=np.uint8)
+        im_bytes = BytesIO()
+        Image.fromarray(tile).save(im_bytes, format="PNG")
+        return SimpleNamespace(content=im_bytes.getvalue(),
+                               raise_for_status=lambda: None)
+
+    monkeypatch.setattr(tiled_image.requests, 'get', get)
+    monkeypatch.setattr(tiled_image.requests.Session, 'get',
+                        lambda session, url: get(url))
+    yield requested
+    TiledImageData.set_tile_cache(None)
+
+
+def simple_tiled_image_data(size=300):
+    return TiledImageData(
+        tile_layer=TileLayer(url="https://tiles.com/{z}/{x}/{y}.png"),
+        tile_bounds=TiledBounds(epsg=EPSG.SIMPLEPIXEL,
+                                bounds=[Point(x=0, y=0),
+                                        Point(x=size, y=size)]),
+        zoom_levels=(0, 0))
+
+
+def test_tile_cache(tile_server):
+    TiledImageData.set_tile_cache(TileCache())
+    value = simple_tiled_image_data().value
+    assert value.shape == (300, 300, 3)
+    assert len(tile_server) == 4
+    np.testing.assert_array_equal(simple_tiled_image_data().value, value)
+    assert len(tile_server) == 4
+    assert TiledImageData.get_tile_cache().memory.hits == 4
+
+
+def test_tile_cache_disk(tile_server, tmp_path):
+    TiledImageData.set_tile_cache(TileCache(directory=tmp_path))
+    value = simple_tiled_image_data().value
+
+    # A new cache (e.g. in another process) reads the tiles from disk
+    cache = TileCache(directory=tmp_path)
+    assert cache.disk_bytes > 0
+    TiledImageData.set_tile_cache(cache)
+    np.testing.assert_array_equal(simple_tiled_image_data().value, value)
+    assert len(tile_server) == 4
+
+    TiledImageData.set_tile_cache(TileCache(directory=tmp_path, ttl_seconds=0))
+    time.sleep(0.01)
+    simple_tiled_image_data().value
+    assert len(tile_server) == 8
+
+    cache = TileCache(directory=tmp_path, max_disk_bytes=cache.disk_bytes // 2)
+    TiledImageData.set_tile_cache(cache)
+    cache.memory.clear()
+    simple_tiled_image_data().value
+    assert 0 < cache.disk_bytes <= cache.max_disk_bytes
+    cache.clear()
+    assert cache.disk_bytes == 0 and not list(tmp_path.glob('*/*/*/*'))
+
+
+@pytest.mark.parametrize('multithread', [True, False])
+def test_raster_data_concurrency(tile_server, multithread):
+    tiled_image_data = simple_tiled_image_data(1000)
+    arr = tiled_image_data.raster_data(max_tiles=25,
+                                       multithread=multithread,
+                                       concurrency=8).value
+    assert arr.shape == (1000, 1000, 3)
+    assert len(tile_server) == 16
+    # Each tile is written to its position in the image
+    for x in range(4):
+        for y in range(4):
+            assert (arr[y * 256:(y + 1) * 256,
+                        x * 256:(x + 1) * 256] == 1 + x + 16 * y).all()
+
+    with pytest.raises(ValueError):
+        tiled_image_data.raster_data(max_tiles=24)
+
+
+@pytest.mark.parametrize('window_tiles', [1, 3, 8])
+def test_raster_windows(tile_server, window_tiles):
+    tiled_image_data = simple_tiled_image_data(1000)
+    expected = tiled_image_data.raster_data(max_tiles=25).value
+
+    image = np.zeros_like(expected)
+    windows = 0
+    for (x, y), window in tiled_image_data.raster_windows(
+            window_tiles=window_tiles):
+        assert window.shape[0] <= window_tiles * 256 and window.shape[
+            1] <= window_tiles * 256
+        image[y:y + window.shape[0], x:x + window.shape[1]] = window
+        windows += 1
+    np.testing.assert_array_equal(image, expected)
+    assert windows == math.ceil(4 / window_tiles)**2
+
+    with pytest.raises(ValueError):
+        next(tiled_image_data.raster_windows(window_tiles=0))
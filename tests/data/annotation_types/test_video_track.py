@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from labelbox.data.annotation_types import (Point, Polygon, Rectangle,
+                                            VideoObjectAnnotation,
+                                            VideoObjectTrack)
+from labelbox.data.annotation_types.video_track import assign_segments
+
+
+def rectangle(x):
+    return Rectangle(start=Point(x=x, y=0), end=Point(x=x + 10, y=2 * x))
+
+
+def test_assign_segments():
+    segments = [(0, 4), (10, 10), (12, 20)]
+    np.testing.assert_array_equal(
+        assign_segments([0, 4, 5, 10, 11, 12, 20, 21, -1], segments),
+        [0, 0, -1, 1, -1, 2, 2, -1, -1])
+    np.testing.assert_array_equal(assign_segments([3], []), [-1])
+
+
+def test_interpolate():
+    annotations = [
+        VideoObjectAnnotation(name="car",
+                              frame=frame,
+                              keyframe=frame in (1, 5, 12),
+                              value=rectangle({
+                                  1: 0,
+                                  5: 40,
+                                  12: 100
+                              }.get(frame, 0)))
+        for frame in [0, 1, 2, 3, 4, 5, 6, 10, 11, 12, 30]
+    ] + [
+        VideoObjectAnnotation(
+            name="person", frame=3, keyframe=True, value=Point(x=1, y=2))
+    ]
+    car, person = VideoObjectTrack.from_annotations(annotations)
+    assert (car.name, car.geometry) == ("car", 'rectangle')
+    np.testing.assert_array_equal(car.segments, [[0, 6], [10, 12], [30, 30]])
+    np.testing.assert_array_equal(car.keyframes, [1, 5, 12])
+
+    frames, coordinates = car.interpolate()
+    # The last segment doesn't have a keyframe
+    np.testing.assert_array_equal(frames, [0, 1, 2, 3, 4, 5, 6, 10, 11, 12])
+    np.testing.assert_allclose(coordinates[:, 0, 0],
+                               [0, 0, 10, 20, 30, 40, 40, 100, 100, 100])
+    np.testing.assert_allclose(coordinates[:, 1, 1], 2 * coordinates[:, 0, 0])
+
+    dense = car.to_annotations()
+    assert [annotation.frame for annotation in dense] == frames.tolist()
+    assert [annotation.frame for annotation in dense if annotation.keyframe
+           ] == [1, 5, 12]
+    assert dense[3].value == rectangle(20)
+    assert [
+        annotation.value
+        for annotation in car.to_annotations(keyframes_only=True)
+    ] == [rectangle(0), rectangle(40),
+          rectangle(100)]
+
+    frames, coordinates = person.interpolate()
+    np.testing.assert_array_equal(frames, [3])
+    assert person.to_annotations()[0].value == Point(x=1, y=2)
+
+
+def test_polygon_track():
+    square = lambda size: Polygon(points=[
+        Point(x=0, y=0),
+        Point(x=size, y=0),
+        Point(x=size, y=size),
+        Point(x=0, y=size)
+    ])
+    track, = VideoObjectTrack.from_annotations([
+        VideoObjectAnnotation(name="room",
+                              frame=0,
+                              keyframe=True,
+                              value=square(2)),
+        VideoObjectAnnotation(name="room",
+                              frame=2,
+                              keyframe=True,
+                              value=square(4)),
+        VideoObjectAnnotation(name="room",
+                              frame=1,
+                              keyframe=False,
+                              value=square(2))
+    ])
+    assert track.to_annotations()[1].value == square(3)
+
+    with pytest.raises(ValueError):
+        VideoObjectTrack.from_annotations([
+            VideoObjectAnnotation(name="room",
+                                  frame=0,
+                                  keyframe=True,
+                                  value=square(2)),
+            VideoObjectAnnotation(name="room",
+                                  frame=1,
+                                  keyframe=True,
+                                  value=rectangle(0))
+        ])
+
+
+def test_invalid_track():
+    with pytest.raises(ValidationError):
+        VideoObjectTrack(geometry='point',
+                         keyframes=np.array([2, 1]),
+                         coordinates=np.zeros((2, 1, 2)),
+                         segments=np.array([[0, 3]]))
+    with pytest.raises(ValidationError):
+        VideoObjectTrack(geometry='point',
+                         keyframes=np.array([1, 2]),
+                         coordinates=np.zeros((2, 1, 2)),
+                         segments=np.array([[0, 3], [2, 5]]))
@@ -1,6 +1,10 @@
 from pytest_cases import fixture_ref
 from pytest_cases import parametrize, fixture_ref
 
+import numpy as np
+
+from labelbox.data.annotation_types import Mask, MaskData, ObjectAnnotation
+from labelbox.data.metrics.confusion_matrix.calculation import mask_confusion_matrix
 from labelbox.data.metrics.confusion_matrix.confusion_matrix import feature_confusion_matrix_metric
 
 
@@ -38,3 +42,16 @@ def test_overlapping_classifications(tool_examples):
             assert len(metrics) == 0
         else:
             assert metrics == example.expected, f"{example.predictions},{example.ground_truths}"
+
+
+def test_pixel_mask_confusion_matrix():
+    ground_truth = np.zeros((4, 5), dtype=np.uint8)
+    ground_truth[:2] = 1
+    prediction = np.zeros((4, 5), dtype=np.uint8)
+    prediction[1:3, :2] = 1
+    to_annotation = lambda arr: ObjectAnnotation(
+        name="mask", value=Mask(mask=MaskData.from_2D_arr(arr), color=1))
+    assert mask_confusion_matrix([to_annotation(ground_truth)],
+                                 [to_annotation(prediction)],
+                                 include_subclasses=False,
+                                 iou=0.5) == [2, 2, 8, 8]
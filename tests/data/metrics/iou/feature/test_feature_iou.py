@@ -1,5 +1,15 @@
 import math
 
+import numpy as np
+import pytest
+
+from labelbox.data.annotation_types import (Mask, MaskData, ObjectAnnotation,
+                                            Line, Point, Polygon, Rectangle,
+                                            RunLengthEncoding)
+from labelbox.data.metrics.iou.calculation import (_get_mask_ious,
+                                                   _get_vector_pairs,
+                                                   _mask_union, _polygon_iou,
+                                                   miou)
 from labelbox.data.metrics.iou.iou import miou_metric, feature_miou_metric
 
 
@@ -35,3 +45,152 @@ def test_empty_annotations(empty_annotations):
 def test_one_overlap_classes(one_overlap_class):
     for pair in one_overlap_class:
         check_iou(pair)
+
+
+def test_rle_masks():
+    rng = np.random.default_rng(0)
+    ground_truths, predictions = [], []
+    for annotations in [ground_truths, predictions]:
+        for _ in range(3):
+            arr = (rng.random((32, 48)) < 0.3).astype(np.uint8)
+            for mask in [
+                    Mask(mask=MaskData(rle=RunLengthEncoding.from_array(arr)),
+                         color=1),
+                    Mask(mask=MaskData.from_2D_arr(arr), color=1)
+            ]:
+                annotations.append(ObjectAnnotation(name="mask", value=mask))
+
+    for include_subclasses in [True, False]:
+        rle = miou(ground_truths[::2], predictions[::2], include_subclasses)
+        dense = miou(ground_truths[1::2], predictions[1::2], include_subclasses)
+        assert math.isclose(rle, dense)
+
+
+def test_rectangle_pairs():
+    rng = np.random.default_rng(0)
+
+    def rectangle(x, y, width, height):
+        return ObjectAnnotation(name="box",
+                                value=Rectangle(start=Point(x=x, y=y),
+                                                end=Point(x=x + width,
+                                                          y=y + height)))
+
+    ground_truths = [
+        rectangle(*rng.integers(-5, 20, 2), *rng.integers(-8, 8, 2))
+        for _ in range(30)
+    ] + [rectangle(0, 0, 4, 4)]
+    # Touching, inverted and contained rectangles and a polygon
+    predictions = [
+        rectangle(4, 0, 4, 4),
+        rectangle(4, 4, -4, -4),
+        rectangle(1, 1, 2, 2),
+        rectangle(*rng.integers(-5, 20, 2), *rng.integers(-8, 8, 2)),
+        ObjectAnnotation(
+            name="box",
+            value=Polygon(
+                points=[Point(x=0, y=0),
+                        Point(x=4, y=0),
+                        Point(x=0, y=4)]))
+    ]
+
+    pairs = _get_vector_pairs(ground_truths, predictions, buffer=70.)
+    assert [(id(gt), id(pred)) for gt, pred, _ in pairs] == [
+        (id(gt), id(pred)) for gt in ground_truths for pred in predictions
+    ]
+    for ground_truth, prediction, score in pairs:
+        if ground_truth.value.shapely.area and prediction.value.shapely.area:
+            assert math.isclose(score,
+                                _polygon_iou(prediction.value.shapely,
+                                             ground_truth.value.shapely),
+                                abs_tol=1e-12)
+        else:
+            assert score == 0.
+    assert [score for _, _, score in pairs[-5:-2]] == [0., 1., 0.25]
+
+
+def test_vector_pairs_match_all_pairs():
+    rng = np.random.default_rng(1)
+
+    def annotation(kind):
+        x, y = rng.uniform(0, 2000, 2)
+        points = [
+            Point(x=x + dx, y=y + dy)
+            for dx, dy in rng.uniform(-60, 60, (4 if kind == "polygon" else 3,
+                                                2))
+        ]
+        value = {
+            "point": lambda: points[0],
+            "line": lambda: Line(points=points),
+            "polygon": lambda: Polygon(points=points),
+            "rectangle": lambda: Rectangle(start=points[0], end=points[1])
+        }[kind]()
+        return ObjectAnnotation(name=kind, value=value)
+
+    kinds = ["point", "line", "polygon", "rectangle"]
+    ground_truths = [annotation(kind) for kind in rng.choice(kinds, 60)]
+    predictions = [annotation(kind) for kind in rng.choice(kinds, 60)]
+    pairs = _get_vector_pairs(ground_truths, predictions, buffer=70.)
+    assert len(pairs) == len(ground_truths) * len(predictions)
+    assert any(score > 0 for _, _, score in pairs)
+    for ground_truth, prediction, score in pairs:
+        if isinstance(prediction.value, (Line, Point)):
+            expected = _polygon_iou(prediction.value.shapely.buffer(70.),
+                                    ground_truth.value.shapely.buffer(70.))
+        else:
+            expected = _polygon_iou(prediction.value.shapely,
+                                    ground_truth.value.shapely)
+        assert math.isclose(score, expected, abs_tol=1e-12)
+
+
+def test_mask_ious():
+    rng = np.random.default_rng(2)
+    arr = np.zeros((60, 80, 3), dtype=np.uint8)
+    colors, predictions = [], []
+    for idx in range(8):
+        x, y = rng.integers(0, 70, 2)
+        color = (idx + 1, 0, 0)
+        arr[y:y + 12, x:x + 15] = color
+        colors.append(color)
+    mask_data = MaskData(arr=arr)
+    ground_truths = [
+        ObjectAnnotation(name="mask", value=Mask(mask=mask_data, color=color))
+        for color in colors
+    ] + [
+        ObjectAnnotation(name="mask",
+                         value=Mask(mask=MaskData(arr=np.zeros_like(arr)),
+                                    color=(1, 0, 0)))
+    ]
+    for _ in range(6):
+        x, y = rng.integers(0, 70, 2)
+        pred = np.zeros((60, 80), dtype=np.uint8)
+        pred[y:y + 10, x:x + 20] = 1
+        # Compare run length encoded and drawn predictions
+        for mask in [
+                Mask(mask=MaskData(rle=RunLengthEncoding.from_array(pred)),
+                     color=1),
+                Mask(mask=MaskData.from_2D_arr(pred), color=1)
+        ]:
+            predictions.append(ObjectAnnotation(name="mask", value=mask))
+
+    ious = _get_mask_ious(ground_truths, predictions)
+    for i, ground_truth in enumerate(ground_truths):
+        for j, prediction in enumerate(predictions):
+            drawn_ground_truth = ground_truth.value.draw(color=1)
+            drawn_prediction = prediction.value.draw(color=1)
+            union = np.sum(drawn_ground_truth | drawn_prediction)
+            expected = np.sum(drawn_ground_truth &
+                              drawn_prediction) / union if union else 0.
+            assert math.isclose(ious[i, j], expected)
+    assert (ious > 0).any()
+
+    np.testing.assert_array_equal(
+        _mask_union(ground_truths),
+        np.max([annotation.value.draw(color=1) for annotation in ground_truths],
+               axis=0).astype(bool))
+
+    other = ObjectAnnotation(
+        name="mask",
+        value=Mask(mask=MaskData(arr=np.zeros((10, 10, 3), dtype=np.uint8)),
+                   color=(1, 0, 0)))
+    with pytest.raises(ValueError):
+        _get_mask_ious(ground_truths, [other])
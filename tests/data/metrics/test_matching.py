@@ -0,0 +1,143 @@
+import math
+
+import numpy as np
+import pytest
+
+from labelbox.data.annotation_types import ObjectAnnotation, Point, Rectangle
+from labelbox.data.metrics import confusion_matrix_metric, miou_metric
+from labelbox.data.metrics import matching as matching_module
+from labelbox.data.metrics.confusion_matrix.calculation import object_pair_confusion_matrix
+from labelbox.data.metrics.iou.calculation import object_pair_miou
+from labelbox.data.metrics.matching import match, match_ious, match_pairs
+
+IOUS = np.array([[0.9, 0.8], [0.85, 0.]])
+
+
+def test_greedy_match():
+    rows, columns = match(IOUS)
+    assert rows.tolist() == [0, 1] and columns.tolist() == [0, 1]
+
+    # Ties are matched in row major order
+    rows, columns = match(np.ones((2, 3)))
+    assert list(zip(rows.tolist(), columns.tolist())) == [(0, 0), (1, 1)]
+
+    rows, columns = match([[np.nan, 0.5], [0.2, 0.9]],
+                          eligible=np.array([[True, True], [True, False]]))
+    assert list(zip(rows.tolist(), columns.tolist())) == [(0, 1), (1, 0)]
+
+    rows, columns = match(np.zeros((0, 3)))
+    assert len(rows) == len(columns) == 0
+
+    with pytest.raises(ValueError):
+        match(IOUS, strategy='best')
+
+
+def test_hungarian_match(monkeypatch):
+    pytest.importorskip("scipy")
+    rows, columns = match(IOUS, strategy='hungarian')
+    assert list(zip(rows.tolist(), columns.tolist())) == [(0, 1), (1, 0)]
+    # Pairs that can't be matched are left out
+    rows, columns = match(IOUS, strategy='hungarian', eligible=IOUS > 0.5)
+    assert list(zip(rows.tolist(), columns.tolist())) == [(0, 1), (1, 0)]
+    rows, columns = match([[0., 0.], [0., np.nan]], strategy='hungarian')
+    assert len(rows) == 2
+
+    monkeypatch.setattr(matching_module, "linear_sum_assignment", None)
+    with pytest.raises(ImportError):
+        match(IOUS, strategy='hungarian')
+
+
+def make_pairs(ious):
+    ground_truths = [
+        ObjectAnnotation(name="point", value=Point(x=i, y=0))
+        for i in range(ious.shape[0])
+    ]
+    predictions = [
+        ObjectAnnotation(name="point", value=Point(x=j, y=1))
+        for j in range(ious.shape[1])
+    ]
+    return [(ground_truth, prediction, score)
+            for ground_truth, row in zip(ground_truths, ious.tolist())
+            for prediction, score in zip(predictions, row)]
+
+
+def test_match_pairs():
+    pairs = make_pairs(IOUS)
+    matching = match_pairs(pairs)
+    assert len(matching) == 2
+    np.testing.assert_array_equal(matching.ious, IOUS)
+
+    ground_truths, predictions = matching.ground_truths, matching.predictions
+    matching = match_ious(ground_truths, predictions, IOUS, eligible=IOUS > 0)
+    assert matching.matches() == [pairs[0]]
+    assert matching.unmatched_ground_truths == [ground_truths[1]]
+    assert matching.unmatched_predictions == [predictions[1]]
+
+    # Objects without any score are left out
+    matching = match_ious(ground_truths, predictions,
+                          [[0.5, np.nan], [np.nan, np.nan]])
+    assert matching.ground_truths == ground_truths[:1]
+    assert matching.predictions == predictions[:1]
+    np.testing.assert_array_equal(matching.scores, [0.5])
+
+
+def greedy_miou(pairs):
+    # Matching before `labelbox.data.metrics.matching`
+    pairs = sorted(pairs, key=lambda triplet: triplet[2], reverse=True)
+    solution_agreements = []
+    solution_features = set()
+    all_features = set()
+    for ground_truth, prediction, agreement in pairs:
+        all_features.update({id(prediction), id(ground_truth)})
+        if id(prediction) not in solution_features and id(
+                ground_truth) not in solution_features:
+            solution_features.update({id(prediction), id(ground_truth)})
+            solution_agreements.append(agreement)
+    solution_agreements.extend([0.0] *
+                               (len(all_features) - len(solution_features)))
+    return np.mean(solution_agreements)
+
+
+def test_object_pair_matching():
+    rng = np.random.default_rng(0)
+    for shape in [(5, 7), (8, 3), (6, 6)]:
+        # Rounded scores have ties
+        ious = np.round(rng.random(shape) * (rng.random(shape) < 0.4), 1)
+        pairs = make_pairs(ious)
+        assert math.isclose(object_pair_miou(pairs, False), greedy_miou(pairs))
+        tps, fps, _, fns = object_pair_confusion_matrix(pairs, False, 0.5)
+        assert (fps + tps, fns + tps) == (shape[1], shape[0])
+
+    pytest.importorskip("scipy")
+    pairs = make_pairs(IOUS)
+    assert math.isclose(object_pair_miou(pairs, False), 0.45)
+    assert math.isclose(object_pair_miou(pairs, False, 'hungarian'), 0.825)
+    assert object_pair_confusion_matrix(pairs, False, 0.5) == [1, 1, 0, 1]
+    assert object_pair_confusion_matrix(pairs, False, 0.5,
+                                        'hungarian') == [2, 0, 0, 0]
+
+
+def test_hungarian_metrics():
+    pytest.importorskip("scipy")
+    ground_truths = [
+        ObjectAnnotation(name="box",
+                         value=Rectangle(start=Point(x=x, y=0),
+                                         end=Point(x=x + 10, y=10)))
+        for x in [0, 8]
+    ]
+    predictions = [
+        ObjectAnnotation(name="box",
+                         value=Rectangle(start=Point(x=x, y=0),
+                                         end=Point(x=x + 10, y=10)))
+        for x in [3, -4]
+    ]
+    # Greedy matches the closest pair first and leaves the others without overlap
+    assert miou_metric(ground_truths, predictions)[0].value < miou_metric(
+        ground_truths, predictions, matching='hungarian')[0].value
+    greedy, = confusion_matrix_metric(ground_truths, predictions, iou=0.3)
+    hungarian, = confusion_matrix_metric(ground_truths,
+                                         predictions,
+                                         iou=0.3,
+                                         matching='hungarian')
+    assert greedy.value == (1, 1, 0, 1)
+    assert hungarian.value == (2, 0, 0, 0)
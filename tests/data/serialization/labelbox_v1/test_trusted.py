@@ -0,0 +1,59 @@
+import json
+
+import pytest
+
+from labelbox.data.annotation_types import ImageData
+from labelbox.data.serialization.labelbox_v1.classification import LBV1Dropdown
+from labelbox.data.serialization.labelbox_v1.converter import LBV1Converter
+
+
+def load(file_path):
+    with open(file_path, 'r') as file:
+        payload = json.load(file)
+    return payload if isinstance(payload, list) else [payload]
+
+
+@pytest.mark.parametrize("file_path", [
+    'tests/data/assets/labelbox_v1/highly_nested_image.json',
+    'tests/data/assets/labelbox_v1/image_export.json',
+    'tests/data/assets/labelbox_v1/text_export.json',
+    'tests/data/assets/labelbox_v1/tiled_image_export.json',
+    'tests/data/assets/labelbox_v1/video_export.json',
+])
+def test_trusted_matches_validated(file_path):
+    payload = load(file_path)
+    expected = LBV1Converter.deserialize(payload).as_list()
+    labels = LBV1Converter.deserialize(payload, trusted=True).as_list()
+
+    assert list(labels) == list(expected)
+    for label, expected_label in zip(labels, expected):
+        assert label.data == expected_label.data
+        assert label.extra == expected_label.extra
+    assert list(LBV1Converter.serialize(labels)) == list(
+        LBV1Converter.serialize(expected))
+
+
+def test_trusted_media_type():
+    payload = load(
+        'tests/data/assets/labelbox_v1/unkown_media_type_export.json')
+    assert list(LBV1Converter.deserialize(payload, trusted=True)) == list(
+        LBV1Converter.deserialize(payload))
+
+    for row in payload:
+        row['media_type'] = 'image'
+    labels = list(LBV1Converter.deserialize(payload, trusted=True))
+    assert labels == list(LBV1Converter.deserialize(payload))
+    assert all(isinstance(label.data, ImageData) for label in labels)
+
+
+def test_trusted_dropdown():
+    classification = {
+        'answer': [{
+            'schemaId': 'ckrb1sfl8099g0y91cxbd5ftb',
+            'featureId': 'ckrb1sfl8099g0y91cxbd5ftc',
+            'title': 'option'
+        }]
+    }
+    dropdown = LBV1Dropdown.trusted_to_common(classification)
+    assert dropdown == LBV1Dropdown(**classification).to_common()
+    assert dropdown.answer[0].extra['value'] == 'option'
@@ -0,0 +1,24 @@
+import json
+
+import pytest
+
+from labelbox.data.serialization.ndjson.converter import NDJsonConverter
+
+
+@pytest.mark.parametrize("file_path", [
+    'tests/data/assets/ndjson/classification_import.json',
+    'tests/data/assets/ndjson/image_import.json',
+    'tests/data/assets/ndjson/metric_import.json',
+    'tests/data/assets/ndjson/nested_import.json',
+    'tests/data/assets/ndjson/text_import.json',
+    'tests/data/assets/ndjson/video_import.json',
+])
+def test_trusted_matches_validated(file_path):
+    with open(file_path, 'r') as file:
+        data = json.load(file)
+
+    expected = NDJsonConverter.deserialize(data).as_list()
+    labels = NDJsonConverter.deserialize(data, trusted=True).as_list()
+    assert list(labels) == list(expected)
+    assert list(NDJsonConverter.serialize(labels)) == list(
+        NDJsonConverter.serialize(expected))
@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from labelbox import Ontology, OntologyBuilder, Tool, Classification, Option
+from labelbox.data.annotation_types import (ClassificationAnnotation,
+                                            ClassificationAnswer, ImageData,
+                                            Label, LabelList, ObjectAnnotation,
+                                            Point, Radio)
+from labelbox.data.ontology import OntologyIndex, get_feature_schema_lookup
+from labelbox.schema.bulk_import_request import (_get_project_mal_schemas,
+                                                 get_mal_schemas)
+
+
+@pytest.fixture
+def ontology_builder():
+    return OntologyBuilder(tools=[
+        Tool(Tool.Type.POINT,
+             name="point",
+             feature_schema_id="point_id",
+             classifications=[
+                 Classification(class_type=Classification.Type.RADIO,
+                                instructions="nested",
+                                feature_schema_id="nested_id",
+                                options=[
+                                    Option(value="nested_option",
+                                           feature_schema_id="nested_option_id")
+                                ])
+             ])
+    ],
+                           classifications=[
+                               Classification(
+                                   class_type=Classification.Type.RADIO,
+                                   instructions="global",
+                                   feature_schema_id="global_id",
+                                   options=[
+                                       Option(
+                                           value="global_option",
+                                           feature_schema_id="global_option_id")
+                                   ])
+                           ])
+
+
+def test_ontology_index(ontology_builder):
+    index = OntologyIndex.from_ontology_builder(ontology_builder)
+    assert dict(index.tools) == {"point": "point_id"}
+    assert dict(index.classifications) == {
+        "nested": "nested_id",
+        "nested_option": "nested_option_id",
+        "global": "global_id",
+        "global_option": "global_option_id"
+    }
+    assert get_feature_schema_lookup(index) == get_feature_schema_lookup(
+        ontology_builder)
+
+    with pytest.raises(TypeError):
+        index.tools["point"] = "other"
+    with pytest.raises(AttributeError):
+        index.tools = {}
+
+    assert index.mal_schemas["point_id"]["tool"] == "point"
+    assert index.mal_schemas["global_id"]["options"] == ["global_option_id"]
+
+
+def test_ontology_index_is_a_snapshot(ontology_builder):
+    index = OntologyIndex.from_ontology_builder(ontology_builder)
+    ontology_builder.tools[0].feature_schema_id = "other_id"
+    ontology_builder.classifications[0].options[
+        0].feature_schema_id = "other_id"
+    assert dict(index.tools) == {"point": "point_id"}
+    assert index.classifications["global_option"] == "global_option_id"
+    assert "point_id" in index.mal_schemas
+    assert index.mal_schemas["global_id"]["options"] == ["global_option_id"]
+
+
+def test_ontology_index_shared_across_labels(ontology_builder):
+    index = OntologyIndex.from_ontology_builder(ontology_builder)
+    labels = LabelList([
+        Label(data=ImageData(arr=np.ones((8, 8, 3), dtype=np.uint8)),
+              annotations=[
+                  ObjectAnnotation(value=Point(x=1, y=1), name="point"),
+                  ClassificationAnnotation(value=Radio(
+                      answer=ClassificationAnswer(name="global_option")),
+                                           name="global")
+              ]) for _ in range(3)
+    ]).assign_feature_schema_ids(index)
+    for label in labels:
+        assert label.annotations[0].feature_schema_id == "point_id"
+        assert label.annotations[1].feature_schema_id == "global_id"
+        assert label.annotations[
+            1].value.answer.feature_schema_id == "global_option_id"
+
+
+def test_ontology_index_requires_schema_ids():
+    with pytest.raises(ValueError):
+        OntologyIndex.from_ontology_builder(
+            OntologyBuilder(tools=[Tool(Tool.Type.POINT, name="point")]))
+
+
+def test_ontology_index_from_ontology(ontology_builder):
+
+    def make_ontology(updated_at):
+        return Ontology(
+            None, {
+                "id": "ontology_id",
+                "name": "ontology",
+                "description": None,
+                "updatedAt": updated_at,
+                "createdAt": "2021-06-01T00:00:00.000Z",
+                "normalized": ontology_builder.asdict(),
+                "objectSchemaCount": 1,
+                "classificationSchemaCount": 1
+            })
+
+    ontology = make_ontology("2021-06-01T00:00:00.000Z")
+    index = OntologyIndex.from_ontology(ontology)
+    assert index is OntologyIndex.from_ontology(
+        make_ontology("2021-06-01T00:00:00.000Z"))
+    # Updated ontologies are compiled again
+    assert index is not OntologyIndex.from_ontology(
+        make_ontology("2021-06-02T00:00:00.000Z"))
+
+    class Project:
+
+        def ontology(self):
+            return ontology
+
+    assert _get_project_mal_schemas(
+        Project()) == get_mal_schemas(ontology) == index.mal_schemas